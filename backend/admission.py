@@ -0,0 +1,220 @@
+"""
+Admission control for request bodies
+
+Uploads are counted as they arrive. A body over its size limit is cut off
+with 413 as soon as it crosses the limit, or before a byte is read when its
+Content-Length already says so, instead of being spooled in full first.
+The bodies a process is receiving or working on share one byte budget; a
+request that does not fit gets 503. Requests to analysis routes are also
+capped per process, beyond which they get 429. All three answers go out
+before the body is read, so turning load away costs next to nothing.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Methods whose requests carry a body worth limiting
+BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+
+
+class RequestRejected(HTTPException):
+    """Raised while a body is read when it crosses a limit
+
+    An HTTPException, so FastAPI passes it through body parsing and answers
+    with its status instead of a parse error.
+    """
+
+    def __init__(self, reason: str, status_code: int, detail: str,
+                 retry_after: Optional[int] = None):
+        headers = {'Retry-After': str(retry_after)} if retry_after else None
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+        self.reason = reason
+
+
+class ByteBudget:
+    """Bytes that requests in flight may hold between them
+
+    Only used from the event loop, so it needs no lock. A request larger
+    than the whole budget is let in when nothing else holds any of it.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self.peak = 0
+
+    def acquire(self, size: int) -> Optional[int]:
+        """Take size bytes, capped at the limit; None when they do not fit"""
+        size = min(size, self.limit)
+        if self.in_use + size > self.limit:
+            return None
+        self.in_use += size
+        self.peak = max(self.peak, self.in_use)
+        return size
+
+    def release(self, size: int) -> None:
+        """Give back bytes taken by acquire()"""
+        self.in_use -= size
+
+
+class Admission:
+    """Limits shared by every request a process serves
+
+    max_body_size applies to any request whose path has no entry in
+    body_size_limits (path prefix -> bytes). max_inflight_bytes (0 = no
+    budget) bounds the bodies held at once; max_concurrent (0 = no limit)
+    bounds requests in flight to paths starting with one of
+    concurrency_paths.
+    """
+
+    def __init__(self, max_body_size: int, body_size_limits: Sequence[Tuple[str, int]] = (),
+                 max_inflight_bytes: int = 0, max_concurrent: int = 0,
+                 concurrency_paths: Sequence[str] = ()):
+        self.max_body_size = max_body_size
+        # Longest prefixes first, so /analyze/batch wins over /analyze
+        self.body_size_limits = sorted(body_size_limits, key=lambda item: len(item[0]), reverse=True)
+        self.budget = ByteBudget(max_inflight_bytes) if max_inflight_bytes else None
+        self.max_concurrent = max_concurrent
+        self.concurrency_paths = tuple(concurrency_paths)
+        self.active = 0
+        self.rejected: Dict[str, int] = {'body_too_large': 0, 'busy': 0, 'memory': 0}
+
+    def body_limit(self, path: str) -> int:
+        """Largest body accepted for a path"""
+        for prefix, size in self.body_size_limits:
+            if path.startswith(prefix):
+                return size
+        return self.max_body_size
+
+    def too_large(self, limit: int) -> RequestRejected:
+        """413 for a body over limit bytes"""
+        self.rejected['body_too_large'] += 1
+        return RequestRejected('body_too_large', 413,
+                               f"Request is too large. Maximum size is {limit // (1024 * 1024)}MB.")
+
+    def busy(self) -> RequestRejected:
+        """429 for an analysis request over the concurrency cap"""
+        self.rejected['busy'] += 1
+        return RequestRejected('busy', 429,
+                               "Too many analyses in progress. Please try again shortly.",
+                               retry_after=1)
+
+    def out_of_memory(self) -> RequestRejected:
+        """503 for a body that does not fit in the byte budget"""
+        self.rejected['memory'] += 1
+        return RequestRejected('memory', 503,
+                               "Server is busy receiving other uploads. Please try again shortly.",
+                               retry_after=1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests and bytes in flight, limits and rejections by reason"""
+        return {
+            'active': self.active,
+            'max_concurrent': self.max_concurrent,
+            'inflight_bytes': self.budget.in_use if self.budget else 0,
+            'peak_inflight_bytes': self.budget.peak if self.budget else 0,
+            'max_inflight_bytes': self.budget.limit if self.budget else 0,
+            'rejected': dict(self.rejected),
+        }
+
+
+def _content_length(scope: Scope) -> Optional[int]:
+    """The request's declared body size, if it sent a valid one"""
+    for name, value in scope['headers']:
+        if name == b'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class AdmissionMiddleware:
+    """ASGI middleware enforcing an Admission's limits on request bodies"""
+
+    def __init__(self, app: ASGIApp, admission: Admission):
+        self.app = app
+        self.admission = admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] not in BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        admission = self.admission
+        budget = admission.budget
+        path = scope['path']
+        limit = admission.body_limit(path)
+        declared = _content_length(scope)
+        counted = bool(admission.max_concurrent) and path.startswith(admission.concurrency_paths)
+
+        # Checks that need no body are answered before any of it is read
+        rejection = None
+        reserved = 0
+        if declared is not None and declared > limit:
+            rejection = admission.too_large(limit)
+        elif counted and admission.active >= admission.max_concurrent:
+            rejection = admission.busy()
+        elif budget is not None and declared:
+            granted = budget.acquire(declared)
+            if granted is None:
+                rejection = admission.out_of_memory()
+            else:
+                reserved = granted
+        if rejection is not None:
+            await self._reject(rejection, scope, receive, send)
+            return
+
+        received = 0
+        # Bytes the budget has been asked for; more than reserved when the
+        # grant was capped at the budget's limit
+        covered = declared or 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            # Count the body as it arrives; a missing or false
+            # Content-Length takes budget chunk by chunk
+            nonlocal received, covered, reserved
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > limit:
+                    raise admission.too_large(limit)
+                if budget is not None and received > covered:
+                    granted = budget.acquire(received - covered)
+                    if granted is None:
+                        raise admission.out_of_memory()
+                    covered = received
+                    reserved += granted
+            return message
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_started
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
+
+        if counted:
+            admission.active += 1
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except RequestRejected as e:
+            # Apps that do not turn the exception into a response themselves
+            if response_started:
+                raise
+            await self._reject(e, scope, receive, send)
+        finally:
+            if counted:
+                admission.active -= 1
+            if budget is not None:
+                budget.release(reserved)
+
+    @staticmethod
+    async def _reject(rejection: RequestRejected, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer with the rejection's status without reading the body"""
+        response = JSONResponse({'detail': rejection.detail}, status_code=rejection.status_code,
+                                headers=rejection.headers)
+        await response(scope, receive, send)
@@ -3,106 +3,279 @@ ATS Resume Scoring Engine
 Analyzes resumes against job descriptions and provides ATS compatibility scores
 """
 
-import re
-from typing import Dict, List, Tuple
-from PyPDF2 import PdfReader
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import repeat
+from typing import BinaryIO, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
+import hashlib
 import io
+import time
+
+from cache import LRUCache, text_key
+from document import Document, as_document
+from metrics import StageTimer
+from pdf_backends import get_backends
+from resume_formats import DOCX, PDF, decode_text, detect_format, docx_text
+from skill_matcher import SkillMatcher
+from taxonomy import DEFAULT_RESOURCES, DEFAULT_TAXONOMY_PATH, SkillTaxonomy, load_taxonomy
+
+# Bump whenever scoring logic changes so cached results are invalidated
+SCORER_VERSION = "1"
+
+# PDF backends tried in order until one returns text
+DEFAULT_PDF_BACKENDS = ('pymupdf', 'pypdf2', 'pypdf', 'pdfminer')
+
+# Section headings looked for in every resume
+COMMON_SECTIONS = [
+    'experience', 'education', 'skills', 'summary', 
+    'objective', 'certifications', 'projects', 'achievements'
+]
+
+# Sections every resume should have; they weigh most in the structure score
+ESSENTIAL_SECTIONS = ('experience', 'education', 'skills')
+
+# Words too common to count as keywords
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
+
+@dataclass(frozen=True)
+class JobProfile:
+    """Job description preprocessed once and reused for every resume"""
+    keywords: List[str]
+    keyword_set: FrozenSet[str]
+    skills: Dict[str, List[str]]
+    text: str = ''
+
+
+@dataclass
+class ResumeFeatures:
+    """Resume side of an analysis, computed once and reusable for any job"""
+    text: str
+    keywords: List[str]
+    sections_found: Dict[str, bool]
+    formatting_issues: List[str]
+    skills: Dict[str, List[str]]
+    # Version of the taxonomy the skills were matched with, which in a pool
+    # worker may lag behind the web process's
+    taxonomy_version: str = ''
+    
+    def to_dict(self) -> Dict:
+        """JSON-serializable form"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ResumeFeatures":
+        """Rebuild features from to_dict() output"""
+        return cls(**data)
 
 
 class ATSScorer:
     """Main class for ATS resume scoring"""
     
-    def __init__(self):
-        self.common_sections = [
-            'experience', 'education', 'skills', 'summary', 
-            'objective', 'certifications', 'projects', 'achievements'
-        ]
-        
-        # Technical skills database
-        self.technical_skills = {
-            'programming_languages': [
-                'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift',
-                'kotlin', 'go', 'rust', 'typescript', 'scala', 'r', 'matlab', 'perl'
-            ],
-            'frameworks': [
-                'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
-                'express', 'node.js', 'nodejs', '.net', 'laravel', 'rails', 'nextjs',
-                'nuxt', 'svelte', 'ember', 'backbone'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-                'oracle', 'sql server', 'sqlite', 'dynamodb', 'mariadb', 'couchdb'
-            ],
-            'cloud_devops': [
-                'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins',
-                'gitlab', 'github actions', 'terraform', 'ansible', 'ci/cd', 'devops'
-            ],
-            'tools': [
-                'git', 'jira', 'confluence', 'slack', 'vscode', 'intellij', 'eclipse',
-                'postman', 'swagger', 'figma', 'sketch', 'adobe xd'
-            ],
-            'testing': [
-                'jest', 'pytest', 'junit', 'selenium', 'cypress', 'mocha', 'chai',
-                'testing', 'unit testing', 'integration testing', 'tdd', 'bdd'
-            ]
-        }
-        
-        # Soft skills database
-        self.soft_skills = {
-            'leadership': [
-                'leadership', 'team lead', 'mentoring', 'coaching', 'management',
-                'project management', 'people management'
-            ],
-            'communication': [
-                'communication', 'presentation', 'public speaking', 'writing',
-                'documentation', 'collaboration', 'interpersonal'
-            ],
-            'problem_solving': [
-                'problem solving', 'analytical', 'critical thinking', 'troubleshooting',
-                'debugging', 'research'
-            ],
-            'teamwork': [
-                'teamwork', 'team player', 'collaboration', 'cross-functional',
-                'agile', 'scrum', 'kanban'
-            ],
-            'adaptability': [
-                'adaptability', 'flexibility', 'learning', 'quick learner',
-                'self-motivated', 'proactive'
-            ]
-        }
+    def __init__(self, job_cache_size: int = 256, job_cache_ttl: float = 3600,
+                 pdf_max_pages: int = 50, pdf_max_chars: int = 200_000,
+                 pdf_time_budget: float = 10.0,
+                 pdf_backends: Sequence[str] = DEFAULT_PDF_BACKENDS,
+                 semantic_model: Optional[str] = None, semantic_weight: float = 0.3,
+                 semantic_store: Optional[str] = None,
+                 taxonomy_path: str = DEFAULT_TAXONOMY_PATH,
+                 taxonomy_check_interval: float = 5.0):
+        self.common_sections = COMMON_SECTIONS
+        
+        # Skill taxonomy, compiled once per process and shared by every
+        # scorer; the file is re-checked every taxonomy_check_interval
+        # seconds (0 disables) and swapped in when it changed
+        self.taxonomy_path = taxonomy_path
+        self.taxonomy_check_interval = taxonomy_check_interval
+        self._taxonomy = load_taxonomy(taxonomy_path)
+        self._taxonomy_checked = time.monotonic()
+        
+        # Compiled job profiles keyed by normalized job description hash
+        self.job_profile_cache = LRUCache(maxsize=job_cache_size, ttl=job_cache_ttl)
+        
+        # Extraction limits so huge or hostile PDFs cannot pin a worker
+        # (0 disables a limit)
+        self.pdf_max_pages = pdf_max_pages
+        self.pdf_max_chars = pdf_max_chars
+        self.pdf_time_budget = pdf_time_budget
+        
+        # Installed PDF backends, in fallback order
+        self.pdf_backends = get_backends(pdf_backends)
+        
+        # Optional embedding similarity blended into overall_score; the
+        # model itself is only loaded when the first resume is scored
+        self.semantic = None
+        self.semantic_weight = semantic_weight
+        if semantic_model:
+            from semantic import SemanticScorer
+            self.semantic = SemanticScorer(semantic_model, store_path=semantic_store)
+    
+    @property
+    def taxonomy(self) -> SkillTaxonomy:
+        """The current skill taxonomy, reloaded if its file changed"""
+        if self.taxonomy_check_interval:
+            now = time.monotonic()
+            if now - self._taxonomy_checked >= self.taxonomy_check_interval:
+                self._taxonomy_checked = now
+                self._taxonomy = load_taxonomy(self.taxonomy_path)
+        return self._taxonomy
+    
+    def reload_taxonomy(self) -> SkillTaxonomy:
+        """Recompile the taxonomy file now, e.g. from an admin request"""
+        self._taxonomy = load_taxonomy(self.taxonomy_path, force=True)
+        self._taxonomy_checked = time.monotonic()
+        return self._taxonomy
+    
+    @property
+    def technical_skills(self) -> Dict[str, List[str]]:
+        """Technical skill categories of the current taxonomy"""
+        return self.taxonomy.technical_skills
+    
+    @property
+    def soft_skills(self) -> Dict[str, List[str]]:
+        """Soft skill categories of the current taxonomy"""
+        return self.taxonomy.soft_skills
+    
+    @property
+    def skill_matcher(self) -> SkillMatcher:
+        """One index over all skills and aliases, so each text is scanned once"""
+        return self.taxonomy.matcher
+    
+    @property
+    def config_version(self) -> str:
+        """Identifies the scoring logic and settings that shape a result"""
+        return self.config_version_for(self.taxonomy.version)
+    
+    def config_version_for(self, taxonomy_version: str) -> str:
+        """config_version for results scored with the given taxonomy"""
+        settings = (
+            SCORER_VERSION, taxonomy_version, self.pdf_max_pages, self.pdf_max_chars,
+            [backend.name for backend in self.pdf_backends],
+            (self.semantic.model_name, self.semantic.max_segments) if self.semantic else None,
+            self.semantic_weight
+        )
+        return hashlib.sha256(repr(settings).encode()).hexdigest()[:16]
+    
+    @property
+    def features_version(self) -> str:
+        """Identifies the logic and skill data that shape ResumeFeatures"""
+        return self.features_version_for(self.taxonomy.version)
     
-    def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
-        """Extract text content from PDF file"""
+    def features_version_for(self, taxonomy_version: str) -> str:
+        """features_version for features matched with the given taxonomy"""
+        settings = (SCORER_VERSION, taxonomy_version)
+        return hashlib.sha256(repr(settings).encode()).hexdigest()[:16]
+    
+    def warm_up(self) -> Optional[str]:
+        """Import the preferred PDF library before the first resume arrives"""
+        if not self.pdf_backends:
+            return None
+        backend = self.pdf_backends[0]
+        backend.preload()
+        return backend.name
+    
+    def extract_text(self, resume: Union[bytes, BinaryIO],
+                     timer: Optional[StageTimer] = None) -> str:
+        """Extract text from a PDF, DOCX or plain-text resume
+        
+        The format is detected from the content, not the filename. DOCX and
+        text are read directly without any PDF parsing; every format is cut
+        at pdf_max_chars. A timer, if given, gets the format and a
+        <format>_extraction stage.
+        """
+        if timer is None:
+            timer = StageTimer()
+        resume_file = io.BytesIO(resume) if isinstance(resume, (bytes, bytearray)) else resume
+        file_format = detect_format(resume_file)
+        timer.set('format', file_format)
+        
+        with timer.stage(f'{file_format}_extraction'):
+            if file_format == PDF:
+                return self.extract_text_from_pdf(resume_file, timer)
+            if file_format == DOCX:
+                text = docx_text(resume_file)
+            else:
+                text = decode_text(resume_file.read())
+        
+        if self.pdf_max_chars:
+            text = text[:self.pdf_max_chars]
+        return text.strip()
+    
+    def extract_text_from_pdf(self, pdf: Union[bytes, BinaryIO],
+                              timer: Optional[StageTimer] = None) -> str:
+        """Extract text content from PDF file
+        
+        Accepts raw bytes or a seekable binary file, such as an upload's
+        spooled temp file, which is read in place. Backends are tried in
+        order until one returns text. Extraction stops after pdf_max_pages
+        pages, pdf_max_chars characters or pdf_time_budget seconds, whichever
+        comes first; the time budget covers all backends tried. A timer,
+        if given, gets the backend used and the pages read.
+        """
+        pdf_file = io.BytesIO(pdf) if isinstance(pdf, (bytes, bytearray)) else pdf
+        start_position = pdf_file.tell()
+        deadline = time.monotonic() + self.pdf_time_budget if self.pdf_time_budget else None
+        
+        # Fall back to the next backend when one fails or finds no text
+        errors = []
+        extracted_empty = False
+        for backend in self.pdf_backends:
+            try:
+                pdf_file.seek(start_position)
+                text = self._join_pages(backend.iter_pages(pdf_file), deadline, timer)
+            except Exception as e:
+                errors.append(f"{backend.name}: {str(e)}")
+                continue
+            if text:
+                if timer is not None:
+                    timer.set('pdf_backend', backend.name)
+                return text
+            extracted_empty = True
+        
+        if not self.pdf_backends:
+            raise ValueError("Error extracting text from PDF: no PDF backend is installed")
+        if errors and not extracted_empty:
+            raise ValueError(f"Error extracting text from PDF: {'; '.join(errors)}")
+        return ""
+    
+    def _join_pages(self, pages: Iterator[str], deadline: Optional[float],
+                    timer: Optional[StageTimer] = None) -> str:
+        """Join page texts, stopping at the page, character and time limits"""
+        page_texts = []
+        total_chars = 0
         try:
-            pdf_file = io.BytesIO(pdf_bytes)
-            reader = PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
-        except Exception as e:
-            raise ValueError(f"Error extracting text from PDF: {str(e)}")
-    
-    def extract_keywords(self, text: str) -> List[str]:
-        """Extract meaningful keywords from text"""
-        # Convert to lowercase and remove special characters
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Split into words
-        words = text.split()
-        
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
-            'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-        }
+            for page_number, page_text in enumerate(pages):
+                page_texts.append(page_text)
+                total_chars += len(page_text) + 1
+                if self.pdf_max_pages and page_number + 1 >= self.pdf_max_pages:
+                    break
+                if self.pdf_max_chars and total_chars >= self.pdf_max_chars:
+                    break
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+        finally:
+            pages.close()
+        if timer is not None:
+            timer.set('pdf_pages', len(page_texts))
+        
+        text = "\n".join(page_texts)
+        if self.pdf_max_chars:
+            text = text[:self.pdf_max_chars]
+        return text.strip()
+    
+    def extract_keywords(self, text: Union[str, Document]) -> List[str]:
+        """Extract meaningful keywords from text or a tokenized Document"""
+        # Words of the lowercased text, split on anything but word characters
+        words = as_document(text).words
         
         # Filter out stop words and short words
-        keywords = [word for word in words if word not in stop_words and len(word) > 2]
+        keywords = [word for word in words if len(word) > 2 and word not in STOP_WORDS]
         
         return keywords
     
@@ -110,7 +283,7 @@ class ATSScorer:
                                job_keywords: List[str]) -> Tuple[float, List[str], List[str]]:
         """Calculate keyword match percentage"""
         resume_set = set(resume_keywords)
-        job_set = set(job_keywords)
+        job_set = job_keywords if isinstance(job_keywords, frozenset) else set(job_keywords)
         
         matched_keywords = list(resume_set.intersection(job_set))
         missing_keywords = list(job_set - resume_set)
@@ -122,47 +295,48 @@ class ATSScorer:
         
         return match_percentage, matched_keywords, missing_keywords
     
-    def check_resume_structure(self, resume_text: str) -> Dict[str, bool]:
+    def check_resume_structure(self, resume_text: Union[str, Document]) -> Dict[str, bool]:
         """Check if resume has proper ATS-friendly structure"""
-        resume_lower = resume_text.lower()
-        
-        sections_found = {}
-        for section in self.common_sections:
-            # Check if section heading exists
-            sections_found[section] = bool(re.search(rf'\b{section}\b', resume_lower))
+        # Section headings are single words, so a heading is present when
+        # it is one of the resume's words
+        words = as_document(resume_text).word_set
         
-        return sections_found
+        return {section: section in words for section in self.common_sections}
     
     def calculate_structure_score(self, sections_found: Dict[str, bool]) -> float:
         """Calculate structure score based on sections present"""
-        essential_sections = ['experience', 'education', 'skills']
-        essential_found = sum(1 for section in essential_sections if sections_found.get(section, False))
+        essential_found = sum(1 for section in ESSENTIAL_SECTIONS if sections_found.get(section, False))
         
         total_found = sum(sections_found.values())
         
         # Essential sections are worth more
-        essential_score = (essential_found / len(essential_sections)) * 60
+        essential_score = (essential_found / len(ESSENTIAL_SECTIONS)) * 60
         additional_score = (total_found / len(self.common_sections)) * 40
         
         return essential_score + additional_score
     
-    def check_formatting_issues(self, resume_text: str) -> List[str]:
+    def check_formatting_issues(self, resume_text: Union[str, Document]) -> List[str]:
         """Check for common ATS formatting issues"""
+        document = as_document(resume_text)
+        return self.formatting_issues_from_counts(
+            document.table_markers, document.special_chars, document.short_lines
+        )
+    
+    def formatting_issues_from_counts(self, table_markers: bool, special_chars: int,
+                                      short_lines: int) -> List[str]:
+        """Formatting issues from a text's table markers and character/line counts"""
         issues = []
         
         # Check for tables (difficult for ATS to parse)
-        if '|' in resume_text or '\t\t' in resume_text:
+        if table_markers:
             issues.append("Possible table formatting detected - may not be ATS-friendly")
         
         # Check for special characters
-        special_chars = re.findall(r'[^\w\s\-.,@()\[\]\/]', resume_text)
-        if len(special_chars) > 20:
+        if special_chars > 20:
             issues.append("Excessive special characters detected")
         
         # Check for very short lines (possible formatting issues)
-        lines = resume_text.split('\n')
-        very_short_lines = [line for line in lines if 0 < len(line.strip()) < 3]
-        if len(very_short_lines) > 10:
+        if short_lines > 10:
             issues.append("Many very short lines detected - check formatting")
         
         return issues
@@ -185,8 +359,7 @@ class ATSScorer:
             recommendations.append(f"✅ Excellent keyword match ({keyword_match:.1f}%)!")
         
         # Structure recommendations
-        essential_sections = ['experience', 'education', 'skills']
-        missing_essential = [s for s in essential_sections if not sections_found.get(s, False)]
+        missing_essential = [s for s in ESSENTIAL_SECTIONS if not sections_found.get(s, False)]
         
         if missing_essential:
             recommendations.append(f"⚠️ Missing essential sections: {', '.join(missing_essential).title()}")
@@ -208,41 +381,36 @@ class ATSScorer:
     
     def extract_skills_from_text(self, text: str, skill_database: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """Extract skills from text based on skill database"""
-        text_lower = text.lower()
-        found_skills = {}
-        
-        for category, skills_list in skill_database.items():
-            found_in_category = []
-            for skill in skills_list:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_in_category.append(skill)
-            
-            if found_in_category:
-                found_skills[category] = found_in_category
+        taxonomy = self.taxonomy
+        if skill_database is taxonomy.technical_skills or skill_database is taxonomy.soft_skills:
+            found_skills = taxonomy.matcher.match(text)
+            return {category: skills for category, skills in found_skills.items()
+                    if category in skill_database}
         
-        return found_skills
+        return SkillMatcher(skill_database).match(text)
     
     def analyze_skill_gaps(self, resume_text: str, job_description: str) -> Dict:
         """Analyze skill gaps between resume and job description"""
-        # Extract technical skills
-        resume_tech_skills = self.extract_skills_from_text(resume_text, self.technical_skills)
-        job_tech_skills = self.extract_skills_from_text(job_description, self.technical_skills)
-        
-        # Extract soft skills
-        resume_soft_skills = self.extract_skills_from_text(resume_text, self.soft_skills)
-        job_soft_skills = self.extract_skills_from_text(job_description, self.soft_skills)
+        # Extract technical and soft skills in one pass over each text
+        matcher = self.skill_matcher
+        resume_skills = matcher.match(resume_text)
+        job_skills = matcher.match(job_description)
         
+        return self.compare_skills(resume_skills, job_skills)
+    
+    def compare_skills(self, resume_skills: Dict[str, List[str]],
+                       job_skills: Dict[str, List[str]]) -> Dict:
+        """Compare skills found in a resume with skills a job requires"""
         # Calculate gaps by category
         skills_by_category = {}
         total_required = 0
         total_matched = 0
+        taxonomy = self.taxonomy
         
         # Process technical skills
-        for category in self.technical_skills.keys():
-            resume_skills_set = set(resume_tech_skills.get(category, []))
-            job_skills_set = set(job_tech_skills.get(category, []))
+        for category in taxonomy.technical_skills.keys():
+            resume_skills_set = set(resume_skills.get(category, []))
+            job_skills_set = set(job_skills.get(category, []))
             
             if job_skills_set:  # Only include if job requires skills in this category
                 matched = list(resume_skills_set.intersection(job_skills_set))
@@ -258,9 +426,9 @@ class ATSScorer:
                 total_matched += len(matched)
         
         # Process soft skills
-        for category in self.soft_skills.keys():
-            resume_skills_set = set(resume_soft_skills.get(category, []))
-            job_skills_set = set(job_soft_skills.get(category, []))
+        for category in taxonomy.soft_skills.keys():
+            resume_skills_set = set(resume_skills.get(category, []))
+            job_skills_set = set(job_skills.get(category, []))
             
             if job_skills_set:
                 matched = list(resume_skills_set.intersection(job_skills_set))
@@ -279,7 +447,7 @@ class ATSScorer:
         skill_match_percentage = (total_matched / total_required * 100) if total_required > 0 else 0
         
         # Generate learning recommendations
-        learning_recommendations = self.generate_learning_recommendations(skills_by_category)
+        learning_recommendations = self.generate_learning_recommendations(skills_by_category, taxonomy)
         
         return {
             'total_skills_required': total_required,
@@ -290,39 +458,16 @@ class ATSScorer:
             'learning_recommendations': learning_recommendations
         }
     
-    def generate_learning_recommendations(self, skills_by_category: Dict) -> List[Dict]:
+    def generate_learning_recommendations(self, skills_by_category: Dict,
+                                          taxonomy: Optional[SkillTaxonomy] = None) -> List[Dict]:
         """Generate learning recommendations for missing skills"""
         recommendations = []
         
-        # Priority mapping
-        priority_categories = {
-            'programming_languages': 'High',
-            'frameworks': 'High',
-            'cloud_devops': 'High',
-            'databases': 'Medium',
-            'testing': 'Medium',
-            'tools': 'Low',
-            'leadership': 'High',
-            'communication': 'Medium',
-            'problem_solving': 'High',
-            'teamwork': 'Medium',
-            'adaptability': 'Low'
-        }
-        
-        # Learning resources mapping
-        resource_mapping = {
-            'programming_languages': ['Official Documentation', 'Codecademy', 'freeCodeCamp', 'LeetCode'],
-            'frameworks': ['Official Docs', 'YouTube Tutorials', 'Udemy Courses', 'Framework-specific Bootcamps'],
-            'cloud_devops': ['AWS/Azure/GCP Certifications', 'Docker Documentation', 'Kubernetes Tutorials'],
-            'databases': ['Database Documentation', 'SQL Practice Sites', 'Database Design Courses'],
-            'testing': ['Testing Framework Docs', 'Test Automation Courses', 'TDD/BDD Tutorials'],
-            'tools': ['Tool Documentation', 'YouTube Tutorials', 'Quick Start Guides'],
-            'leadership': ['Leadership Books', 'Management Courses', 'Mentorship Programs'],
-            'communication': ['Public Speaking Courses', 'Writing Workshops', 'Toastmasters'],
-            'problem_solving': ['Algorithm Practice', 'Case Study Analysis', 'Critical Thinking Courses'],
-            'teamwork': ['Agile/Scrum Certifications', 'Team Collaboration Workshops'],
-            'adaptability': ['Online Courses', 'Self-Learning Resources', 'Professional Development']
-        }
+        # Priorities and learning resources per category come from the taxonomy
+        if taxonomy is None:
+            taxonomy = self.taxonomy
+        priority_categories = taxonomy.priorities
+        resource_mapping = taxonomy.resources
         
         for category, skills_data in skills_by_category.items():
             missing_skills = skills_data.get('missing', [])
@@ -334,7 +479,7 @@ class ATSScorer:
                     'category': category.replace('_', ' ').title(),
                     'type': skill_type,
                     'priority': priority_categories.get(category, 'Medium'),
-                    'resources': resource_mapping.get(category, ['Online Courses', 'Documentation'])
+                    'resources': list(resource_mapping.get(category, DEFAULT_RESOURCES))
                 })
         
         # Sort by priority (High -> Medium -> Low)
@@ -343,61 +488,283 @@ class ATSScorer:
         
         return recommendations[:10]  # Return top 10 recommendations
     
-    def analyze_resume(self, resume_bytes: bytes, job_description: str) -> Dict:
-        """Main method to analyze resume against job description"""
-        try:
-            # Extract text from PDF
-            resume_text = self.extract_text_from_pdf(resume_bytes)
-            
-            if not resume_text:
+    def compile_job_profile(self, job_description: str) -> JobProfile:
+        """Preprocess a job description into its keywords and required skills"""
+        document = Document(job_description)
+        job_keywords = self.extract_keywords(document)
+        return JobProfile(
+            keywords=job_keywords,
+            keyword_set=frozenset(job_keywords),
+            skills=self.skill_matcher.match_segments(document.segments),
+            text=job_description
+        )
+    
+    def get_job_profile(self, job_description: str) -> JobProfile:
+        """Return the compiled profile for a job description, using the cache"""
+        # Profiles compiled with an older taxonomy are never reused
+        key = f"{self.taxonomy.version}:{text_key(job_description)}"
+        job_profile = self.job_profile_cache.get(key)
+        if job_profile is None:
+            job_profile = self.compile_job_profile(job_description)
+            self.job_profile_cache.set(key, job_profile)
+        return job_profile
+    
+    def extract_resume_features(self, resume_text: str,
+                                timer: Optional[StageTimer] = None) -> ResumeFeatures:
+        """Compute everything about a resume that does not depend on the job
+        
+        The text is lowercased and tokenized once; every check reads the
+        same Document.
+        """
+        if timer is None:
+            timer = StageTimer()
+        timer.set('text_chars', len(resume_text))
+        # One taxonomy throughout, even if the file changes meanwhile
+        taxonomy = self.taxonomy
+        
+        with timer.stage('tokenize'):
+            document = Document(resume_text)
+        with timer.stage('keywords'):
+            keywords = list(dict.fromkeys(self.extract_keywords(document)))
+        with timer.stage('structure'):
+            sections_found = self.check_resume_structure(document)
+        with timer.stage('formatting'):
+            formatting_issues = self.check_formatting_issues(document)
+        with timer.stage('skills'):
+            skills = taxonomy.matcher.match_segments(document.segments)
+        
+        return ResumeFeatures(
+            text=resume_text,
+            keywords=keywords,
+            sections_found=sections_found,
+            formatting_issues=formatting_issues,
+            skills=skills,
+            taxonomy_version=taxonomy.version
+        )
+    
+    def extract_features(self, resume_bytes: Union[bytes, BinaryIO],
+                         timer: Optional[StageTimer] = None) -> ResumeFeatures:
+        """Extract text from a resume file (PDF, DOCX or TXT) and compute its features"""
+        if timer is None:
+            timer = StageTimer()
+        resume_text = self.extract_text(resume_bytes, timer)
+        
+        if not resume_text:
+            if timer.values.get('format') == PDF:
                 raise ValueError("Could not extract text from PDF. Please ensure it's a text-based PDF.")
-            
-            # Extract keywords
-            resume_keywords = self.extract_keywords(resume_text)
-            job_keywords = self.extract_keywords(job_description)
-            
+            raise ValueError("Could not find any text in the resume.")
+        
+        return self.extract_resume_features(resume_text, timer)
+    
+    def score_features(self, features: ResumeFeatures, job_profile: JobProfile,
+                       timer: Optional[StageTimer] = None) -> Dict:
+        """Score precomputed resume features against a compiled job profile"""
+        if timer is None:
+            timer = StageTimer()
+        
+        with timer.stage('scoring'):
             # Calculate keyword match
             keyword_match, matched_keywords, missing_keywords = self.calculate_keyword_match(
-                resume_keywords, job_keywords
+                features.keywords, job_profile.keyword_set
             )
-            
+        
+        # Semantic similarity is blended in when enabled
+        semantic_score = None
+        if self.semantic is not None and job_profile.text:
+            with timer.stage('semantic'):
+                semantic_score = self.semantic.score(features.text, job_profile.text)
+        
+        return self.score_matches(
+            keyword_match, matched_keywords, missing_keywords, features.sections_found,
+            features.formatting_issues, features.skills, job_profile, timer, semantic_score
+        )
+    
+    def score_matches(self, keyword_match: float, matched_keywords: List[str],
+                      missing_keywords: List[str], sections_found: Dict[str, bool],
+                      formatting_issues: List[str], resume_skills: Dict[str, List[str]],
+                      job_profile: JobProfile, timer: Optional[StageTimer] = None,
+                      semantic_score: Optional[float] = None) -> Dict:
+        """Build the analysis result from a resume's keyword matches and checks
+        
+        score_features calls this after matching keywords; live sessions
+        call it with matches they keep up to date as the text is edited.
+        """
+        if timer is None:
+            timer = StageTimer()
+        
+        with timer.stage('scoring'):
             # Check structure
-            sections_found = self.check_resume_structure(resume_text)
             structure_score = self.calculate_structure_score(sections_found)
             
-            # Check formatting
-            formatting_issues = self.check_formatting_issues(resume_text)
-            
             # Calculate overall score (weighted average)
             overall_score = (keyword_match * 0.7) + (structure_score * 0.3)
-            
-            # Generate recommendations
+            if semantic_score is not None:
+                overall_score = (overall_score * (1 - self.semantic_weight)
+                                 + semantic_score * self.semantic_weight)
+        
+        # Generate recommendations
+        with timer.stage('recommendations'):
             recommendations = self.generate_recommendations(
                 keyword_match, structure_score, missing_keywords, 
                 sections_found, formatting_issues
             )
+        
+        # Perform skill gap analysis
+        with timer.stage('skill_gaps'):
+            skill_gap_analysis = self.compare_skills(resume_skills, job_profile.skills)
+        
+        result = {
+            "success": True,
+            "overall_score": round(overall_score, 1),
+            "keyword_match_score": round(keyword_match, 1),
+            "structure_score": round(structure_score, 1),
+            "matched_keywords_count": len(matched_keywords),
+            "missing_keywords_count": len(missing_keywords),
+            "sections_found": sections_found,
+            "recommendations": recommendations,
+            "top_matched_keywords": matched_keywords[:10],
+            "top_missing_keywords": missing_keywords[:10],
+            "skill_gap_analysis": skill_gap_analysis
+        }
+        if semantic_score is not None:
+            result["semantic_score"] = round(semantic_score, 1)
+        return result
+    
+    def analyze_resume(self, resume_bytes: Union[bytes, BinaryIO],
+                       job_description: Union[str, JobProfile]) -> Dict:
+        """Main method to analyze resume against job description
+        
+        resume_bytes may be the file's bytes (PDF, DOCX or TXT) or a
+        seekable binary file;
+        job_description may be raw text or a profile from get_job_profile().
+        """
+        return self.analyze_resume_with_features(resume_bytes, job_description)[0]
+    
+    def analyze_resume_with_features(self, resume_bytes: Union[bytes, BinaryIO],
+                                     job_description: Union[str, JobProfile],
+                                     timer: Optional[StageTimer] = None
+                                     ) -> Tuple[Dict, Optional[ResumeFeatures]]:
+        """Analyze a resume and also return its features for reuse
+        
+        Features are None when the resume could not be analyzed. A timer,
+        if given, collects per-stage durations and sizes.
+        """
+        if timer is None:
+            timer = StageTimer()
+        try:
+            if isinstance(job_description, JobProfile):
+                job_profile = job_description
+            else:
+                with timer.stage('job_profile'):
+                    job_profile = self.get_job_profile(job_description)
             
-            # Perform skill gap analysis
-            skill_gap_analysis = self.analyze_skill_gaps(resume_text, job_description)
-            
-            return {
-                "success": True,
-                "overall_score": round(overall_score, 1),
-                "keyword_match_score": round(keyword_match, 1),
-                "structure_score": round(structure_score, 1),
-                "matched_keywords_count": len(matched_keywords),
-                "missing_keywords_count": len(missing_keywords),
-                "sections_found": sections_found,
-                "recommendations": recommendations,
-                "top_matched_keywords": matched_keywords[:10],
-                "top_missing_keywords": missing_keywords[:10],
-                "skill_gap_analysis": skill_gap_analysis
-            }
+            features = self.extract_features(resume_bytes, timer)
+            return self.score_features(features, job_profile, timer), features
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "overall_score": 0,
-                "recommendations": [f"❌ Error analyzing resume: {str(e)}"]
-            }
+            return self.error_result(e), None
+    
+    def analyze_many(self, resumes: List[bytes], job_description: Union[str, JobProfile],
+                     executor: Optional[Executor] = None) -> List[Dict]:
+        """Analyze many resumes against one job description, best score first
+        
+        The job description is compiled once. With an executor the resumes
+        are scored in parallel; each result carries its input position in
+        'index'. Executors sharing this process's memory run this scorer.
+        A ProcessPoolExecutor runs each worker's own scorer, so to score
+        with this one's options it must be created with
+        initializer=configure_scorer and those options as initargs.
+        """
+        if isinstance(job_description, JobProfile):
+            job_profile = job_description
+        else:
+            job_profile = self.get_job_profile(job_description)
+        
+        if executor is None:
+            results = [self.analyze_resume(resume_bytes, job_profile) for resume_bytes in resumes]
+        elif isinstance(executor, ProcessPoolExecutor):
+            results = list(executor.map(analyze_resume_task, resumes, repeat(job_profile)))
+        else:
+            results = list(executor.map(self.analyze_resume, resumes, repeat(job_profile)))
+        
+        for index, result in enumerate(results):
+            result['index'] = index
+        return rank_results(results)
+    
+    @staticmethod
+    def error_result(error: Union[str, Exception]) -> Dict:
+        """Result returned when a resume cannot be analyzed"""
+        return {
+            "success": False,
+            "error": str(error),
+            "overall_score": 0,
+            "recommendations": [f"❌ Error analyzing resume: {str(error)}"]
+        }
+
+
+def rank_results(results: List[Dict]) -> List[Dict]:
+    """Sort analysis results by overall score, best first"""
+    return sorted(results, key=lambda result: result.get("overall_score", 0), reverse=True)
+
+
+# Scorer shared by tasks running in this process. Pool worker processes
+# create their own on first use; the web process installs its instance so
+# thread and inline executors reuse it.
+_scorer: Optional[ATSScorer] = None
+
+
+def install_scorer(scorer: ATSScorer) -> None:
+    """Set the scorer used by tasks running in this process"""
+    global _scorer
+    _scorer = scorer
+
+
+def configure_scorer(options: Dict) -> None:
+    """Create and install this process's scorer; used as a pool initializer"""
+    install_scorer(ATSScorer(**options))
+
+
+def get_scorer() -> ATSScorer:
+    """Return this process's scorer, creating it on first use"""
+    global _scorer
+    if _scorer is None:
+        _scorer = ATSScorer()
+    return _scorer
+
+
+def warm_up_task() -> Optional[str]:
+    """Executor task: load this process's scorer and PDF library"""
+    return get_scorer().warm_up()
+
+
+def analyze_resume_task(resume_bytes: bytes, job_profile: JobProfile) -> Dict:
+    """Executor task: analyze one resume against a compiled job profile"""
+    return get_scorer().analyze_resume(resume_bytes, job_profile)
+
+
+def analyze_with_features_task(resume_bytes: bytes, job_profile: JobProfile
+                               ) -> Tuple[Dict, Optional[ResumeFeatures]]:
+    """Executor task: analyze one resume and return its features too
+    
+    The result carries this worker's stage timings under 'timings'.
+    """
+    timer = StageTimer()
+    result, features = get_scorer().analyze_resume_with_features(resume_bytes, job_profile, timer)
+    result["timings"] = timer.to_dict()
+    return result, features
+
+
+def score_features_task(features: ResumeFeatures, job_profile: JobProfile) -> Dict:
+    """Executor task: score stored features, e.g. when semantic scoring is on
+    
+    The result carries this worker's stage timings under 'timings'.
+    """
+    timer = StageTimer()
+    result = get_scorer().score_features(features, job_profile, timer)
+    result["timings"] = timer.to_dict()
+    return result
+
+
+def extract_features_task(resume_bytes: bytes) -> ResumeFeatures:
+    """Executor task: extract a resume's features without scoring it"""
+    return get_scorer().extract_features(resume_bytes)
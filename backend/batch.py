@@ -0,0 +1,126 @@
+"""
+Batch scoring helpers: many resumes against one job description
+"""
+
+import asyncio
+import zipfile
+from typing import AsyncIterator, Awaitable, Callable, Dict, List
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from ats import ATSScorer, JobProfile, analyze_resume_task
+from resume_formats import ZIP_MAGIC, is_docx
+from worker_pool import AnalysisPool
+
+# Files inside an archive that are taken as resumes; their format is still
+# detected from their content when they are scored
+RESUME_SUFFIXES = ('.pdf', '.docx', '.txt')
+
+
+class BatchItem:
+    """One resume in a batch; its bytes are only read when it is scored"""
+
+    def __init__(self, filename: str, load: Callable[[], Awaitable[bytes]]):
+        self.filename = filename
+        self.load = load
+
+
+def _upload_loader(upload: UploadFile, max_size: int) -> Callable[[], Awaitable[bytes]]:
+    """Read an uploaded file on demand, enforcing the size limit"""
+    async def load() -> bytes:
+        # Format checks may have moved the file position
+        await upload.seek(0)
+        data = await upload.read(max_size + 1)
+        if len(data) > max_size:
+            raise ValueError(f"File size too large. Maximum size is {max_size // (1024 * 1024)}MB.")
+        return data
+    return load
+
+
+def _zip_member_loader(archive: zipfile.ZipFile, name: str) -> Callable[[], Awaitable[bytes]]:
+    """Read one member of a zip archive on demand"""
+    async def load() -> bytes:
+        return await run_in_threadpool(archive.read, name)
+    return load
+
+
+async def _is_zip(upload: UploadFile) -> bool:
+    """Check the upload's magic bytes for a zip archive (or a DOCX)"""
+    head = await upload.read(len(ZIP_MAGIC))
+    await upload.seek(0)
+    return head == ZIP_MAGIC
+
+
+async def collect_batch_items(uploads: List[UploadFile], max_files: int,
+                              max_size: int) -> List[BatchItem]:
+    """Turn uploaded resumes and zip archives of resumes into batch items
+
+    A zip upload that is a Word document is one resume, not an archive.
+    Raises ValueError for bad archives or when the batch is too large.
+    """
+    items: List[BatchItem] = []
+    too_many = ValueError(f"Too many resumes. Maximum is {max_files} per batch.")
+    for upload in uploads:
+        filename = upload.filename or 'resume'
+        if await _is_zip(upload):
+            try:
+                archive = zipfile.ZipFile(upload.file)
+            except zipfile.BadZipFile:
+                raise ValueError(f"{filename} is not a valid zip archive")
+            if is_docx(archive):
+                items.append(BatchItem(filename, _upload_loader(upload, max_size)))
+                continue
+            for info in archive.infolist():
+                name = info.filename
+                if (info.is_dir() or name.startswith('__MACOSX/')
+                        or not name.lower().endswith(RESUME_SUFFIXES)):
+                    continue
+                if info.file_size > max_size:
+                    raise ValueError(f"{name} in {filename} is larger than "
+                                     f"{max_size // (1024 * 1024)}MB")
+                items.append(BatchItem(name, _zip_member_loader(archive, name)))
+                # An archive may list any number of members; stop at the cap
+                if len(items) > max_files:
+                    raise too_many
+        else:
+            items.append(BatchItem(filename, _upload_loader(upload, max_size)))
+
+        if len(items) > max_files:
+            raise too_many
+    return items
+
+
+async def iter_batch_results(pool: AnalysisPool, items: List[BatchItem],
+                             job_profile: JobProfile) -> AsyncIterator[Dict]:
+    """Score batch items on the pool, yielding each result as it finishes
+
+    A fixed set of pool.max_workers feeders pulls items one at a time, so
+    only that many resumes are held in memory and finished results are not
+    retained once yielded; a slow consumer pauses the feeders. Failures are
+    reported per item in the analyze_resume error shape.
+    """
+    results: asyncio.Queue = asyncio.Queue(maxsize=pool.max_workers)
+    pending = iter(enumerate(items))
+
+    async def score(index: int, item: BatchItem) -> Dict:
+        try:
+            resume_bytes = await item.load()
+            result = await pool.run(analyze_resume_task, resume_bytes, job_profile, wait=True)
+        except Exception as e:
+            result = ATSScorer.error_result(e)
+        result['index'] = index
+        result['filename'] = item.filename
+        return result
+
+    async def feeder() -> None:
+        for index, item in pending:
+            await results.put(await score(index, item))
+
+    feeders = [asyncio.create_task(feeder()) for _ in range(min(pool.max_workers, len(items)))]
+    try:
+        for _ in range(len(items)):
+            yield await results.get()
+    finally:
+        for task in feeders:
+            task.cancel()
@@ -0,0 +1,83 @@
+"""
+Batch throughput benchmark
+
+Scores the same N resumes through N POST /analyze calls and through one
+POST /analyze/batch call, and reports resumes per second for each path.
+The resumes all differ, so the per-request path cannot be answered from
+the result cache.
+
+    uvicorn main:app --port 8000 &
+    python -m benchmarks.batch_throughput --url http://localhost:8000 --resumes 200
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from benchmarks.fixtures import SAMPLE_JOB_DESCRIPTION, unique_resume_pdf
+
+
+async def per_request(client: httpx.AsyncClient, url: str, resumes: list, concurrency: int) -> float:
+    """Seconds to score every resume with individual /analyze calls"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(pdf_bytes: bytes) -> None:
+        async with semaphore:
+            while True:
+                response = await client.post(
+                    f"{url}/analyze",
+                    files={"resume": ("resume.pdf", pdf_bytes, "application/pdf")},
+                    data={"job_description": SAMPLE_JOB_DESCRIPTION},
+                )
+                if response.status_code != 503:
+                    response.raise_for_status()
+                    return
+                await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(pdf_bytes) for pdf_bytes in resumes))
+    return time.perf_counter() - start
+
+
+async def batched(client: httpx.AsyncClient, url: str, resumes: list) -> float:
+    """Seconds to score every resume with one /analyze/batch call"""
+    files = [("resumes", (f"resume_{i}.pdf", pdf_bytes, "application/pdf"))
+             for i, pdf_bytes in enumerate(resumes)]
+    start = time.perf_counter()
+    response = await client.post(f"{url}/analyze/batch", files=files,
+                                 data={"job_description": SAMPLE_JOB_DESCRIPTION})
+    response.raise_for_status()
+    assert response.json()["count"] == len(resumes)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--resumes', type=int, default=100)
+    parser.add_argument('--pages', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='client concurrency for the per-request path')
+    args = parser.parse_args()
+
+    # A reference unique to the run and the resume keeps every /analyze call
+    # a cache miss, as every resume in the batch is
+    run = uuid.uuid4().hex[:8]
+    resumes = [unique_resume_pdf(1 + i % args.pages, f"{run}-{i}") for i in range(args.resumes)]
+
+    async with httpx.AsyncClient(timeout=600) as client:
+        single = await per_request(client, args.url, resumes, args.concurrency)
+        batch = await batched(client, args.url, resumes)
+
+    print(f"{'path':<12} {'seconds':>8} {'resumes/s':>10}")
+    print(f"{'per-request':<12} {single:>8.2f} {args.resumes / single:>10.1f}")
+    print(f"{'batch':<12} {batch:>8.2f} {args.resumes / batch:>10.1f}")
+    print(f"speedup: {single / batch:.2f}x")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Bulk scoring benchmark
+
+Scores M synthetic resumes against K job profiles with BulkScorer and with
+a score_features loop, checks that the results agree and reports timings.
+
+    python -m benchmarks.bulk --resumes 2000 --jobs 50
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from ats import ATSScorer
+from benchmarks.resume_index import synthetic_job, synthetic_resume
+from bulk import BulkScorer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resumes', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=50)
+    parser.add_argument('--scalar-sample', type=int, default=200,
+                        help='resumes scored with the scalar path for comparison')
+    args = parser.parse_args()
+
+    scorer = ATSScorer()
+    rng = random.Random(11)
+    resumes = [synthetic_resume(scorer, rng) for _ in range(args.resumes)]
+    jobs = [synthetic_job(scorer, rng) for _ in range(args.jobs)]
+
+    start = time.perf_counter()
+    scores = BulkScorer(scorer).score(resumes, jobs)
+    bulk_seconds = time.perf_counter() - start
+
+    sample = resumes[:args.scalar_sample]
+    start = time.perf_counter()
+    scalar = [[scorer.score_features(features, job) for job in jobs] for features in sample]
+    scalar_seconds = (time.perf_counter() - start) * len(resumes) / len(sample)
+
+    for row, results in enumerate(scalar):
+        for column, result in enumerate(results):
+            assert round(scores.overall[row, column], 1) == result['overall_score']
+            assert round(scores.keyword_match[row, column], 1) == result['keyword_match_score']
+            assert round(scores.skill_match[row, column], 1) == \
+                result['skill_gap_analysis']['skill_match_percentage']
+
+    cells = args.resumes * args.jobs
+    print(f"grid: {args.resumes} resumes x {args.jobs} jobs = {cells} cells")
+    print(f"bulk:   {bulk_seconds:8.3f} s  ({cells / bulk_seconds:,.0f} cells/s)")
+    print(f"scalar: {scalar_seconds:8.3f} s  (extrapolated from {len(sample)} resumes)")
+    print(f"speedup: {scalar_seconds / bulk_seconds:.1f}x, "
+          f"best match per job: {np.round(scores.overall.max(axis=0)[:5], 1)} ...")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Synthetic resume and job description corpus
+
+Generates text-based resume PDFs and job descriptions of controllable size:
+page count, keyword density (share of resume words drawn from the job's
+vocabulary) and how many known skills are mentioned. Output depends only on
+the seed, so runs on different commits score the same documents.
+
+    python -m benchmarks.corpus --out corpus --resumes 20 --pages 1,5,20
+"""
+
+import argparse
+import os
+import random
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from ats import COMMON_SECTIONS
+from benchmarks.fixtures import make_pdf
+from taxonomy import load_taxonomy
+
+# Every skill in the default taxonomy, flattened
+_TAXONOMY = load_taxonomy()
+ALL_SKILLS = sorted({skill for database in (_TAXONOMY.technical_skills, _TAXONOMY.soft_skills)
+                     for skills in database.values() for skill in skills})
+
+# Words a job description asks for beyond named skills
+DOMAIN_WORDS = [
+    'scalable', 'distributed', 'microservices', 'latency', 'throughput', 'pipelines',
+    'architecture', 'observability', 'reliability', 'security', 'compliance', 'analytics',
+    'automation', 'deployment', 'monitoring', 'performance', 'integration', 'migration',
+    'availability', 'infrastructure', 'caching', 'streaming', 'payments', 'platform',
+    'backend', 'frontend', 'mobile', 'design', 'ownership', 'roadmap', 'stakeholders',
+    'customers', 'metrics', 'experimentation', 'optimization', 'modeling', 'warehouse',
+]
+
+# Words that carry no signal for the job
+FILLER_WORDS = [
+    'worked', 'with', 'team', 'across', 'company', 'delivered', 'several', 'projects',
+    'using', 'various', 'improved', 'process', 'daily', 'support', 'internal', 'users',
+    'helped', 'build', 'features', 'for', 'clients', 'managed', 'tasks', 'reports',
+    'weekly', 'meetings', 'organized', 'office', 'handled', 'requests', 'coordinated',
+    'vendors', 'updated', 'records', 'reviewed', 'documents', 'planned', 'events',
+]
+
+LINES_PER_PAGE = 55
+WORDS_PER_LINE = 11
+
+
+@dataclass(frozen=True)
+class ResumeSpec:
+    """Shape of one synthetic resume"""
+    pages: int = 1
+    keyword_density: float = 0.2
+    skills: int = 15
+
+
+def job_vocabulary(rng: random.Random, skills: int = 12,
+                   domain_words: int = 20) -> Tuple[List[str], List[str]]:
+    """Skills and domain words a job description asks for"""
+    return (rng.sample(ALL_SKILLS, min(skills, len(ALL_SKILLS))),
+            rng.sample(DOMAIN_WORDS, min(domain_words, len(DOMAIN_WORDS))))
+
+
+def generate_job_description(rng: random.Random, skills: int = 12,
+                             domain_words: int = 20, sentences: int = 12) -> str:
+    """A job description naming `skills` known skills"""
+    job_skills, job_words = job_vocabulary(rng, skills, domain_words)
+    lines = [f"Senior {rng.choice(['Backend', 'Platform', 'Data', 'Full Stack'])} Engineer", ""]
+    for number in range(sentences):
+        named = job_skills[number::sentences]
+        words = rng.sample(job_words, 4) + rng.sample(FILLER_WORDS, 4)
+        rng.shuffle(words)
+        clause = f" Experience with {', '.join(named)} is required." if named else ""
+        lines.append(f"You will {' '.join(words)}.{clause}")
+    return "\n".join(lines)
+
+
+def _line(rng: random.Random, vocabulary: List[str], density: float) -> str:
+    """One line of words, `density` of them drawn from the job vocabulary"""
+    return ' '.join(rng.choice(vocabulary) if rng.random() < density else rng.choice(FILLER_WORDS)
+                    for _ in range(WORDS_PER_LINE))
+
+
+def generate_resume_pages(rng: random.Random, job_description: str,
+                          spec: ResumeSpec = ResumeSpec()) -> List[List[str]]:
+    """Lines of each page of a resume aimed at a job description"""
+    # Skills only appear where spec.skills puts them
+    words = (word.strip('.,').lower() for word in job_description.split())
+    vocabulary = [word for word in words
+                  if len(word) > 3 and word not in ALL_SKILLS] or DOMAIN_WORDS
+    skills = rng.sample(ALL_SKILLS, min(spec.skills, len(ALL_SKILLS)))
+
+    header = [
+        f"Candidate {rng.randrange(10_000):04d}",
+        f"candidate{rng.randrange(10_000)}@example.com | (555) {rng.randrange(100, 999)}-{rng.randrange(1000, 9999)}",
+        "",
+    ]
+    body: List[str] = []
+    for section in rng.sample(COMMON_SECTIONS, rng.randint(4, len(COMMON_SECTIONS))):
+        body.append(section.title())
+        if section == 'skills':
+            body.extend(', '.join(skills[start:start + 6]) for start in range(0, len(skills), 6))
+        body.extend(f"- {_line(rng, vocabulary, spec.keyword_density)}" for _ in range(rng.randint(3, 8)))
+        body.append("")
+
+    lines = header + body
+    while len(lines) < spec.pages * LINES_PER_PAGE:
+        lines.append(f"- {_line(rng, vocabulary, spec.keyword_density)}")
+    lines = lines[:spec.pages * LINES_PER_PAGE]
+    return [lines[start:start + LINES_PER_PAGE] for start in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def generate_resume_text(rng: random.Random, job_description: str,
+                         spec: ResumeSpec = ResumeSpec()) -> str:
+    """Plain text of a synthetic resume, as a PDF backend would extract it"""
+    return "\n".join("\n".join(page) for page in generate_resume_pages(rng, job_description, spec))
+
+
+def generate_resume_pdf(rng: random.Random, job_description: str,
+                        spec: ResumeSpec = ResumeSpec()) -> bytes:
+    """A synthetic resume as a text-based PDF"""
+    return make_pdf(generate_resume_pages(rng, job_description, spec))
+
+
+def generate_corpus(count: int, spec: ResumeSpec = ResumeSpec(), job_skills: int = 12,
+                    seed: int = 0) -> Tuple[str, List[bytes]]:
+    """A job description and `count` distinct resume PDFs aimed at it"""
+    rng = random.Random(seed)
+    job_description = generate_job_description(rng, job_skills)
+    return job_description, [generate_resume_pdf(rng, job_description, spec) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--out', required=True, help='directory to write into')
+    parser.add_argument('--resumes', type=int, default=20, help='resumes per page count')
+    parser.add_argument('--pages', default='1,5,20')
+    parser.add_argument('--keyword-density', type=float, default=0.2)
+    parser.add_argument('--skills', type=int, default=15, help='known skills per resume')
+    parser.add_argument('--job-skills', type=int, default=12, help='known skills in the job description')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for pages in (int(value) for value in args.pages.split(',')):
+        spec = ResumeSpec(pages=pages, keyword_density=args.keyword_density, skills=args.skills)
+        job_description, resumes = generate_corpus(args.resumes, spec, args.job_skills, args.seed)
+        with open(os.path.join(args.out, 'job_description.txt'), 'w') as f:
+            f.write(job_description)
+        for number, pdf_bytes in enumerate(resumes):
+            with open(os.path.join(args.out, f"resume_{pages}p_{number:03d}.pdf"), 'wb') as f:
+                f.write(pdf_bytes)
+        print(f"{len(resumes)} resumes of {pages} page(s) written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Sample resumes and job descriptions for benchmarks
+"""
+
+import io
+import zipfile
+from typing import List
+from xml.sax.saxutils import escape
+
+SAMPLE_JOB_DESCRIPTION = """
+Senior Backend Engineer
+
+We are looking for a backend engineer with strong Python experience to build
+scalable APIs with FastAPI and Django. You will design services backed by
+PostgreSQL and Redis, deploy them on AWS with Docker and Kubernetes, and own
+CI/CD pipelines in GitHub Actions. Experience with pytest, unit testing and
+integration testing is required. Strong communication, leadership and problem
+solving skills, comfort in an agile team and mentoring junior engineers.
+"""
+
+SAMPLE_RESUME_LINES = [
+    "Jane Doe - Software Engineer",
+    "jane.doe@example.com | (555) 123-4567",
+    "",
+    "Summary",
+    "Backend engineer with seven years of experience building Python services.",
+    "",
+    "Experience",
+    "Senior Software Engineer, Example Corp (2019 - present)",
+    "- Built REST APIs with FastAPI and Flask serving two million requests a day",
+    "- Migrated MySQL workloads to PostgreSQL and added Redis caching",
+    "- Deployed services on AWS using Docker, Kubernetes and Terraform",
+    "- Led a team of four engineers, mentoring and code review",
+    "Software Engineer, Sample Inc (2016 - 2019)",
+    "- Developed Django applications and JavaScript front ends with React",
+    "- Wrote pytest suites for unit testing and integration testing",
+    "",
+    "Education",
+    "B.S. Computer Science, State University",
+    "",
+    "Skills",
+    "Python, JavaScript, SQL, FastAPI, Django, Flask, React, PostgreSQL, Redis,",
+    "AWS, Docker, Kubernetes, Git, Jira, agile, scrum, communication, leadership",
+    "",
+    "Projects",
+    "Open source contributor to several Python web frameworks",
+]
+
+
+def sample_resume_text(pages: int = 1) -> str:
+    """Plain text of the sample resume repeated over the given page count"""
+    return "\n".join(SAMPLE_RESUME_LINES * pages)
+
+
+def _escape(text: str) -> str:
+    """Escape a string for use inside a PDF literal"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(pages: List[List[str]]) -> bytes:
+    """Build a minimal text-based PDF with one list of lines per page"""
+    objects = []
+    page_ids = []
+    font_id = 3
+    next_id = 4
+    for lines in pages:
+        content = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+        for line in lines:
+            content.append(f"({_escape(line)}) Tj T*")
+        content.append("ET")
+        stream = "\n".join(content).encode('latin-1', 'replace')
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        page_ids.append(page_id)
+        objects.append((page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()))
+        objects.append((content_id, b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"))
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects = [
+        (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()),
+        (font_id, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"),
+    ] + objects
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id, body in objects:
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n" % obj_id + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (next_id)
+    for obj_id in range(1, next_id):
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (next_id, xref_offset)
+    return bytes(out)
+
+
+def sample_resume_pdf(pages: int = 1) -> bytes:
+    """The sample resume as a PDF with the given number of pages"""
+    return make_pdf([SAMPLE_RESUME_LINES for _ in range(pages)])
+
+
+def unique_resume_pdf(pages: int, reference: str) -> bytes:
+    """The sample resume as a PDF whose first line is a reference
+
+    Different references make different files, which the server's result
+    cache cannot answer for, so each one is really analyzed.
+    """
+    return make_pdf([[f"Reference {reference}"] + SAMPLE_RESUME_LINES] +
+                    [SAMPLE_RESUME_LINES for _ in range(pages - 1)])
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType='
+    '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml" Type='
+    '"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+
+
+def make_docx(pages: List[List[str]]) -> bytes:
+    """Build a minimal Word document with one paragraph per line"""
+    paragraphs = []
+    for page_number, lines in enumerate(pages):
+        for line_number, line in enumerate(lines):
+            page_break = '<w:r><w:br w:type="page"/></w:r>' if page_number and not line_number else ''
+            paragraphs.append(f'<w:p><w:pPr><w:spacing w:after="0"/></w:pPr>{page_break}'
+                              f'<w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>')
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(paragraphs)}</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', _DOCX_CONTENT_TYPES)
+        archive.writestr('_rels/.rels', _DOCX_RELS)
+        archive.writestr('word/document.xml', document)
+    return out.getvalue()
+
+
+def sample_resume_docx(pages: int = 1) -> bytes:
+    """The sample resume as a Word document with the given number of pages"""
+    return make_docx([SAMPLE_RESUME_LINES for _ in range(pages)])
@@ -0,0 +1,70 @@
+"""
+Text extraction throughput per resume format
+
+Builds the same synthetic resumes as PDF, DOCX and plain text and times
+ATSScorer.extract_text on each, which detects the format and sends it to
+its extractor. When python-docx is installed, its paragraph walk is timed
+on the same DOCX files for comparison with the direct XML pass.
+
+    python -m benchmarks.formats --pages 1,5,20
+"""
+
+import argparse
+import importlib.util
+import io
+import random
+import timeit
+from typing import Callable, List
+
+from benchmarks.corpus import ResumeSpec, generate_job_description, generate_resume_pages
+from benchmarks.fixtures import make_docx, make_pdf
+
+
+def python_docx_text(docx_bytes: bytes) -> str:
+    """Paragraph text as python-docx reads it"""
+    import docx
+    return '\n'.join(paragraph.text for paragraph in docx.Document(io.BytesIO(docx_bytes)).paragraphs)
+
+
+def seconds_per_call(fn: Callable[[], object], repeat: int) -> float:
+    """Best per-call time of fn, with the loop count picked by timeit"""
+    timer = timeit.Timer(fn)
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=loops)) / loops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', default='1,5,20')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    from ats import ATSScorer
+
+    scorer = ATSScorer(pdf_max_chars=0, pdf_max_pages=0)
+    rng = random.Random(0)
+    job_description = generate_job_description(rng)
+    has_python_docx = importlib.util.find_spec('docx') is not None
+
+    print(f"{'format':<18} {'pages':>5} {'KB':>8} {'ms/doc':>9} {'docs/s':>9} {'MB/s':>8}")
+    for page_count in (int(value) for value in args.pages.split(',')):
+        pages: List[List[str]] = generate_resume_pages(rng, job_description, ResumeSpec(pages=page_count))
+        files = {
+            'pdf': make_pdf(pages),
+            'docx': make_docx(pages),
+            'txt': '\n'.join('\n'.join(lines) for lines in pages).encode(),
+        }
+        cases = [(name, data, lambda data=data: scorer.extract_text(data)) for name, data in files.items()]
+        if has_python_docx:
+            cases.append(('docx (python-docx)', files['docx'],
+                          lambda: python_docx_text(files['docx'])))
+
+        for name, data, fn in cases:
+            seconds = seconds_per_call(fn, args.repeat)
+            print(f"{name:<18} {page_count:>5} {len(data) / 1024:>8.1f} {seconds * 1000:>9.3f} "
+                  f"{1 / seconds:>9.0f} {len(data) / seconds / 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
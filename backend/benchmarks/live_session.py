@@ -0,0 +1,73 @@
+"""
+Live session update latency against full re-analysis
+
+Opens a live session on synthetic resumes of growing size and applies
+keystroke-sized edits (retyping one line) and paragraph-sized ones (pasting
+a block of lines, then deleting it again). Each update is compared with
+re-analysing the whole edited text, the work a full /analyze would repeat.
+
+    python -m benchmarks.live_session --pages 1,5,20,50
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List
+
+from benchmarks.corpus import ResumeSpec, generate_job_description, generate_resume_text
+
+
+def median_ms(fn: Callable[[], object], runs: int) -> float:
+    """Median milliseconds per call"""
+    samples: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', default='1,5,20,50')
+    parser.add_argument('--runs', type=int, default=200, help='updates timed per case')
+    parser.add_argument('--paste-lines', type=int, default=20, help='lines in a pasted block')
+    args = parser.parse_args()
+
+    from ats import ATSScorer
+    from live_session import LiveSession
+
+    scorer = ATSScorer(pdf_max_chars=0)
+    rng = random.Random(0)
+    job_description = generate_job_description(rng)
+    job_profile = scorer.get_job_profile(job_description)
+
+    print(f"{'pages':>5} {'chars':>9} {'line edit ms':>13} {'paste ms':>9} {'full ms':>9}")
+    for page_count in (int(value) for value in args.pages.split(',')):
+        text = generate_resume_text(rng, job_description, ResumeSpec(pages=page_count))
+        session = LiveSession(scorer, job_description, text)
+        block = text.split('\n')[:args.paste_lines]
+
+        def line_edit():
+            number = rng.randrange(len(session.lines))
+            session.apply([(number, number + 1, [session.lines[number] + ' python'])])
+            return session.result()
+
+        def paste():
+            number = rng.randrange(len(session.lines))
+            session.apply([(number, number, block)])
+            session.apply([(number, number + len(block), [])])
+            return session.result()
+
+        def full():
+            features = scorer.extract_resume_features(session.text)
+            return scorer.score_features(features, job_profile)
+
+        print(f"{page_count:>5} {len(text):>9,} {median_ms(line_edit, args.runs):>13.3f} "
+              f"{median_ms(paste, args.runs):>9.3f} {median_ms(full, max(1, args.runs // 10)):>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Load benchmark for POST /analyze
+
+Sends resumes to a running server at increasing concurrency and reports
+p50/p99 latency, throughput and how many requests were shed with 503.
+Every request sends a different resume, so the result cache is bypassed
+and the worker pool does the work; --repeat-resume sends one resume
+throughout to measure cache hits instead.
+
+    uvicorn main:app --port 8000 &
+    python -m benchmarks.load --url http://localhost:8000 --pages 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.fixtures import SAMPLE_JOB_DESCRIPTION, sample_resume_pdf, unique_resume_pdf
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_level(client: httpx.AsyncClient, url: str, resumes: List[bytes],
+                    concurrency: int) -> Dict:
+    """Fire one analysis per resume with at most `concurrency` in flight"""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(pdf_bytes: bytes) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                f"{url}/analyze",
+                files={"resume": ("resume.pdf", pdf_bytes, "application/pdf")},
+                data={"job_description": SAMPLE_JOB_DESCRIPTION},
+            )
+            elapsed = time.perf_counter() - start
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                latencies.append(elapsed)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(pdf_bytes) for pdf_bytes in resumes))
+    wall = time.perf_counter() - start
+
+    return {
+        'concurrency': concurrency,
+        'ok': len(latencies),
+        'statuses': statuses,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'mean_ms': (statistics.mean(latencies) * 1000) if latencies else 0.0,
+        'rps': len(latencies) / wall if wall else 0.0,
+    }
+
+
+async def probe_health(client: httpx.AsyncClient, url: str, samples: int = 20) -> float:
+    """Median /health latency in ms, measured while analyses are running"""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        await client.get(f"{url}/health")
+        timings.append(time.perf_counter() - start)
+        await asyncio.sleep(0.05)
+    return statistics.median(timings) * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--pages', type=int, default=3, help='pages in the generated resume')
+    parser.add_argument('--requests', type=int, default=64, help='requests per concurrency level')
+    parser.add_argument('--levels', default='1,2,4,8,16,32', help='comma separated concurrency levels')
+    parser.add_argument('--repeat-resume', action='store_true',
+                        help='send the same resume every time, so all but the first are cache hits')
+    args = parser.parse_args()
+
+    # References unique to this run, so earlier runs' cached results do not match
+    run = uuid.uuid4().hex[:8]
+    pdf_bytes = sample_resume_pdf(args.pages)
+    levels = [int(level) for level in args.levels.split(',')]
+
+    async with httpx.AsyncClient(timeout=120) as client:
+        print(f"{'conc':>5} {'ok':>5} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>8} "
+              f"{'health ms':>10}  statuses")
+        for concurrency in levels:
+            health = asyncio.create_task(probe_health(client, args.url))
+            if args.repeat_resume:
+                resumes = [pdf_bytes] * args.requests
+            else:
+                resumes = [unique_resume_pdf(args.pages, f"{run}-{concurrency}-{number}")
+                           for number in range(args.requests)]
+            result = await run_level(client, args.url, resumes, concurrency)
+            health_ms = await health
+            print(f"{result['concurrency']:>5} {result['ok']:>5} {result['p50_ms']:>9.1f} "
+                  f"{result['p99_ms']:>9.1f} {result['rps']:>8.1f} {health_ms:>10.1f}  "
+                  f"{result['statuses']}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
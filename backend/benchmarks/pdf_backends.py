@@ -0,0 +1,94 @@
+"""
+PDF backend comparison
+
+Extracts a fixture corpus with every installed backend and reports
+throughput and text fidelity (token F1 against the known text), to pick
+the fastest backend that is accurate enough for ATS_PDF_BACKENDS.
+
+The default corpus is generated; pass --corpus DIR to use real PDFs, each
+with a same-named .txt file holding its expected text.
+
+    python -m benchmarks.pdf_backends
+"""
+
+import argparse
+import io
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Tuple
+
+from benchmarks.fixtures import SAMPLE_RESUME_LINES, make_pdf
+from pdf_backends import BACKENDS
+
+
+def generated_corpus() -> List[Tuple[str, bytes, str]]:
+    """(name, pdf bytes, expected text) for generated resumes of several sizes"""
+    corpus = []
+    for pages in (1, 5, 20):
+        page_lines = [[f"Page {page + 1}"] + SAMPLE_RESUME_LINES for page in range(pages)]
+        expected = "\n".join("\n".join(lines) for lines in page_lines)
+        corpus.append((f"generated_{pages}p", make_pdf(page_lines), expected))
+    return corpus
+
+
+def directory_corpus(directory: str) -> List[Tuple[str, bytes, str]]:
+    """(name, pdf bytes, expected text) for PDFs with .txt ground truth"""
+    corpus = []
+    for pdf_path in sorted(Path(directory).glob('*.pdf')):
+        text_path = pdf_path.with_suffix('.txt')
+        if text_path.exists():
+            corpus.append((pdf_path.name, pdf_path.read_bytes(), text_path.read_text()))
+    return corpus
+
+
+def token_f1(expected: str, actual: str) -> float:
+    """F1 of the lowercased word multisets of two texts"""
+    expected_tokens = Counter(re.findall(r'\w+', expected.lower()))
+    actual_tokens = Counter(re.findall(r'\w+', actual.lower()))
+    overlap = sum((expected_tokens & actual_tokens).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(actual_tokens.values())
+    recall = overlap / sum(expected_tokens.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='directory of PDFs with .txt ground truth')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = directory_corpus(args.corpus) if args.corpus else generated_corpus()
+    total_bytes = sum(len(pdf_bytes) for _, pdf_bytes, _ in corpus)
+
+    print(f"{'backend':<10} {'docs/s':>8} {'MB/s':>7} {'min F1':>7} {'mean F1':>8}  failures")
+    for name, backend_class in BACKENDS.items():
+        if not backend_class.available():
+            print(f"{name:<10} not installed")
+            continue
+        backend = backend_class()
+        # Warm up so the library import is not timed
+        "\n".join(backend.iter_pages(io.BytesIO(corpus[0][1])))
+        scores, failures = [], 0
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _, pdf_bytes, expected in corpus:
+                try:
+                    text = "\n".join(backend.iter_pages(io.BytesIO(pdf_bytes)))
+                except Exception:
+                    failures += 1
+                    continue
+                scores.append(token_f1(expected, text))
+        elapsed = time.perf_counter() - start
+        documents = len(corpus) * args.repeat
+        print(f"{name:<10} {documents / elapsed:>8.1f} "
+              f"{total_bytes * args.repeat / elapsed / 1e6:>7.2f} "
+              f"{min(scores, default=0):>7.3f} {sum(scores) / max(len(scores), 1):>8.3f}  {failures}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+PDF extraction benchmark
+
+Measures latency and peak RSS of ATSScorer.extract_text_from_pdf on large
+generated PDFs, with and without the page/char limits, against the old
+copy-then-concatenate implementation. Each measurement runs in a fresh
+process so peak RSS is not polluted by earlier runs.
+
+    python -m benchmarks.pdf_extraction --pages 10,100,300
+"""
+
+import argparse
+import io
+import multiprocessing
+import resource
+import sys
+import time
+
+from benchmarks.fixtures import sample_resume_pdf
+
+
+def legacy_extract(pdf_bytes: bytes) -> str:
+    """The original implementation: unbounded, quadratic concatenation"""
+    from PyPDF2 import PdfReader
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    text = ""
+    for page in reader.pages:
+        text += page.extract_text() + "\n"
+    return text.strip()
+
+
+def _measure(mode: str, path: str, queue) -> None:
+    """Child process: extract once and report latency, size and peak RSS"""
+    from ats import ATSScorer
+
+    if mode == 'legacy':
+        with open(path, 'rb') as f:
+            pdf_bytes = f.read()
+        start = time.perf_counter()
+        text = legacy_extract(pdf_bytes)
+    else:
+        if mode == 'unbounded':
+            scorer = ATSScorer(pdf_max_pages=0, pdf_max_chars=0, pdf_time_budget=0)
+        else:
+            scorer = ATSScorer()
+        with open(path, 'rb') as f:
+            start = time.perf_counter()
+            text = scorer.extract_text_from_pdf(f)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    queue.put((elapsed, len(text), peak_mb))
+
+
+def measure(mode: str, path: str) -> tuple:
+    """Run one measurement in a fresh process"""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(mode, path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', default='10,100,300')
+    parser.add_argument('--workdir', default='/tmp')
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'mode':<10} {'ms':>9} {'chars':>9} {'peak MB':>8}")
+    for pages in (int(value) for value in args.pages.split(',')):
+        path = f"{args.workdir}/ats_bench_{pages}p.pdf"
+        with open(path, 'wb') as f:
+            f.write(sample_resume_pdf(pages))
+        for mode in ('legacy', 'unbounded', 'bounded'):
+            elapsed, chars, peak_mb = measure(mode, path)
+            print(f"{pages:>6} {mode:<10} {elapsed * 1000:>9.1f} {chars:>9} {peak_mb:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Resume index benchmark
+
+Builds a ResumeIndex over synthetic resumes and reports build time and
+top-k query latency, checking a sample of results against
+ATSScorer.score_features.
+
+    python -m benchmarks.resume_index --sizes 10000,100000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import List
+
+from ats import ATSScorer, JobProfile, ResumeFeatures
+from benchmarks.load import percentile
+from resume_index import ResumeIndex
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+
+
+def zipf_terms(rng: random.Random, count: int) -> List[str]:
+    """Draw terms with a long-tailed frequency, like real resume vocabulary"""
+    return [VOCABULARY[min(int(rng.paretovariate(1.1)) - 1, len(VOCABULARY) - 1)]
+            for _ in range(count)]
+
+
+def synthetic_resume(scorer: ATSScorer, rng: random.Random) -> ResumeFeatures:
+    """Resume features with a few hundred keywords and some skills"""
+    all_skills = [(category, skill)
+                  for database in (scorer.technical_skills, scorer.soft_skills)
+                  for category, skills in database.items() for skill in skills]
+    skills = {}
+    for category, skill in rng.sample(all_skills, rng.randint(5, 25)):
+        skills.setdefault(category, []).append(skill)
+    return ResumeFeatures(
+        text='',
+        keywords=list(dict.fromkeys(zipf_terms(rng, rng.randint(150, 500)))),
+        sections_found={section: rng.random() < 0.7 for section in scorer.common_sections},
+        formatting_issues=[],
+        skills=skills,
+    )
+
+
+def synthetic_job(scorer: ATSScorer, rng: random.Random) -> JobProfile:
+    """A job profile with about a hundred keywords"""
+    resume = synthetic_resume(scorer, rng)
+    keywords = list(dict.fromkeys(zipf_terms(rng, 120)))
+    return JobProfile(keywords=keywords, keyword_set=frozenset(keywords), skills=resume.skills)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000')
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--top-k', type=int, default=50)
+    args = parser.parse_args()
+
+    scorer = ATSScorer()
+    rng = random.Random(7)
+    jobs = [synthetic_job(scorer, rng) for _ in range(args.queries)]
+
+    print(f"{'resumes':>8} {'build s':>8} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        index = ResumeIndex(scorer.calculate_structure_score)
+        sample = {}
+        start = time.perf_counter()
+        for number in range(size):
+            features = synthetic_resume(scorer, rng)
+            index.add(f"resume-{number}", features)
+            if number < 200:
+                sample[f"resume-{number}"] = features
+        build = time.perf_counter() - start
+
+        latencies = []
+        for job in jobs:
+            start = time.perf_counter()
+            results = index.search(job, args.top_k)
+            latencies.append(time.perf_counter() - start)
+            for result in results:
+                if result['resume_id'] in sample:
+                    expected = scorer.score_features(sample[result['resume_id']], job)
+                    assert result['overall_score'] == expected['overall_score']
+                    assert result['skill_match_percentage'] == \
+                        expected['skill_gap_analysis']['skill_match_percentage']
+
+        print(f"{size:>8} {build:>8.1f} {percentile(latencies, 50) * 1000:>8.2f} "
+              f"{percentile(latencies, 99) * 1000:>8.2f} {statistics.mean(latencies) * 1000:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
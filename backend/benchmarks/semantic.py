@@ -0,0 +1,75 @@
+"""
+Semantic scoring latency benchmark
+
+Compares per-request analysis latency in keyword-only mode with semantic
+mode: first request (model load), new resume against a cached job
+description, and a resume whose embeddings are already stored.
+Needs sentence-transformers.
+
+    python -m benchmarks.semantic --model all-MiniLM-L6-v2
+"""
+
+import argparse
+import importlib.util
+import os
+import statistics
+import tempfile
+import time
+
+from ats import ATSScorer
+from benchmarks.fixtures import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME_LINES, make_pdf
+
+
+def resume_variant(number: int, pages: int) -> bytes:
+    """A resume PDF whose text differs per number, so embeddings are not reused"""
+    lines = [f"{line} (variant {number})" if line else line for line in SAMPLE_RESUME_LINES]
+    return make_pdf([lines for _ in range(pages)])
+
+
+def mean_ms(scorer: ATSScorer, resumes: list) -> float:
+    """Mean analysis latency in ms over the given resumes"""
+    timings = []
+    for pdf_bytes in resumes:
+        start = time.perf_counter()
+        result = scorer.analyze_resume(pdf_bytes, SAMPLE_JOB_DESCRIPTION)
+        timings.append(time.perf_counter() - start)
+        assert result['success'], result.get('error')
+    return statistics.mean(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--resumes', type=int, default=10)
+    parser.add_argument('--pages', type=int, default=2)
+    args = parser.parse_args()
+
+    if importlib.util.find_spec('sentence_transformers') is None:
+        raise SystemExit("sentence-transformers is not installed")
+
+    resumes = [resume_variant(number, args.pages) for number in range(args.resumes)]
+
+    keyword_only = ATSScorer()
+    keyword_only.analyze_resume(resumes[0], SAMPLE_JOB_DESCRIPTION)
+
+    with tempfile.TemporaryDirectory() as directory:
+        semantic = ATSScorer(semantic_model=args.model,
+                             semantic_store=os.path.join(directory, 'embeddings.db'))
+        start = time.perf_counter()
+        semantic.analyze_resume(resume_variant(-1, args.pages), SAMPLE_JOB_DESCRIPTION)
+        first_ms = (time.perf_counter() - start) * 1000
+
+        rows = [
+            ('keyword only', mean_ms(keyword_only, resumes)),
+            ('semantic, first request', first_ms),
+            ('semantic, new resume', mean_ms(semantic, resumes)),
+            ('semantic, stored resume', mean_ms(semantic, resumes)),
+        ]
+
+    for label, value in rows:
+        print(f"{label:<26} {value:>9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
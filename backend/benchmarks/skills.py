@@ -0,0 +1,70 @@
+"""
+Skill matching benchmark
+
+Compares the old per-skill regex loop with SkillMatcher as the skill
+database grows.
+
+    python -m benchmarks.skills
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, List
+
+from benchmarks.fixtures import sample_resume_text
+from skill_matcher import SkillMatcher
+
+
+def regex_match(text: str, skill_database: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Per-skill regex search, as extract_skills_from_text used to do"""
+    text_lower = text.lower()
+    found_skills = {}
+    for category, skills_list in skill_database.items():
+        found = [skill for skill in skills_list
+                 if re.search(r'\b' + re.escape(skill) + r'\b', text_lower)]
+        if found:
+            found_skills[category] = found
+    return found_skills
+
+
+def synthetic_database(size: int) -> Dict[str, List[str]]:
+    """A database of `size` made-up skills spread over ten categories"""
+    database: Dict[str, List[str]] = {f'category_{i}': [] for i in range(10)}
+    for i in range(size):
+        skill = f'skill{i}' if i % 3 else f'multi word skill {i}'
+        database[f'category_{i % 10}'].append(skill)
+    database['category_0'].extend(['python', 'docker', 'leadership'])
+    return database
+
+
+def time_call(fn, repeat: int) -> float:
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2)
+    parser.add_argument('--sizes', default='100,1000,5000,20000')
+    args = parser.parse_args()
+
+    text = sample_resume_text(args.pages)
+    print(f"{'skills':>7} {'regex ms':>10} {'matcher ms':>11} {'build ms':>9}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        database = synthetic_database(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(database)
+        build_ms = (time.perf_counter() - start) * 1000
+        assert matcher.match(text) == regex_match(text, database)
+        regex_ms = time_call(lambda: regex_match(text, database), 3)
+        matcher_ms = time_call(lambda: matcher.match(text), 50)
+        print(f"{size:>7} {regex_ms:>10.2f} {matcher_ms:>11.3f} {build_ms:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Cold start benchmark
+
+Times `import main` in fresh interpreters and checks that it does not pull
+in heavy libraries, then starts uvicorn and times the first /health and
+/analyze responses from process launch. Exits with status 1 when a limit is
+exceeded, so it can run in CI.
+
+    python -m benchmarks.startup --max-import-ms 1500 --max-first-analyze-ms 5000
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.fixtures import SAMPLE_JOB_DESCRIPTION, sample_resume_pdf
+
+# Libraries that must only be imported when a request needs them
+HEAVY_MODULES = ('numpy', 'scipy', 'torch', 'sentence_transformers', 'spacy', 'sklearn',
+                 'pymupdf', 'fitz', 'PyPDF2', 'pypdf', 'pdfminer')
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{'import_ms': elapsed * 1000, 'heavy': heavy}}))
+"""
+
+
+def measure_import(env: Dict[str, str], runs: int) -> Dict:
+    """Median `import main` time over fresh interpreters"""
+    timings: List[float] = []
+    heavy: List[str] = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', IMPORT_PROBE.format(heavy=HEAVY_MODULES)],
+                                env=env, capture_output=True, text=True, check=True).stdout
+        probe = json.loads(output.strip().splitlines()[-1])
+        timings.append(probe['import_ms'])
+        heavy = probe['heavy']
+    return {'import_ms': statistics.median(timings), 'heavy_modules': heavy}
+
+
+def free_port() -> int:
+    """An unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_responses(env: Dict[str, str], timeout: float) -> Dict:
+    """Launch uvicorn and time the first /health and /analyze from launch"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--port', str(port), '--log-level', 'warning'],
+        env=env,
+    )
+    try:
+        with httpx.Client(timeout=timeout) as client:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"Server exited with status {server.returncode}")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"Server did not answer /health within {timeout:g}s")
+                try:
+                    if client.get(f"{url}/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.01)
+            health_ms = (time.perf_counter() - start) * 1000
+
+            def analyze(pdf_bytes: bytes) -> None:
+                response = client.post(
+                    f"{url}/analyze",
+                    files={"resume": ("resume.pdf", pdf_bytes, "application/pdf")},
+                    data={"job_description": SAMPLE_JOB_DESCRIPTION},
+                )
+                response.raise_for_status()
+
+            analyze(sample_resume_pdf(2))
+            first_analyze_ms = (time.perf_counter() - start) * 1000
+            # A different resume, so the result cache does not answer it
+            warm_start = time.perf_counter()
+            analyze(sample_resume_pdf(3))
+            warm_analyze_ms = (time.perf_counter() - warm_start) * 1000
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        'first_health_ms': health_ms,
+        'first_analyze_ms': first_analyze_ms,
+        'warm_analyze_ms': warm_analyze_ms,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters for the import timing')
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--max-import-ms', type=float, default=0, help='0 disables the check')
+    parser.add_argument('--max-first-health-ms', type=float, default=0, help='0 disables the check')
+    parser.add_argument('--max-first-analyze-ms', type=float, default=0, help='0 disables the check')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Fresh stores, so nothing is served from a previous run's cache
+        env = dict(os.environ,
+                   ATS_RESUME_STORE_DB=os.path.join(directory, 'resumes.db'),
+                   ATS_RESULT_CACHE_DB='')
+        report = measure_import(env, args.runs)
+        report.update(measure_first_responses(env, args.timeout))
+
+    print(f"{'import main':<22} {report['import_ms']:>9.1f} ms")
+    print(f"{'first /health':<22} {report['first_health_ms']:>9.1f} ms")
+    print(f"{'first /analyze':<22} {report['first_analyze_ms']:>9.1f} ms")
+    print(f"{'warm /analyze':<22} {report['warm_analyze_ms']:>9.1f} ms")
+
+    failures = []
+    if report['heavy_modules']:
+        failures.append(f"import main loaded {', '.join(report['heavy_modules'])}")
+    limits = (('import_ms', args.max_import_ms), ('first_health_ms', args.max_first_health_ms),
+              ('first_analyze_ms', args.max_first_analyze_ms))
+    for key, limit in limits:
+        if limit and report[key] > limit:
+            failures.append(f"{key} {report[key]:.1f} exceeds {limit:g}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
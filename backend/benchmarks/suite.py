@@ -0,0 +1,216 @@
+"""
+Benchmark suite with JSON results for comparing commits
+
+Micro-benchmarks each ATSScorer method on a synthetic corpus (see
+benchmarks.corpus) at several resume sizes, then POST /analyze end to end
+through an in-process ASGI client with a real lifespan (analysis pool,
+caches, resume store in a temporary directory). Results are written as JSON;
+with --compare the run fails (exit status 1) when any benchmark's median is
+slower than the baseline's by more than --threshold.
+
+    python -m benchmarks.suite --out before.json
+    git checkout my-branch
+    python -m benchmarks.suite --out after.json --compare before.json --threshold 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, List
+
+import httpx
+
+from benchmarks.corpus import ResumeSpec, generate_corpus, generate_job_description
+from benchmarks.load import percentile
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict:
+    """Per-call timings of fn, with the loop count picked by timeit"""
+    timer = timeit.Timer(fn)
+    loops, _ = timer.autorange()
+    runs = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        'median_ms': statistics.median(runs) * 1000,
+        'min_ms': min(runs) * 1000,
+        'loops': loops,
+    }
+
+
+def scorer_benchmarks(pages: List[int], spec: ResumeSpec, repeat: int) -> Dict[str, Dict]:
+    """Each ATSScorer method on a resume of every page count"""
+    from ats import ATSScorer
+
+    scorer = ATSScorer()
+    results = {}
+
+    job_description = generate_job_description(random.Random(0))
+    results['compile_job_profile'] = measure(
+        lambda: scorer.compile_job_profile(job_description), repeat)
+    results['get_job_profile[cached]'] = measure(
+        lambda: scorer.get_job_profile(job_description), repeat)
+    job_profile = scorer.get_job_profile(job_description)
+
+    for page_count in pages:
+        page_spec = ResumeSpec(pages=page_count, keyword_density=spec.keyword_density,
+                               skills=spec.skills)
+        _, (pdf_bytes,) = generate_corpus(1, page_spec)
+        text = scorer.extract_text_from_pdf(pdf_bytes)
+        features = scorer.extract_resume_features(text)
+        cases = {
+            'extract_text_from_pdf': lambda: scorer.extract_text_from_pdf(pdf_bytes),
+            'extract_keywords': lambda: scorer.extract_keywords(text),
+            'check_resume_structure': lambda: scorer.check_resume_structure(text),
+            'check_formatting_issues': lambda: scorer.check_formatting_issues(text),
+            'extract_skills_from_text': lambda: scorer.extract_skills_from_text(
+                text, scorer.technical_skills),
+            'analyze_skill_gaps': lambda: scorer.analyze_skill_gaps(text, job_description),
+            'extract_resume_features': lambda: scorer.extract_resume_features(text),
+            'score_features': lambda: scorer.score_features(features, job_profile),
+            'analyze_resume': lambda: scorer.analyze_resume(pdf_bytes, job_profile),
+        }
+        for name, fn in cases.items():
+            results[f"{name}[{page_count}p]"] = measure(fn, repeat)
+    return results
+
+
+async def _post_all(client: httpx.AsyncClient, job_description: str,
+                    resumes: List[bytes]) -> List[float]:
+    """POST each resume to /analyze one after another; latencies in seconds"""
+    latencies = []
+    for pdf_bytes in resumes:
+        start = time.perf_counter()
+        response = await client.post(
+            "/analyze",
+            files={"resume": ("resume.pdf", pdf_bytes, "application/pdf")},
+            data={"job_description": job_description},
+        )
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return latencies
+
+
+async def _analyze_endpoint(pages: List[int], spec: ResumeSpec, requests: int) -> Dict[str, Dict]:
+    """Cold (distinct resumes) and cached /analyze latency through ASGI"""
+    import main
+
+    results = {}
+    async with main.lifespan(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://suite") as client:
+            # Spawn the workers before timing anything
+            job_description, warm_up = generate_corpus(1, spec, seed=-1)
+            await _post_all(client, job_description, warm_up)
+
+            for page_count in pages:
+                page_spec = ResumeSpec(pages=page_count, keyword_density=spec.keyword_density,
+                                       skills=spec.skills)
+                job_description, resumes = generate_corpus(requests, page_spec, seed=page_count)
+                for name, batch in ((f"POST /analyze[{page_count}p]", resumes),
+                                    (f"POST /analyze[{page_count}p, cached]", resumes)):
+                    latencies = await _post_all(client, job_description, batch)
+                    results[name] = {
+                        'median_ms': statistics.median(latencies) * 1000,
+                        'p99_ms': percentile(latencies, 99) * 1000,
+                        'requests': len(latencies),
+                    }
+    return results
+
+
+def endpoint_benchmarks(pages: List[int], spec: ResumeSpec, requests: int) -> Dict[str, Dict]:
+    """Run the /analyze benchmarks against fresh, temporary stores"""
+    with tempfile.TemporaryDirectory() as directory:
+        # main reads its configuration on import
+        os.environ['ATS_RESUME_STORE_DB'] = os.path.join(directory, 'resumes.db')
+        os.environ['ATS_RESULT_CACHE_DB'] = ''
+        return asyncio.run(_analyze_endpoint(pages, spec, requests))
+
+
+def environment() -> Dict:
+    """Where and on what the suite ran"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'executor': os.getenv('ATS_ANALYZE_EXECUTOR', 'process'),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Print median changes against a baseline; return the regressions"""
+    regressions = []
+    print(f"\n{'benchmark':<44} {'base ms':>10} {'now ms':>10} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]['median_ms'], result['median_ms']
+        change = after / before - 1 if before else 0.0
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:<44} {before:>10.3f} {after:>10.3f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--out', default='benchmark-results.json')
+    parser.add_argument('--pages', default='1,5,20')
+    parser.add_argument('--keyword-density', type=float, default=0.2)
+    parser.add_argument('--skills', type=int, default=15)
+    parser.add_argument('--repeat', type=int, default=5, help='timing repeats per method')
+    parser.add_argument('--requests', type=int, default=20, help='/analyze requests per page count')
+    parser.add_argument('--skip-endpoint', action='store_true', help='only run the method benchmarks')
+    parser.add_argument('--compare', help='baseline JSON from an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='allowed slowdown of a median before failing, e.g. 0.15 = 15%%')
+    args = parser.parse_args()
+
+    pages = [int(value) for value in args.pages.split(',')]
+    spec = ResumeSpec(keyword_density=args.keyword_density, skills=args.skills)
+
+    results = scorer_benchmarks(pages, spec, args.repeat)
+    if not args.skip_endpoint:
+        results.update(endpoint_benchmarks(pages, spec, args.requests))
+
+    for name, result in results.items():
+        print(f"{name:<44} {result['median_ms']:>10.3f} ms")
+
+    report = {
+        'environment': environment(),
+        'parameters': vars(args),
+        'results': results,
+    }
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than {args.threshold:.0%}: "
+                  f"{', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Text analysis profile on large resumes
+
+Times extract_resume_features stage by stage (keywords, structure,
+formatting, skills) on synthetic resumes of growing size, then runs it
+under cProfile and prints the most expensive functions. Run it before and
+after a change to the text pipeline to see where the time went.
+
+    python -m benchmarks.text_analysis --pages 5,20,50 --top 15
+"""
+
+import argparse
+import cProfile
+import pstats
+import random
+import statistics
+import time
+
+from benchmarks.corpus import ResumeSpec, generate_job_description, generate_resume_text
+from metrics import StageTimer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', default='5,20,50')
+    parser.add_argument('--runs', type=int, default=30, help='analyses per resume size')
+    parser.add_argument('--top', type=int, default=15, help='functions listed per profile')
+    parser.add_argument('--sort', default='tottime', help='pstats sort key')
+    parser.add_argument('--out', help='write the last profile here for snakeviz and friends')
+    args = parser.parse_args()
+
+    from ats import ATSScorer
+
+    # Large resumes are cut at pdf_max_chars before analysis, so lift it
+    scorer = ATSScorer(pdf_max_chars=0)
+    rng = random.Random(0)
+    job_description = generate_job_description(rng)
+
+    for page_count in (int(value) for value in args.pages.split(',')):
+        text = generate_resume_text(rng, job_description, ResumeSpec(pages=page_count))
+        scorer.extract_resume_features(text)
+
+        totals = []
+        stages = {}
+        for _ in range(args.runs):
+            timer = StageTimer()
+            start = time.perf_counter()
+            scorer.extract_resume_features(text, timer)
+            totals.append(time.perf_counter() - start)
+            for name, seconds in timer.stages.items():
+                stages.setdefault(name, []).append(seconds)
+
+        print(f"\n{page_count} pages, {len(text):,} characters")
+        print(f"  {'total':<12} {statistics.median(totals) * 1000:>9.3f} ms")
+        for name, samples in stages.items():
+            print(f"  {name:<12} {statistics.median(samples) * 1000:>9.3f} ms")
+
+        profile = cProfile.Profile()
+        profile.enable()
+        for _ in range(args.runs):
+            scorer.extract_resume_features(text)
+        profile.disable()
+        stats = pstats.Stats(profile)
+        stats.sort_stats(args.sort).print_stats(args.top)
+        if args.out:
+            stats.dump_stats(args.out)
+
+
+if __name__ == '__main__':
+    main()
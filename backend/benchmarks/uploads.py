@@ -0,0 +1,265 @@
+"""
+Concurrent upload load test with a memory ceiling
+
+Starts its own server, then sends bursts of uploads to /analyze while it
+samples the web process's resident memory (Linux /proc; the memory of analysis
+worker processes is not included):
+
+- oversized: bodies over the request size limit, with Content-Length
+- oversized-chunked: the same bodies streamed without a Content-Length
+- flood: valid resumes padded to --upload-mb, more than the in-flight byte
+  budget and the concurrency cap admit at once
+
+For each burst it reports the responses by status, the p50/p99 latency of
+rejections and successes, and the peak RSS above the idle server's. With
+--no-admission the limits are lifted to show the memory the same bursts
+cost without them. Exits with status 1 when --max-rss-growth-mb is exceeded.
+
+    python -m benchmarks.uploads --requests 64 --upload-mb 8 --max-rss-growth-mb 400
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from benchmarks.fixtures import SAMPLE_JOB_DESCRIPTION, sample_resume_text
+from benchmarks.load import percentile
+from benchmarks.startup import free_port
+
+MB = 1024 * 1024
+BOUNDARY = 'ats-upload-benchmark'
+CHUNK_SIZE = 64 * 1024
+
+
+def rss_bytes(pid: int) -> int:
+    """Resident set size of a process, from /proc (Linux only)"""
+    with open(f'/proc/{pid}/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class RSSSampler:
+    """Highest RSS of a process seen while the sampler runs"""
+
+    def __init__(self, pid: int, interval: float = 0.01):
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, rss_bytes(self.pid))
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RSSSampler":
+        self.peak = rss_bytes(self.pid)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def form_head(filename: str) -> bytes:
+    """Multipart fields up to the start of the resume's content"""
+    return (f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="job_description"\r\n\r\n'
+            f'{SAMPLE_JOB_DESCRIPTION}\r\n'
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="resume"; filename="{filename}"\r\n'
+            f'Content-Type: text/plain\r\n\r\n').encode()
+
+
+FORM_TAIL = f'\r\n--{BOUNDARY}--\r\n'.encode()
+
+
+async def form_body(head: bytes, size: int) -> AsyncIterator[bytes]:
+    """A form whose resume is head followed by blank padding up to size bytes
+
+    The padding chunk is shared, so the client holds one chunk whatever the
+    size of the upload.
+    """
+    padding = b' ' * (CHUNK_SIZE - 1) + b'\n'
+    yield form_head('resume.txt') + head
+    remaining = size - len(head)
+    while remaining > 0:
+        chunk = padding[:remaining]
+        remaining -= len(chunk)
+        yield chunk
+    yield FORM_TAIL
+
+
+async def read_status(reader: asyncio.StreamReader) -> str:
+    """Status code of the next response head, skipping its header lines"""
+    status_line = await reader.readline()
+    while (await reader.readline()).strip():
+        pass
+    parts = status_line.split()
+    return parts[1].decode() if len(parts) > 1 else 'closed'
+
+
+async def post_form(host: str, port: int, head: bytes, size: int,
+                    declare_length: bool) -> str:
+    """POST one upload over a raw connection and return the response status
+
+    Like curl, the client sends Expect: 100-continue and only sends the body
+    once the server asks for it, so a request rejected up front never sends
+    it. A rejection made while the body is arriving is read as soon as the
+    server sends it, not after the upload ends.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    lines = ['POST /analyze HTTP/1.1', f'Host: {host}', 'Connection: close',
+             'Expect: 100-continue', f'Content-Type: multipart/form-data; boundary={BOUNDARY}']
+    if declare_length:
+        length = len(form_head('resume.txt')) + max(size, len(head)) + len(FORM_TAIL)
+        lines.append(f'Content-Length: {length}')
+    else:
+        lines.append('Transfer-Encoding: chunked')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+
+    async def send_body() -> None:
+        async for chunk in form_body(head, size):
+            writer.write(chunk if declare_length else b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            await writer.drain()
+        if not declare_length:
+            writer.write(b'0\r\n\r\n')
+            await writer.drain()
+
+    sender = None
+    try:
+        status = await read_status(reader)
+        if status == '100':
+            sender = asyncio.create_task(send_body())
+            status = await read_status(reader)
+    finally:
+        if sender is not None:
+            sender.cancel()
+            # The server may close the connection while the body is still
+            # being sent, right after answering
+            await asyncio.gather(sender, return_exceptions=True)
+        writer.close()
+    return status
+
+
+async def upload_burst(port: int, requests: int, size: int, declare_length: bool,
+                       unique: bool) -> Dict:
+    """Send `requests` uploads of size bytes at once"""
+    statuses: Dict[str, int] = {}
+    latencies: Dict[str, List[float]] = {'rejected': [], 'ok': []}
+    resume = sample_resume_text(2)
+
+    async def one(number: int) -> None:
+        # Unique resumes are analysed rather than served from the result cache
+        head = (f"Candidate {number}\n{resume}" if unique else resume).encode()
+        start = time.perf_counter()
+        try:
+            status = await post_form('127.0.0.1', port, head, size, declare_length)
+        except OSError as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - start
+        statuses[status] = statuses.get(status, 0) + 1
+        latencies['ok' if status == '200' else 'rejected'].append(elapsed)
+
+    await asyncio.gather(*(one(number) for number in range(requests)))
+
+    return {
+        'statuses': dict(sorted(statuses.items())),
+        'rejected_p50_ms': percentile(latencies['rejected'], 50) * 1000,
+        'rejected_p99_ms': percentile(latencies['rejected'], 99) * 1000,
+        'ok_p50_ms': percentile(latencies['ok'], 50) * 1000,
+        'ok_p99_ms': percentile(latencies['ok'], 99) * 1000,
+    }
+
+
+def start_server(env: Dict[str, str], timeout: float) -> subprocess.Popen:
+    """Launch uvicorn and wait for /health"""
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--port', env['BENCHMARK_PORT'],
+         '--log-level', 'warning'],
+        env=env,
+    )
+    url = f"http://127.0.0.1:{env['BENCHMARK_PORT']}"
+    deadline = time.monotonic() + timeout
+    while True:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with status {server.returncode}")
+        if time.monotonic() > deadline:
+            server.terminate()
+            raise RuntimeError(f"Server did not answer /health within {timeout:g}s")
+        try:
+            if httpx.get(f"{url}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=64, help='uploads per burst')
+    parser.add_argument('--upload-mb', type=float, default=8, help='size of each valid upload')
+    parser.add_argument('--oversized-mb', type=float, default=50, help='size of each oversized upload')
+    parser.add_argument('--max-inflight-mb', type=float, default=64, help='server byte budget')
+    parser.add_argument('--max-concurrent', type=int, default=16, help='server analysis cap')
+    parser.add_argument('--no-admission', action='store_true',
+                        help='lift the request size limit, byte budget and concurrency cap')
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--max-rss-growth-mb', type=float, default=0, help='0 disables the check')
+    args = parser.parse_args()
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ,
+                   BENCHMARK_PORT=str(port),
+                   ATS_RESUME_STORE_DB=os.path.join(directory, 'resumes.db'),
+                   ATS_JOB_QUEUE_DB=os.path.join(directory, 'jobs.db'),
+                   ATS_RESULT_CACHE_DB='',
+                   ATS_MAX_INFLIGHT_BYTES=str(int(args.max_inflight_mb * MB)),
+                   ATS_MAX_CONCURRENT_ANALYSES=str(args.max_concurrent))
+        if args.no_admission:
+            env.update(ATS_MAX_REQUEST_SIZE=str(1 << 40), ATS_MAX_INFLIGHT_BYTES='0',
+                       ATS_MAX_CONCURRENT_ANALYSES='0')
+        server = start_server(env, args.timeout)
+        bursts = [
+            ('oversized', int(args.oversized_mb * MB), True, False),
+            ('oversized-chunked', int(args.oversized_mb * MB), False, False),
+            ('flood', int(args.upload_mb * MB), True, True),
+        ]
+        growth: Optional[float] = None
+        try:
+            # One analysis first, so imports and warm-up are in the baseline
+            asyncio.run(upload_burst(port, 1, 1024, True, False))
+            baseline = rss_bytes(server.pid)
+            print(f"idle server RSS {baseline / MB:.1f} MB")
+            print(f"{'burst':<18} {'peak +MB':>9} {'reject p50':>11} {'reject p99':>11} "
+                  f"{'ok p50':>9} {'ok p99':>9}  statuses")
+            for name, size, declare_length, unique in bursts:
+                with RSSSampler(server.pid) as sampler:
+                    result = asyncio.run(upload_burst(port, args.requests, size, declare_length, unique))
+                burst_growth = (sampler.peak - baseline) / MB
+                growth = burst_growth if growth is None else max(growth, burst_growth)
+                print(f"{name:<18} {burst_growth:>9.1f} {result['rejected_p50_ms']:>11.1f} "
+                      f"{result['rejected_p99_ms']:>11.1f} {result['ok_p50_ms']:>9.1f} "
+                      f"{result['ok_p99_ms']:>9.1f}  {result['statuses']}")
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.max_rss_growth_mb and growth is not None and growth > args.max_rss_growth_mb:
+        print(f"FAIL: peak RSS grew {growth:.1f} MB, limit {args.max_rss_growth_mb:g} MB")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Bulk scoring engine for offline re-ranking
+
+Encodes resume keywords and skills as sparse binary matrices so that every
+resume can be scored against every job description with a couple of
+sparse matrix products instead of M x K calls to score_features.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Sequence, Union
+
+import numpy as np
+from scipy import sparse
+
+from ats import ATSScorer, JobProfile, ResumeFeatures
+
+
+@dataclass
+class BulkScores:
+    """M x K score matrices (resumes x job descriptions), unrounded"""
+    overall: np.ndarray
+    keyword_match: np.ndarray
+    skill_match: np.ndarray
+    structure: np.ndarray
+
+
+def _binary_matrix(rows: Iterable[Iterable[Hashable]], vocabulary: Dict[Hashable, int]) -> sparse.csr_matrix:
+    """One row per term collection; columns are vocabulary terms present in it"""
+    indptr = [0]
+    indices: List[int] = []
+    for terms in rows:
+        indices.extend({vocabulary[term] for term in terms if term in vocabulary})
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(vocabulary)))
+
+
+def _skill_terms(skills: Dict[str, List[str]]) -> List[tuple]:
+    """(category, skill) pairs, the unit analyze_skill_gaps counts"""
+    return [(category, skill) for category, category_skills in skills.items()
+            for skill in category_skills]
+
+
+def _percentages(overlap: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    """overlap / totals * 100 per column, 0 where a job has no terms"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = overlap / totals[np.newaxis, :] * 100
+    result[:, totals == 0] = 0
+    return result
+
+
+class BulkScorer:
+    """Scores many resumes against many job descriptions at once"""
+
+    def __init__(self, scorer: ATSScorer):
+        self.scorer = scorer
+
+    def score(self, resumes: Sequence[ResumeFeatures],
+              jobs: Sequence[Union[str, JobProfile]]) -> BulkScores:
+        """Score every resume against every job
+
+        Matches ATSScorer.score_features cell by cell: keyword match over
+        the job's keyword set, the 0.7/0.3 keyword/structure blend and the
+        skill match percentage of analyze_skill_gaps.
+        """
+        profiles = [job if isinstance(job, JobProfile) else self.scorer.get_job_profile(job)
+                    for job in jobs]
+
+        # Only terms some job asks for can ever match, so they are the columns
+        keyword_vocabulary: Dict[Hashable, int] = {}
+        skill_vocabulary: Dict[Hashable, int] = {}
+        for profile in profiles:
+            for keyword in profile.keyword_set:
+                keyword_vocabulary.setdefault(keyword, len(keyword_vocabulary))
+            for term in _skill_terms(profile.skills):
+                skill_vocabulary.setdefault(term, len(skill_vocabulary))
+
+        resume_keywords = _binary_matrix((features.keywords for features in resumes), keyword_vocabulary)
+        job_keywords = _binary_matrix((profile.keyword_set for profile in profiles), keyword_vocabulary)
+        resume_skills = _binary_matrix((_skill_terms(features.skills) for features in resumes), skill_vocabulary)
+        job_skills = _binary_matrix((_skill_terms(profile.skills) for profile in profiles), skill_vocabulary)
+
+        keyword_overlap = (resume_keywords @ job_keywords.T).toarray()
+        skill_overlap = (resume_skills @ job_skills.T).toarray()
+
+        keyword_match = _percentages(keyword_overlap, np.asarray(job_keywords.sum(axis=1)).ravel())
+        skill_match = _percentages(skill_overlap, np.asarray(job_skills.sum(axis=1)).ravel())
+        structure = np.array([self.scorer.calculate_structure_score(features.sections_found)
+                              for features in resumes], dtype=np.float64)
+
+        overall = (keyword_match * 0.7) + (structure[:, np.newaxis] * 0.3)
+        return BulkScores(overall=overall, keyword_match=keyword_match,
+                          skill_match=skill_match, structure=structure)
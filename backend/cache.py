@@ -0,0 +1,242 @@
+"""
+Caching helpers for the ATS backend
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Hashable, Optional, Union
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and collapse whitespace so trivial edits share a key"""
+    return ' '.join(text.lower().split())
+
+
+def text_key(text: str) -> str:
+    """SHA-256 hex digest of normalized text"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def content_hash(data: Union[bytes, BinaryIO]) -> str:
+    """SHA-256 hex digest of bytes or of a seekable file's whole content"""
+    if isinstance(data, (bytes, bytearray)):
+        return hashlib.sha256(data).hexdigest()
+    digest = hashlib.sha256()
+    data.seek(0)
+    for chunk in iter(lambda: data.read(1024 * 1024), b''):
+        digest.update(chunk)
+    data.seek(0)
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry"""
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value or None, counting the hit or miss"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        """Drop one entry; returns whether it was there"""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class SQLiteCache:
+    """Persistent key -> JSON store tagged with a version
+
+    Entries written under any other version are deleted when the store is
+    opened or switched to a new version, so bumping the version invalidates
+    everything stale. Expired entries, and the oldest beyond maxsize (0 = no
+    limit), are deleted when it is opened and every PRUNE_INTERVAL writes.
+    """
+
+    PRUNE_INTERVAL = 64
+
+    def __init__(self, path: str, version: str, ttl: Optional[float] = None,
+                 maxsize: int = 0):
+        self.path = path
+        self.version = version
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, version TEXT NOT NULL, '
+                'value TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS entries_created_at ON entries (created_at)'
+            )
+            self._connection.execute('DELETE FROM entries WHERE version != ?', (version,))
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete expired entries and the oldest past maxsize; call with the lock held"""
+        if self.ttl:
+            self._connection.execute('DELETE FROM entries WHERE created_at < ?',
+                                     (time.time() - self.ttl,))
+        if self.maxsize:
+            # OFFSET skips the newest maxsize rows; LIMIT -1 is all the rest
+            self._connection.execute(
+                'DELETE FROM entries WHERE key IN (SELECT key FROM entries '
+                'ORDER BY created_at DESC LIMIT -1 OFFSET ?)', (self.maxsize,)
+            )
+
+    def set_version(self, version: str) -> None:
+        """Write and read under a new version, deleting every other one's entries"""
+        with self._lock, self._connection:
+            self.version = version
+            self._connection.execute('DELETE FROM entries WHERE version != ?', (version,))
+
+    def get(self, key: str) -> Any:
+        """Return the decoded value or None if missing or expired"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value, created_at FROM entries WHERE key = ? AND version = ?',
+                (key, self.version)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if self.ttl and created_at + self.ttl < time.time():
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO entries (key, version, value, created_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, self.version, json.dumps(value), time.time())
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_INTERVAL == 0:
+                self._prune()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+class ResultCache:
+    """Analysis results keyed by resume content, job description and scorer version
+
+    An in-process LRU sits in front of an optional SQLite tier that survives
+    restarts and holds up to disk_maxsize results (0 = no limit).
+    """
+
+    def __init__(self, version: str, maxsize: int = 1024, ttl: Optional[float] = None,
+                 db_path: Optional[str] = None, disk_maxsize: int = 0):
+        self.version = version
+        self.memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.disk = SQLiteCache(db_path, version, ttl, disk_maxsize) if db_path else None
+        self.disk_hits = 0
+
+    def set_version(self, version: str) -> None:
+        """Switch to a new scorer version, dropping entries of older ones"""
+        self.version = version
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.set_version(version)
+
+    def key(self, resume_digest: str, job_description: str,
+            version: Optional[str] = None) -> str:
+        """Cache key for a resume digest and a job description
+
+        version defaults to the current one; a result produced under
+        another is only ever found by lookups made under that version.
+        """
+        return f"{version or self.version}:{resume_digest}:{text_key(job_description)}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached result, promoting disk hits to memory"""
+        result = self.memory.get(key)
+        if result is None and self.disk is not None:
+            result = self.disk.get(key)
+            if result is not None:
+                self.disk_hits += 1
+                self.memory.set(key, result)
+        return dict(result) if result is not None else None
+
+    def set(self, key: str, result: Dict) -> None:
+        """Store a successful result in every tier"""
+        result = dict(result)
+        self.memory.set(key, result)
+        if self.disk is not None:
+            self.disk.set(key, result)
+
+    def close(self) -> None:
+        """Close the disk tier"""
+        if self.disk is not None:
+            self.disk.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory tier counters plus disk tier hits"""
+        stats = self.memory.stats()
+        stats['version'] = self.version
+        stats['disk_enabled'] = self.disk is not None
+        stats['disk_hits'] = self.disk_hits
+        return stats
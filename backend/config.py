@@ -0,0 +1,135 @@
+"""
+Runtime configuration for the ATS backend
+Values are read from environment variables so each deployment can tune them
+"""
+
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment"""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+# Analysis execution: "process" (CPU-bound work in a process pool),
+# "thread" (thread pool) or "inline" (run on the event loop, debugging only)
+ANALYZE_EXECUTOR = os.getenv("ATS_ANALYZE_EXECUTOR", "process")
+ANALYZE_WORKERS = _env_int("ATS_ANALYZE_WORKERS", os.cpu_count() or 1)
+
+# Start workers and import the PDF library in the background right after
+# startup (1) or leave it to the first request (0)
+WARM_POOL = _env_int("ATS_WARM_POOL", 1)
+
+# Largest accepted resume upload, in bytes
+MAX_UPLOAD_SIZE = _env_int("ATS_MAX_UPLOAD_SIZE", 10 * 1024 * 1024)
+
+# Resumes accepted by one /analyze/batch request
+BATCH_MAX_FILES = _env_int("ATS_BATCH_MAX_FILES", 500)
+
+# Largest request body, enforced while it is received: for single-resume
+# routes (the file plus form fields) and for batch uploads (/analyze/batch,
+# /jobs)
+MAX_REQUEST_SIZE = _env_int("ATS_MAX_REQUEST_SIZE", MAX_UPLOAD_SIZE + 1024 * 1024)
+BATCH_MAX_REQUEST_SIZE = _env_int("ATS_BATCH_MAX_REQUEST_SIZE", 100 * 1024 * 1024)
+
+# Request body bytes one web process holds at once before uploads get 503
+# (0 = no budget), and analysis requests it handles at once before they
+# get 429 (0 = no limit)
+MAX_INFLIGHT_BYTES = _env_int("ATS_MAX_INFLIGHT_BYTES", 256 * 1024 * 1024)
+MAX_CONCURRENT_ANALYSES = _env_int("ATS_MAX_CONCURRENT_ANALYSES", 64)
+
+# Longest job description accepted, in characters (0 = no limit); each new
+# one is tokenized and skill-matched in full before any resume is scored
+JOB_DESCRIPTION_MAX_CHARS = _env_int("ATS_JOB_DESCRIPTION_MAX_CHARS", 50_000)
+
+# Requests allowed to wait for a worker before /analyze answers 503
+ANALYZE_QUEUE_SIZE = _env_int("ATS_ANALYZE_QUEUE_SIZE", 16)
+
+# Seconds a single analysis may take before /analyze answers 504
+ANALYZE_TIMEOUT = _env_float("ATS_ANALYZE_TIMEOUT", 30.0)
+
+# Compiled job description profiles kept in memory
+JOB_CACHE_SIZE = _env_int("ATS_JOB_CACHE_SIZE", 256)
+JOB_CACHE_TTL = _env_float("ATS_JOB_CACHE_TTL", 3600.0)
+
+# PDF extraction limits per document (0 disables a limit)
+PDF_MAX_PAGES = _env_int("ATS_PDF_MAX_PAGES", 50)
+PDF_MAX_CHARS = _env_int("ATS_PDF_MAX_CHARS", 200_000)
+PDF_TIME_BUDGET = _env_float("ATS_PDF_TIME_BUDGET", 10.0)
+
+# PDF extraction backends, tried in order; ones not installed are skipped
+PDF_BACKENDS = os.getenv("ATS_PDF_BACKENDS", "pymupdf,pypdf2,pypdf,pdfminer").split(",")
+
+# Analysis results for identical resume + job description submissions;
+# set ATS_RESULT_CACHE_DB to a file path to keep them across restarts
+RESULT_CACHE_SIZE = _env_int("ATS_RESULT_CACHE_SIZE", 1024)
+RESULT_CACHE_TTL = _env_float("ATS_RESULT_CACHE_TTL", 86400.0)
+RESULT_CACHE_DB = os.getenv("ATS_RESULT_CACHE_DB", "")
+RESULT_CACHE_DB_SIZE = _env_int("ATS_RESULT_CACHE_DB_SIZE", 100_000)
+
+# SQLite file holding extracted text and features of stored resumes
+RESUME_STORE_DB = os.getenv("ATS_RESUME_STORE_DB", "resumes.db")
+
+# Also store resumes sent to /analyze (1), not only those sent to
+# POST /resumes (0); stored resumes are listed by /resumes/search
+STORE_ANALYZED_RESUMES = _env_int("ATS_STORE_ANALYZED_RESUMES", 0)
+
+# Stored resumes kept, oldest dropped first (0 = no limit), and seconds
+# one is kept (0 = forever)
+RESUME_STORE_MAX = _env_int("ATS_RESUME_STORE_MAX", 100_000)
+RESUME_STORE_RETENTION = _env_float("ATS_RESUME_STORE_RETENTION", 30 * 86400.0)
+
+# Background jobs (POST /jobs): SQLite queue file, worker processes this
+# web process scores queued resumes on (0 = leave the queue to other
+# processes sharing the file) and resumes of one job scored at once
+# (0 = no limit)
+JOB_QUEUE_DB = os.getenv("ATS_JOB_QUEUE_DB", "jobs.db")
+JOB_WORKERS = _env_int("ATS_JOB_WORKERS", max(1, (os.cpu_count() or 1) // 2))
+JOB_CONCURRENCY = _env_int("ATS_JOB_CONCURRENCY", 0)
+
+# Jobs waiting or running before POST /jobs answers 503
+JOB_MAX_PENDING = _env_int("ATS_JOB_MAX_PENDING", 100)
+
+# Tries per resume, seconds before the first retry (doubling after that),
+# seconds one resume may take and seconds finished jobs are kept
+JOB_MAX_ATTEMPTS = _env_int("ATS_JOB_MAX_ATTEMPTS", 3)
+JOB_RETRY_DELAY = _env_float("ATS_JOB_RETRY_DELAY", 2.0)
+JOB_TIMEOUT = _env_float("ATS_JOB_TIMEOUT", 300.0)
+JOB_RETENTION = _env_float("ATS_JOB_RETENTION", 86400.0)
+
+# Skill taxonomy JSON file (unset = skills.json next to the code) and how
+# often every process checks it for changes, in seconds (0 = never)
+SKILL_TAXONOMY = os.getenv("ATS_SKILL_TAXONOMY", "")
+TAXONOMY_CHECK_INTERVAL = _env_float("ATS_TAXONOMY_CHECK_INTERVAL", 5.0)
+
+# Token expected in the X-Admin-Token header of /admin endpoints; they are
+# disabled while it is unset
+ADMIN_TOKEN = os.getenv("ATS_ADMIN_TOKEN", "")
+
+# Token expected in the X-Recruiter-Token header of /resumes/search, which
+# lists stored candidates; the admin token is accepted too, and search is
+# disabled while neither is set
+RECRUITER_TOKEN = os.getenv("ATS_RECRUITER_TOKEN", "")
+
+# Semantic similarity scoring (off unless a sentence-transformers model is set)
+SEMANTIC_MODEL = os.getenv("ATS_SEMANTIC_MODEL", "")
+SEMANTIC_WEIGHT = _env_float("ATS_SEMANTIC_WEIGHT", 0.3)
+SEMANTIC_STORE_DB = os.getenv("ATS_SEMANTIC_STORE_DB", "embeddings.db")
+
+# Live editing sessions (/sessions), kept in memory by each web process:
+# sessions held at once, seconds an untouched session is kept and the
+# longest resume text a session accepts
+LIVE_SESSIONS = _env_int("ATS_LIVE_SESSIONS", 256)
+LIVE_SESSION_TTL = _env_float("ATS_LIVE_SESSION_TTL", 1800.0)
+LIVE_SESSION_MAX_CHARS = _env_int("ATS_LIVE_SESSION_MAX_CHARS", PDF_MAX_CHARS)
+
+# Characters an update to a live session may insert and still be applied on
+# the event loop; larger ones run on a thread
+LIVE_EDIT_INLINE_CHARS = _env_int("ATS_LIVE_EDIT_INLINE_CHARS", 10_000)
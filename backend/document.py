@@ -0,0 +1,58 @@
+"""
+Normalized, tokenized text shared by every analysis stage
+
+A Document lowercases and tokenizes a resume or job description once. Its
+tokens are the alternating word / non-word runs the SkillMatcher consumes,
+so keyword extraction, section detection and skill matching all read the
+same token stream instead of each lowercasing and re-scanning the text.
+Character and line statistics used by the formatting checks are collected
+in the same step.
+"""
+
+import re
+from typing import List, Union
+
+from skill_matcher import split_segments
+
+_WORD_CHAR = re.compile(r'\w')
+
+# Characters that are neither word characters, whitespace nor common punctuation
+_SPECIAL_CHAR = re.compile(r'[^\w\s\-.,@()\[\]\/]')
+
+
+class Document:
+    """Text normalized and tokenized once
+
+    segments are the word and non-word runs of the lowercased text; words
+    are its word runs in order, the same tokens a regex split on non-word
+    characters would give.
+    """
+
+    __slots__ = ('text', 'lower', 'segments', 'words', 'word_set', 'lines',
+                 'special_chars', 'short_lines', 'table_markers')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.segments = split_segments(self.lower)
+        # Runs alternate, so the words are every other segment
+        starts_on_word = bool(self.segments) and _WORD_CHAR.match(self.segments[0]) is not None
+        self.words: List[str] = self.segments[0 if starts_on_word else 1::2]
+        self.word_set = frozenset(self.words)
+
+        # Special characters only occur between words, so only those runs
+        # are scanned, unless lowercasing changed the text's length (as
+        # with 'İ') and the runs no longer line up with the original
+        if len(self.lower) == len(text):
+            gaps = ''.join(self.segments[1 if starts_on_word else 0::2])
+        else:
+            gaps = text
+        self.special_chars = len(_SPECIAL_CHAR.findall(gaps))
+        self.lines = text.split('\n')
+        self.short_lines = sum(1 for line in self.lines if 0 < len(line.strip()) < 3)
+        self.table_markers = '|' in text or '\t\t' in text
+
+
+def as_document(text: Union[str, Document]) -> Document:
+    """Tokenize text, or pass an existing Document through"""
+    return text if isinstance(text, Document) else Document(text)
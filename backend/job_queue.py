@@ -0,0 +1,407 @@
+"""
+Durable job queue for analyses too long for one HTTP request
+
+A job is one job description and the resumes to score against it. Jobs and
+their resumes are kept in SQLite, so queued work survives restarts and no
+broker is needed. A JobRunner in each web process claims resumes one at a
+time and scores them on its own pool of worker processes; the web process
+itself only moves bytes in and out of the queue.
+
+Claims are leases: a resume whose runner died is handed out again once its
+lease expires. Failed attempts are retried with exponential backoff.
+Several processes can share one queue file, as the claim is a single
+write transaction.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set
+
+from ats import ATSScorer, analyze_resume_task, rank_results
+from worker_pool import AnalysisPool
+
+# Job statuses. 'submitting' jobs are still receiving resumes and are not
+# worked on; 'completed' means every resume has a result, failed or not.
+SUBMITTING, QUEUED, RUNNING, COMPLETED, CANCELLED = (
+    'submitting', 'queued', 'running', 'completed', 'cancelled'
+)
+# Resume statuses within a job
+ITEM_STATUSES = ('queued', 'running', 'succeeded', 'failed', 'cancelled')
+
+
+@dataclass
+class JobItem:
+    """One claimed resume of a job"""
+    job_id: str
+    position: int
+    filename: str
+    resume: bytes
+    attempts: int
+    job_description: str
+
+
+class JobQueue:
+    """SQLite-backed queue of jobs and their resumes"""
+
+    def __init__(self, path: str, max_attempts: int = 3, retry_delay: float = 2.0,
+                 lease: float = 300.0, per_job_limit: int = 0):
+        self.path = path
+        # Tries per resume before it is reported as failed
+        self.max_attempts = max(1, max_attempts)
+        # Seconds before the first retry; doubled for each further one
+        self.retry_delay = retry_delay
+        # Seconds a claimed resume may run before another runner may take it
+        self.lease = lease
+        # Resumes of one job running at once (0 = no limit)
+        self.per_job_limit = per_job_limit
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, job_description TEXT NOT NULL, '
+                'created_at REAL NOT NULL, started_at REAL, finished_at REAL);'
+                'CREATE TABLE IF NOT EXISTS job_items ('
+                'job_id TEXT NOT NULL, position INTEGER NOT NULL, filename TEXT, resume BLOB, '
+                'status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, '
+                'available_at REAL NOT NULL DEFAULT 0, lease_until REAL, result TEXT, '
+                'PRIMARY KEY (job_id, position));'
+                'CREATE INDEX IF NOT EXISTS job_items_by_status ON job_items (status, available_at);'
+                'CREATE INDEX IF NOT EXISTS job_items_by_job ON job_items (job_id, status);'
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that also excludes other processes"""
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def create(self, job_description: str) -> str:
+        """Start a job; add its resumes, then open() it"""
+        job_id = uuid.uuid4().hex
+        with self._transaction() as connection:
+            connection.execute(
+                'INSERT INTO jobs (id, status, job_description, created_at) VALUES (?, ?, ?, ?)',
+                (job_id, SUBMITTING, job_description, time.time())
+            )
+        return job_id
+
+    def add_item(self, job_id: str, position: int, filename: str,
+                 resume: Optional[bytes] = None, error: Optional[str] = None) -> None:
+        """Add a resume to a job, or record why it could not be read"""
+        if error is None:
+            status, result = 'queued', None
+        else:
+            failed = ATSScorer.error_result(error)
+            failed.update(index=position, filename=filename)
+            status, result = 'failed', json.dumps(failed)
+        with self._transaction() as connection:
+            connection.execute(
+                'INSERT INTO job_items (job_id, position, filename, resume, status, result) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, position, filename, resume, status, result)
+            )
+
+    def open(self, job_id: str) -> None:
+        """Make a fully submitted job available to runners"""
+        with self._transaction() as connection:
+            connection.execute('UPDATE jobs SET status = ? WHERE id = ? AND status = ?',
+                               (QUEUED, job_id, SUBMITTING))
+            self._complete_finished(connection, time.time())
+
+    def delete(self, job_id: str) -> None:
+        """Remove a job and its resumes"""
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM job_items WHERE job_id = ?', (job_id,))
+            connection.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+
+    def pending(self) -> int:
+        """Jobs not yet completed or cancelled"""
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM jobs WHERE status IN (?, ?, ?)', (SUBMITTING, QUEUED, RUNNING)
+            ).fetchone()[0]
+
+    def claim(self) -> Optional[JobItem]:
+        """Lease the next resume to score, or None when nothing is due
+
+        Jobs with the fewest resumes running go first, so one large job
+        cannot hold every worker while smaller ones wait.
+        """
+        now = time.time()
+        running = "(SELECT COUNT(*) FROM job_items r WHERE r.job_id = j.id AND r.status = 'running')"
+        with self._transaction() as connection:
+            self._expire_leases(connection, now)
+            job = connection.execute(
+                'SELECT j.id, j.job_description FROM jobs j WHERE j.status IN (?, ?) '
+                f'AND (? = 0 OR {running} < ?) AND EXISTS (SELECT 1 FROM job_items q '
+                "WHERE q.job_id = j.id AND q.status = 'queued' AND q.available_at <= ?) "
+                f'ORDER BY {running}, j.created_at LIMIT 1',
+                (QUEUED, RUNNING, self.per_job_limit, self.per_job_limit, now)
+            ).fetchone()
+            if job is None:
+                return None
+            job_id, job_description = job
+            row = connection.execute(
+                'SELECT position, filename, resume, attempts FROM job_items '
+                "WHERE job_id = ? AND status = 'queued' AND available_at <= ? "
+                'ORDER BY position LIMIT 1', (job_id, now)
+            ).fetchone()
+            item = JobItem(job_id, *row, job_description)
+            item.attempts += 1
+            connection.execute(
+                "UPDATE job_items SET status = 'running', attempts = ?, lease_until = ? "
+                'WHERE job_id = ? AND position = ?',
+                (item.attempts, now + self.lease, item.job_id, item.position)
+            )
+            connection.execute(
+                'UPDATE jobs SET status = ?, started_at = COALESCE(started_at, ?) '
+                'WHERE id = ? AND status = ?', (RUNNING, now, item.job_id, QUEUED)
+            )
+        return item
+
+    def _expire_leases(self, connection: sqlite3.Connection, now: float) -> None:
+        """Hand out again resumes whose runner stopped, or fail them when out of tries"""
+        expired = connection.execute(
+            "SELECT job_id, position, filename, attempts FROM job_items "
+            "WHERE status = 'running' AND lease_until < ?", (now,)
+        ).fetchall()
+        for job_id, position, filename, attempts in expired:
+            if attempts < self.max_attempts:
+                self._requeue(connection, job_id, position, now)
+            else:
+                self._set_result(connection, job_id, position, 'failed', ATSScorer.error_result(
+                    f"Analysis did not finish after {attempts} attempts"
+                ), filename)
+        if expired:
+            self._complete_finished(connection, now)
+
+    def retry(self, item: JobItem, error: Exception) -> bool:
+        """Requeue a failed attempt with backoff; False once out of tries"""
+        if item.attempts >= self.max_attempts:
+            self.finish(item, ATSScorer.error_result(error))
+            return False
+        available_at = time.time() + self.retry_delay * 2 ** (item.attempts - 1)
+        with self._transaction() as connection:
+            self._requeue(connection, item.job_id, item.position, available_at)
+        return True
+
+    @staticmethod
+    def _requeue(connection: sqlite3.Connection, job_id: str, position: int,
+                 available_at: float) -> None:
+        """Queue a running resume for another attempt
+
+        Runners never claim from a cancelled job, so a resume of one is
+        cancelled instead and its bytes dropped.
+        """
+        cancelled = connection.execute(
+            'SELECT 1 FROM jobs WHERE id = ? AND status = ?', (job_id, CANCELLED)
+        ).fetchone()
+        if cancelled:
+            connection.execute(
+                "UPDATE job_items SET status = 'cancelled', resume = NULL, lease_until = NULL "
+                "WHERE job_id = ? AND position = ? AND status = 'running'", (job_id, position)
+            )
+        else:
+            connection.execute(
+                "UPDATE job_items SET status = 'queued', available_at = ?, lease_until = NULL "
+                "WHERE job_id = ? AND position = ? AND status = 'running'",
+                (available_at, job_id, position)
+            )
+
+    def finish(self, item: JobItem, result: Dict) -> None:
+        """Record a resume's result, completing the job after its last one"""
+        status = 'succeeded' if result.get('success') else 'failed'
+        with self._transaction() as connection:
+            self._set_result(connection, item.job_id, item.position, status, result, item.filename)
+            self._complete_finished(connection, time.time())
+
+    @staticmethod
+    def _set_result(connection: sqlite3.Connection, job_id: str, position: int, status: str,
+                    result: Dict, filename: Optional[str]) -> None:
+        """Store a final result and drop the resume bytes"""
+        result = dict(result, index=position, filename=filename)
+        connection.execute(
+            'UPDATE job_items SET status = ?, result = ?, resume = NULL, lease_until = NULL '
+            'WHERE job_id = ? AND position = ?',
+            (status, json.dumps(result), job_id, position)
+        )
+
+    @staticmethod
+    def _complete_finished(connection: sqlite3.Connection, now: float) -> None:
+        """Mark open jobs with no resume left to score as completed"""
+        connection.execute(
+            'UPDATE jobs SET status = ?, finished_at = ? WHERE status IN (?, ?) AND NOT EXISTS '
+            "(SELECT 1 FROM job_items i WHERE i.job_id = jobs.id AND i.status IN ('queued', 'running'))",
+            (COMPLETED, now, QUEUED, RUNNING)
+        )
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """Cancel a job's queued resumes; returns its status, None if unknown
+
+        Resumes already being scored finish and keep their results.
+        """
+        with self._transaction() as connection:
+            row = connection.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if row is None:
+                return None
+            if row[0] in (COMPLETED, CANCELLED):
+                return row[0]
+            connection.execute(
+                "UPDATE job_items SET status = 'cancelled', resume = NULL "
+                "WHERE job_id = ? AND status = 'queued'", (job_id,)
+            )
+            connection.execute('UPDATE jobs SET status = ?, finished_at = ? WHERE id = ?',
+                               (CANCELLED, time.time(), job_id))
+        return CANCELLED
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Status and progress of a job; results once it is completed or cancelled"""
+        with self._lock:
+            job = self._connection.execute(
+                'SELECT status, created_at, started_at, finished_at FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            counts = dict(self._connection.execute(
+                'SELECT status, COUNT(*) FROM job_items WHERE job_id = ? GROUP BY status', (job_id,)
+            ).fetchall())
+            status = job[0]
+            results = None
+            if status in (COMPLETED, CANCELLED):
+                results = [json.loads(result) for (result,) in self._connection.execute(
+                    'SELECT result FROM job_items WHERE job_id = ? AND result IS NOT NULL '
+                    'ORDER BY position', (job_id,)
+                )]
+
+        progress = {name: counts.get(name, 0) for name in ITEM_STATUSES}
+        progress['total'] = sum(counts.values())
+        progress['done'] = progress['succeeded'] + progress['failed']
+        progress['percent'] = (round(progress['done'] / progress['total'] * 100, 1)
+                               if progress['total'] else 0.0)
+        report = {
+            'job_id': job_id,
+            'status': status,
+            'created_at': job[1],
+            'started_at': job[2],
+            'finished_at': job[3],
+            'progress': progress,
+        }
+        if results is not None:
+            report['results'] = rank_results(results)
+        return report
+
+    def purge(self, older_than: float) -> int:
+        """Delete jobs finished (or abandoned while submitting) before a time"""
+        with self._transaction() as connection:
+            job_ids = [job_id for (job_id,) in connection.execute(
+                'SELECT id FROM jobs WHERE (status IN (?, ?) AND finished_at < ?) '
+                'OR (status = ? AND created_at < ?)',
+                (COMPLETED, CANCELLED, older_than, SUBMITTING, older_than)
+            )]
+            for job_id in job_ids:
+                connection.execute('DELETE FROM job_items WHERE job_id = ?', (job_id,))
+                connection.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+        return len(job_ids)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Jobs and resumes by status"""
+        with self._lock:
+            jobs = dict(self._connection.execute(
+                'SELECT status, COUNT(*) FROM jobs GROUP BY status'
+            ).fetchall())
+            items = dict(self._connection.execute(
+                'SELECT status, COUNT(*) FROM job_items GROUP BY status'
+            ).fetchall())
+        return {'jobs': jobs, 'items': items}
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+class JobRunner:
+    """Claims queued resumes and scores them on a dedicated pool
+
+    At most pool.max_workers resumes are claimed at a time. The runner
+    polls for due work every poll_interval seconds, or sooner when
+    notify() is called after a job is opened.
+    """
+
+    def __init__(self, queue: JobQueue, pool: AnalysisPool, scorer: ATSScorer,
+                 poll_interval: float = 1.0, retention: float = 86400.0):
+        self.queue = queue
+        self.pool = pool
+        self.scorer = scorer
+        self.poll_interval = poll_interval
+        # Seconds finished jobs are kept for GET /jobs/{id}
+        self.retention = retention
+        self._wake = asyncio.Event()
+        self._tasks: Set[asyncio.Task] = set()
+        # Bumped whenever the pool is restarted after a worker crash
+        self._generation = 0
+
+    def notify(self) -> None:
+        """Look for work now instead of at the next poll"""
+        self._wake.set()
+
+    async def run(self) -> None:
+        """Claim and score resumes until cancelled"""
+        free = asyncio.Semaphore(self.pool.max_workers)
+        last_purge = 0.0
+        try:
+            while True:
+                if time.monotonic() - last_purge > 3600:
+                    last_purge = time.monotonic()
+                    await asyncio.to_thread(self.queue.purge, time.time() - self.retention)
+
+                await free.acquire()
+                item = await asyncio.to_thread(self.queue.claim)
+                if item is None:
+                    free.release()
+                    self._wake.clear()
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                task = asyncio.create_task(self._score(item))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                task.add_done_callback(lambda _: free.release())
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+
+    async def _score(self, item: JobItem) -> None:
+        """Score one claimed resume, retrying on worker failures"""
+        generation = self._generation
+        try:
+            job_profile = await asyncio.to_thread(self.scorer.get_job_profile, item.job_description)
+            result = await self.pool.run(analyze_resume_task, item.resume, job_profile, wait=True)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool) and generation == self._generation:
+                # A worker died (e.g. out of memory); the executor is unusable
+                self._generation += 1
+                self.pool.shutdown()
+                self.pool.start()
+            await asyncio.to_thread(self.queue.retry, item, e)
+            return
+        await asyncio.to_thread(self.queue.finish, item, result)
@@ -0,0 +1,175 @@
+"""
+Live re-scoring of a resume while it is being edited
+
+A LiveSession keeps a resume's text as lines, with totals of what every line
+contributes: the tracked words and skills it contains and its formatting
+counts. An edit replaces a range of lines, so only the removed and inserted
+lines are looked at and the totals change by their difference; the result
+is then rebuilt from the totals. An update costs time in proportion to the
+edit, not to the resume. Words and skill phrases never run across a line
+break, so the totals always equal what a full analysis of the text finds.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from ats import ATSScorer
+from document import Document
+from metrics import StageTimer
+from skill_matcher import SkillMatcher
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+# (start, end, lines): replace lines start..end-1 with lines
+LineEdit = Tuple[int, int, Sequence[str]]
+
+
+class _Line:
+    """What one line adds to a session's totals"""
+
+    __slots__ = ('words', 'skills', 'special_chars', 'short', 'table')
+
+    def __init__(self, text: str, tracked: FrozenSet[str], matcher: SkillMatcher):
+        document = Document(text)
+        self.words = document.word_set & tracked or _EMPTY
+        self.skills = frozenset(matcher.find_segments(document.segments)) or _EMPTY
+        self.special_chars = document.special_chars
+        self.short = document.short_lines
+        self.table = document.table_markers
+
+
+class LiveSession:
+    """A resume being edited, scored against one job description
+
+    Words are tracked only if they are job keywords or section headings,
+    the only words the score looks at. Semantic similarity needs the whole
+    text, so it is not blended into live scores.
+    """
+
+    def __init__(self, scorer: ATSScorer, job_description: str, text: str = '',
+                 max_chars: int = 0):
+        if max_chars and len(text) > max_chars:
+            raise ValueError(f"Resume text is longer than {max_chars} characters")
+        self.scorer = scorer
+        self.job_description = job_description
+        self.max_chars = max_chars
+        self.revision = 0
+        # Held by the web process while it updates or reads the session, so
+        # edits handed to a thread are applied and scored in order
+        self.lock = asyncio.Lock()
+        self._load(text)
+
+    def _load(self, text: str) -> None:
+        """Analyze text from scratch with the scorer's current taxonomy"""
+        self.taxonomy = self.scorer.taxonomy
+        self.job_profile = self.scorer.get_job_profile(self.job_description)
+        # Job keywords in the order the job description first uses them
+        self._job_keywords = list(dict.fromkeys(self.job_profile.keywords))
+        self._tracked = self.job_profile.keyword_set | frozenset(self.scorer.common_sections)
+
+        self.lines: List[str] = []
+        self._line_stats: List[_Line] = []
+        # Lines containing each tracked word and each skill
+        self._word_lines: Counter = Counter()
+        self._skill_lines: Counter = Counter()
+        self._chars = 0
+        self._special_chars = 0
+        self._short_lines = 0
+        self._table_lines = 0
+        self._replace(0, 0, [text])
+
+    @property
+    def characters(self) -> int:
+        """Length of the resume text"""
+        return max(0, self._chars - 1)
+
+    @property
+    def text(self) -> str:
+        """The resume text as edited so far"""
+        return '\n'.join(self.lines)
+
+    def _count(self, line: _Line, sign: int) -> None:
+        """Add a line to the totals (sign 1) or take it out (sign -1)"""
+        for counts, keys in ((self._word_lines, line.words), (self._skill_lines, line.skills)):
+            for key in keys:
+                count = counts[key] + sign
+                if count:
+                    counts[key] = count
+                else:
+                    del counts[key]
+        self._special_chars += sign * line.special_chars
+        self._short_lines += sign * line.short
+        self._table_lines += sign * line.table
+
+    def _replace(self, start: int, end: int, lines: Iterable[str]) -> Tuple[int, List[str]]:
+        """Replace lines start..end-1; returns the lines inserted and removed"""
+        if not 0 <= start <= end <= len(self.lines):
+            raise ValueError(f"Edit range {start}:{end} is outside the resume's {len(self.lines)} lines")
+        # Replacement lines may themselves hold line breaks
+        inserted = [part for line in lines for part in line.split('\n')]
+        removed = self.lines[start:end]
+        chars = (self._chars + sum(len(line) + 1 for line in inserted)
+                 - sum(len(line) + 1 for line in removed))
+        # Checked before any line is tokenized, so an oversized edit costs
+        # no more than measuring it
+        if self.max_chars and chars - 1 > self.max_chars:
+            raise ValueError(f"Resume text is longer than {self.max_chars} characters")
+        matcher = self.taxonomy.matcher
+        added = [_Line(line, self._tracked, matcher) for line in inserted]
+
+        for line in self._line_stats[start:end]:
+            self._count(line, -1)
+        for line in added:
+            self._count(line, 1)
+        self._chars = chars
+        self.lines[start:end] = inserted
+        self._line_stats[start:end] = added
+        return len(inserted), removed
+
+    def apply(self, edits: Sequence[LineEdit]) -> int:
+        """Apply line edits in order and return the new revision
+
+        Each edit's line numbers refer to the text as the previous edit left
+        it. Either every edit is applied or, when one is out of range or would
+        grow the text past max_chars, none is; the size is checked before the
+        edit's lines are tokenized.
+        """
+        undo = []
+        try:
+            for start, end, lines in edits:
+                inserted, removed = self._replace(start, end, lines)
+                undo.append((start, start + inserted, removed))
+        except ValueError:
+            for start, end, lines in reversed(undo):
+                self._replace(start, end, lines)
+            raise
+        self.revision += 1
+        return self.revision
+
+    def result(self, timer: Optional[StageTimer] = None) -> Dict:
+        """Score the resume as it stands, in the shape /analyze returns"""
+        if timer is None:
+            timer = StageTimer()
+        scorer = self.scorer
+        # A new taxonomy changes which skills and keywords count
+        if scorer.taxonomy is not self.taxonomy:
+            with timer.stage('live_reload'):
+                self._load(self.text)
+
+        with timer.stage('scoring'):
+            matched_keywords = [word for word in self._job_keywords if word in self._word_lines]
+            missing_keywords = [word for word in self._job_keywords if word not in self._word_lines]
+            keyword_match = (len(matched_keywords) / len(self._job_keywords) * 100
+                             if self._job_keywords else 0)
+            sections_found = {section: section in self._word_lines
+                              for section in scorer.common_sections}
+            formatting_issues = scorer.formatting_issues_from_counts(
+                self._table_lines > 0, self._special_chars, self._short_lines
+            )
+            resume_skills = self.taxonomy.matcher.categorize(self._skill_lines)
+
+        return scorer.score_matches(
+            keyword_match, matched_keywords, missing_keywords, sections_found,
+            formatting_issues, resume_skills, self.job_profile, timer
+        )
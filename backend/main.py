@@ -2,23 +2,335 @@
 FastAPI Backend for ATS Resume Score Application
 """
 
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+import asyncio
+import hmac
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from fastapi import FastAPI, File, UploadFile, Form, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from ats import ATSScorer
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from admission import Admission, AdmissionMiddleware
+from ats import (
+    ATSScorer, ResumeFeatures, analyze_with_features_task, configure_scorer,
+    JobProfile, extract_features_task, install_scorer, rank_results, score_features_task,
+    warm_up_task
+)
+from batch import collect_batch_items, iter_batch_results
+from cache import LRUCache, ResultCache, content_hash
+from job_queue import JobQueue, JobRunner
+from live_session import LiveSession
+from metrics import MetricsRegistry, StageTimer
+from resume_formats import UnsupportedFormatError, detect_format
+from resume_index import ResumeIndex
+from resume_store import ResumeStore
+from taxonomy import DEFAULT_TAXONOMY_PATH, TaxonomyError, install_taxonomy_file
+from worker_pool import AnalysisPool, AnalysisTimeoutError, PoolSaturatedError
+import config
+import json
 import logging
+import threading
+import time
+import uuid
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Initialize ATS scorer
+scorer_options = {
+    "job_cache_size": config.JOB_CACHE_SIZE,
+    "job_cache_ttl": config.JOB_CACHE_TTL,
+    "pdf_max_pages": config.PDF_MAX_PAGES,
+    "pdf_max_chars": config.PDF_MAX_CHARS,
+    "pdf_time_budget": config.PDF_TIME_BUDGET,
+    "pdf_backends": config.PDF_BACKENDS,
+    "semantic_model": config.SEMANTIC_MODEL or None,
+    "semantic_weight": config.SEMANTIC_WEIGHT,
+    "semantic_store": config.SEMANTIC_STORE_DB or None,
+    "taxonomy_path": config.SKILL_TAXONOMY or DEFAULT_TAXONOMY_PATH,
+    "taxonomy_check_interval": config.TAXONOMY_CHECK_INTERVAL
+}
+ats_scorer = ATSScorer(**scorer_options)
+install_scorer(ats_scorer)
+logger.info(f"PDF backends: {[backend.name for backend in ats_scorer.pdf_backends]}")
+logger.info(f"Skill taxonomy: {ats_scorer.taxonomy.stats()}")
+
+# Results of identical resume + job description submissions
+result_cache = ResultCache(
+    version=ats_scorer.config_version,
+    maxsize=config.RESULT_CACHE_SIZE,
+    ttl=config.RESULT_CACHE_TTL,
+    db_path=config.RESULT_CACHE_DB or None,
+    disk_maxsize=config.RESULT_CACHE_DB_SIZE
+)
+
+# Extracted text and features of stored resumes, for re-scoring
+resume_store = ResumeStore(config.RESUME_STORE_DB, config.RESUME_STORE_MAX,
+                           config.RESUME_STORE_RETENTION)
+
+# Keyword/skill postings over stored resumes for ranking them against a job
+resume_index = ResumeIndex(ats_scorer.calculate_structure_score)
+
+# PDF parsing and scoring are CPU-bound, so they run on a bounded pool
+analysis_pool = AnalysisPool(
+    mode=config.ANALYZE_EXECUTOR,
+    max_workers=config.ANALYZE_WORKERS,
+    queue_size=config.ANALYZE_QUEUE_SIZE,
+    timeout=config.ANALYZE_TIMEOUT,
+    initializer=configure_scorer,
+    initargs=(scorer_options,)
+)
+
+# Durable queue for POST /jobs, worked on by a separate pool so long jobs
+# never take workers from interactive requests
+job_queue = JobQueue(
+    config.JOB_QUEUE_DB,
+    max_attempts=config.JOB_MAX_ATTEMPTS,
+    retry_delay=config.JOB_RETRY_DELAY,
+    lease=config.JOB_TIMEOUT + 60,
+    per_job_limit=config.JOB_CONCURRENCY
+)
+job_pool = AnalysisPool(
+    mode=config.ANALYZE_EXECUTOR,
+    max_workers=config.JOB_WORKERS,
+    timeout=config.JOB_TIMEOUT,
+    initializer=configure_scorer,
+    initargs=(scorer_options,)
+)
+job_runner = (JobRunner(job_queue, job_pool, ats_scorer, retention=config.JOB_RETENTION)
+              if config.JOB_WORKERS else None)
+
+# Upload size limits, in-flight byte budget and analysis concurrency cap,
+# enforced while request bodies arrive
+admission = Admission(
+    max_body_size=config.MAX_REQUEST_SIZE,
+    body_size_limits=[("/analyze/batch", config.BATCH_MAX_REQUEST_SIZE),
+                      ("/jobs", config.BATCH_MAX_REQUEST_SIZE)],
+    max_inflight_bytes=config.MAX_INFLIGHT_BYTES,
+    max_concurrent=config.MAX_CONCURRENT_ANALYSES,
+    concurrency_paths=("/analyze", "/resumes", "/jobs")
+)
+
+# Resumes being edited in the browser, re-scored from their running totals
+live_sessions = LRUCache(maxsize=config.LIVE_SESSIONS, ttl=config.LIVE_SESSION_TTL)
+
+
+# Hot-path instrumentation rendered by /metrics
+metrics = MetricsRegistry()
+request_seconds = metrics.histogram(
+    "ats_request_seconds", "Request latency by route", ["method", "route", "status"]
+)
+stage_seconds = metrics.histogram(
+    "ats_analysis_stage_seconds", "Time spent in each analysis stage", ["stage"]
+)
+pdf_pages = metrics.histogram(
+    "ats_pdf_pages", "Pages read per resume PDF", buckets=(1, 2, 3, 5, 10, 20, 50, 100, 300)
+)
+text_chars = metrics.histogram(
+    "ats_resume_text_chars", "Characters of text extracted per resume",
+    buckets=(500, 1000, 2500, 5000, 10_000, 25_000, 50_000, 100_000, 200_000)
+)
+analyses_total = metrics.counter(
+    "ats_analyses_total", "Single-resume analyses by outcome", ["outcome"]
+)
+pool_errors_total = metrics.counter(
+    "ats_pool_errors_total", "Pool tasks rejected or timed out", ["reason"]
+)
+
+
+def _cache_counter(key: str):
+    """Read one stats() counter from every cache at scrape time"""
+    def samples():
+        caches = (("job_profile", ats_scorer.job_profile_cache), ("result", result_cache),
+                  ("resume_store", resume_store))
+        for name, cache in caches:
+            yield {"cache": name}, cache.stats()[key]
+    return samples
+
+
+metrics.collect("ats_cache_hits_total", "Cache hits", "counter", _cache_counter("hits"))
+metrics.collect("ats_cache_misses_total", "Cache misses", "counter", _cache_counter("misses"))
+metrics.collect("ats_resume_index_resumes", "Resumes in the search index", "gauge",
+                lambda: [({}, len(resume_index))])
+metrics.collect("ats_pool_free_slots", "Analysis pool slots free for new tasks", "gauge",
+                lambda: [({}, analysis_pool.stats()["free_slots"])])
+metrics.collect("ats_requests_rejected_total", "Requests turned away by admission control",
+                "counter", lambda: [({"reason": reason}, count)
+                                    for reason, count in admission.rejected.items()])
+metrics.collect("ats_inflight_request_bytes", "Request body bytes held by requests in flight",
+                "gauge", lambda: [({}, admission.stats()["inflight_bytes"])])
+metrics.collect("ats_job_items", "Resumes in the job queue by status", "gauge",
+                lambda: [({"status": status}, count)
+                         for status, count in job_queue.stats()["items"].items()])
+
+
+# Taxonomy version the result cache and resume index currently reflect
+active_taxonomy_version = ats_scorer.taxonomy.version
+index_rebuild: Optional[asyncio.Task] = None
+
+# Guards swapping in a rebuilt index; while a rebuild runs, resumes added to
+# or removed from the live index are also recorded here, to be replayed
+# into the new index before it replaces the old one
+index_lock = threading.Lock()
+index_changes: Optional[List[tuple]] = None
+
+
+def _index_add(resume_id: str, features: ResumeFeatures, filename: Optional[str]) -> None:
+    """Add a stored resume to the index"""
+    with index_lock:
+        resume_index.add(resume_id, features, filename)
+        if index_changes is not None:
+            index_changes.append((resume_id, features, filename))
+
+
+def _index_remove(resume_ids: List[str]) -> None:
+    """Take purged resumes out of the index"""
+    with index_lock:
+        resume_index.remove(resume_ids)
+        if index_changes is not None:
+            index_changes.append((resume_ids, None, None))
+
+
+def _rebuild_resume_index() -> None:
+    """Index every stored resume, at startup and after the taxonomy changed
+    
+    Features stored under an older taxonomy are recomputed from their text
+    as they are read. The new index replaces the old one when complete,
+    with the changes made to the old one meanwhile replayed into it.
+    """
+    global resume_index, index_changes
+    with index_lock:
+        index_changes = []
+    index = ResumeIndex(ats_scorer.calculate_structure_score)
+    try:
+        for resume_id, filename, features in resume_store.iter_features(ats_scorer):
+            index.add(resume_id, features, filename)
+    except BaseException:
+        with index_lock:
+            index_changes = None
+        raise
+    with index_lock:
+        # Entries are (resume id, features, filename) for an add and
+        # (resume ids, None, None) for a removal
+        for resume_ids, features, filename in index_changes:
+            if features is None:
+                index.remove(resume_ids)
+            else:
+                index.add(resume_ids, features, filename)
+        index_changes = None
+        resume_index = index
+    logger.info(f"Resume index built: {len(index)} resumes")
+
+
+async def _rebuild_until_current() -> None:
+    """Rebuild the index until it reflects the active taxonomy
+    
+    Only one of these runs at a time; a taxonomy change during a rebuild
+    makes it start over rather than race a second one.
+    """
+    while True:
+        version = active_taxonomy_version
+        await asyncio.to_thread(_rebuild_resume_index)
+        if version == active_taxonomy_version:
+            return
+
+
+def _sync_taxonomy() -> None:
+    """Bring cached results and the index in line with a new taxonomy
+    
+    Call from the event loop; the index is rebuilt in the background.
+    """
+    global active_taxonomy_version, index_rebuild
+    taxonomy = ats_scorer.taxonomy
+    if taxonomy.version == active_taxonomy_version:
+        return
+    active_taxonomy_version = taxonomy.version
+    result_cache.set_version(ats_scorer.config_version)
+    logger.info(f"Skill taxonomy changed: {taxonomy.stats()}")
+    if index_rebuild is None or index_rebuild.done():
+        index_rebuild = asyncio.create_task(_rebuild_until_current())
+
+
+async def _watch_taxonomy() -> None:
+    """Pick up edits to the taxonomy file; workers check it on their own"""
+    while True:
+        await asyncio.sleep(config.TAXONOMY_CHECK_INTERVAL)
+        try:
+            _sync_taxonomy()
+        except Exception as e:
+            logger.warning(f"Skill taxonomy update failed: {e}")
+
+
+def _purge_resumes() -> None:
+    """Drop resumes past the store's age and count limits from store and index"""
+    resume_ids = resume_store.purge()
+    if resume_ids:
+        _index_remove(resume_ids)
+        logger.info(f"Purged {len(resume_ids)} stored resumes")
+
+
+async def _expire_resumes() -> None:
+    """Purge stored resumes past their retention once an hour"""
+    while True:
+        try:
+            await asyncio.to_thread(_purge_resumes)
+        except Exception as e:
+            logger.warning(f"Resume store purge failed: {e}")
+        await asyncio.sleep(3600)
+
+
+async def _warm_up_pool() -> None:
+    """Spawn analysis workers and load the PDF library in the background"""
+    try:
+        await analysis_pool.warm_up(warm_up_task)
+        logger.info("Analysis pool warmed up")
+    except Exception as e:
+        logger.warning(f"Analysis pool warm-up failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop the analysis pool with the application"""
+    global index_rebuild
+    analysis_pool.start()
+    logger.info(f"Analysis pool started: {analysis_pool.stats()}")
+    # Slow start-up work runs in the background so /health answers at once
+    index_rebuild = asyncio.create_task(_rebuild_until_current())
+    pool_warmer = asyncio.create_task(_warm_up_pool()) if config.WARM_POOL else None
+    taxonomy_watcher = (asyncio.create_task(_watch_taxonomy())
+                        if config.TAXONOMY_CHECK_INTERVAL else None)
+    resume_expirer = (asyncio.create_task(_expire_resumes())
+                      if config.RESUME_STORE_RETENTION else None)
+    job_worker = None
+    if job_runner is not None:
+        job_pool.start()
+        job_worker = asyncio.create_task(job_runner.run())
+        logger.info(f"Job runner started: {job_pool.stats()}")
+    yield
+    for task in (index_rebuild, pool_warmer, taxonomy_watcher, resume_expirer, job_worker):
+        if task is not None:
+            task.cancel()
+    analysis_pool.shutdown()
+    job_pool.shutdown()
+    result_cache.close()
+    resume_store.close()
+    job_queue.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="ATS Resume Scorer API",
     description="API for analyzing resume ATS compatibility",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Reject oversized and excess uploads before their bodies are read; added
+# first so it sits inside CORS and browsers can read the rejections
+app.add_middleware(AdmissionMiddleware, admission=admission)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -28,8 +340,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize ATS scorer
-ats_scorer = ATSScorer()
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observe every request's latency, labelled by route template"""
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    request_seconds.observe(time.perf_counter() - start, request.method,
+                            route.path if route else "unmatched", str(response.status_code))
+    return response
 
 
 @app.get("/")
@@ -40,7 +360,21 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "/analyze": "POST - Analyze resume against job description",
-            "/health": "GET - Health check"
+            "/analyze/batch": "POST - Rank many resumes against one job description",
+            "/analyze/batch/stream": "POST - Stream batch results as NDJSON while resumes are scored",
+            "/jobs": "POST - Queue resumes for background analysis against a job description",
+            "/jobs/{job_id}": "GET - Job status, progress and results",
+            "/jobs/{job_id}/cancel": "POST - Cancel a job's queued resumes",
+            "/sessions": "POST - Start live scoring of resume text being edited",
+            "/sessions/{session_id}": "GET/PATCH/DELETE - Current score, apply line edits, end the session",
+            "/resumes": "POST - Store a resume for re-scoring",
+            "/resumes/search": "POST - Rank stored resumes against a job description",
+            "/resumes/{resume_id}": "GET - Stored resume summary",
+            "/resumes/{resume_id}/analyze": "POST - Re-score a stored resume against a job description",
+            "/health": "GET - Health check",
+            "/stats": "GET - Cache and worker pool statistics",
+            "/metrics": "GET - Prometheus metrics",
+            "/admin/taxonomy/reload": "POST - Reload or replace the skill taxonomy (admin token)"
         }
     }
 
@@ -51,17 +385,214 @@ async def health_check():
     return {"status": "healthy", "service": "ATS Resume Scorer"}
 
 
+@app.get("/stats")
+async def stats():
+    """Cache and worker pool statistics"""
+    return {
+        "job_profile_cache": ats_scorer.job_profile_cache.stats(),
+        "result_cache": result_cache.stats(),
+        "resume_store": resume_store.stats(),
+        "resume_index": {"resumes": len(resume_index)},
+        "taxonomy": ats_scorer.taxonomy.stats(),
+        "analysis_pool": analysis_pool.stats(),
+        "job_queue": job_queue.stats(),
+        "job_pool": job_pool.stats(),
+        "live_sessions": live_sessions.stats(),
+        "admission": admission.stats()
+    }
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Latency histograms, sizes and cache counters in Prometheus text format"""
+    content = await run_in_threadpool(metrics.render)
+    return PlainTextResponse(content, media_type="text/plain; version=0.0.4")
+
+
+def _file_size(file) -> int:
+    """Size of a seekable file, leaving its position at the start"""
+    size = file.seek(0, 2)
+    file.seek(0)
+    return size
+
+
+async def _validate_resume_upload(resume: UploadFile) -> None:
+    """Reject uploads that are not PDF, DOCX or text resumes, or are too large"""
+    # Validate file type by content; the filename may say anything
+    try:
+        file_format = await run_in_threadpool(detect_format, resume.file)
+    except UnsupportedFormatError as e:
+        logger.warning(f"Invalid file type: {resume.filename}")
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info(f"File format: {file_format}")
+    
+    # Validate file size without loading the upload
+    file_size = resume.size if resume.size is not None else await run_in_threadpool(_file_size, resume.file)
+    file_size_mb = file_size / (1024 * 1024)
+    logger.info(f"File size: {file_size_mb:.2f} MB")
+    
+    if file_size > config.MAX_UPLOAD_SIZE:
+        logger.warning(f"File too large: {file_size_mb:.2f} MB")
+        raise HTTPException(
+            status_code=400,
+            detail=f"File size too large. Maximum size is {config.MAX_UPLOAD_SIZE // (1024 * 1024)}MB."
+        )
+
+
+def _validate_job_description(job_description: str) -> None:
+    """Reject job descriptions too short to score against or too long to compile"""
+    if not job_description or len(job_description.strip()) < 10:
+        logger.warning(f"Job description too short: {len(job_description) if job_description else 0} characters")
+        raise HTTPException(
+            status_code=400,
+            detail="Job description is too short. Please provide a detailed job description."
+        )
+    if config.JOB_DESCRIPTION_MAX_CHARS and len(job_description) > config.JOB_DESCRIPTION_MAX_CHARS:
+        logger.warning(f"Job description too long: {len(job_description)} characters")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job description is too long. Maximum is {config.JOB_DESCRIPTION_MAX_CHARS} characters."
+        )
+
+
+async def _job_profile(job_description: str) -> JobProfile:
+    """Compiled profile of a job description
+    
+    Cached profiles are keyed by a hash of the whole text and a miss
+    tokenizes and skill-matches all of it, so both run off the event loop.
+    """
+    return await run_in_threadpool(ats_scorer.get_job_profile, job_description)
+
+
+async def _pool_input(resume: UploadFile):
+    """The upload as the analysis pool wants it
+    
+    Thread and inline workers read the spooled upload in place; worker
+    processes need the bytes.
+    """
+    await resume.seek(0)
+    return resume.file if analysis_pool.shares_memory else await resume.read()
+
+
+async def _run_on_pool(fn, *args, filename: str = None):
+    """Run a task on the analysis pool, mapping pool errors to HTTP errors"""
+    try:
+        return await analysis_pool.run(fn, *args)
+    except PoolSaturatedError:
+        pool_errors_total.inc("saturated")
+        logger.warning("Analysis pool saturated, rejecting request")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy analyzing other resumes. Please try again shortly.",
+            headers={"Retry-After": "1"}
+        )
+    except AnalysisTimeoutError as e:
+        pool_errors_total.inc("timeout")
+        logger.warning(f"Analysis timed out: {filename}")
+        raise HTTPException(status_code=504, detail=str(e))
+
+
+async def _run_timed(timer: StageTimer, fn, *args, filename: str = None):
+    """Run a pool task that reports its stage timings and fold them into timer
+    
+    Time on the pool not spent in the task's own stages (waiting for a
+    worker, moving arguments and results between processes) is recorded as
+    the pool_overhead stage.
+    """
+    start = time.perf_counter()
+    output = await _run_on_pool(fn, *args, filename=filename)
+    result = output[0] if isinstance(output, tuple) else output
+    worker_timings = result.pop("timings", None) or {}
+    worker_seconds = sum(worker_timings.get("stages_ms", {}).values()) / 1000
+    timer.add("pool_overhead", max(0.0, time.perf_counter() - start - worker_seconds))
+    timer.merge(worker_timings)
+    return output
+
+
+def _record_analysis(timer: StageTimer, outcome: str) -> None:
+    """Feed one analysis's stage timings and sizes into the metrics"""
+    analyses_total.inc(outcome)
+    for stage, seconds in timer.stages.items():
+        stage_seconds.observe(seconds, stage)
+    if "pdf_pages" in timer.values:
+        pdf_pages.observe(timer.values["pdf_pages"])
+    if "text_chars" in timer.values:
+        text_chars.observe(timer.values["text_chars"])
+
+
+def _with_timings(result: dict, timer: StageTimer, start: float, include: bool) -> dict:
+    """Add the timings block to a response when the client asked for it"""
+    if include:
+        result["timings"] = timer.to_dict()
+        result["timings"]["total_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+async def _score_stored(features: ResumeFeatures, job_profile: JobProfile,
+                        timer: StageTimer) -> dict:
+    """Score stored features
+    
+    Keyword scoring is a few set operations and runs inline; semantic
+    scoring runs a model, so it goes to the pool.
+    """
+    if ats_scorer.semantic is None:
+        return ats_scorer.score_features(features, job_profile, timer)
+    return await _run_timed(timer, score_features_task, features, job_profile)
+
+
+def _store_resume(resume_id: str, filename: str, features: ResumeFeatures) -> None:
+    """Store and index a resume, dropping the oldest past the store's limits
+    
+    Features are stored under the version of the taxonomy the worker
+    matched them with, so ones made with a taxonomy this process has
+    already replaced are recomputed when next loaded.
+    """
+    version = ats_scorer.features_version_for(features.taxonomy_version)
+    resume_store.put(resume_id, features, version, filename)
+    _index_add(resume_id, features, filename)
+    _purge_resumes()
+
+
+def _remember(resume_id: str, filename: str, features: ResumeFeatures,
+              job_description: str, result: dict) -> None:
+    """Keep a result for later requests, and the resume too if configured
+    
+    Workers check the taxonomy file on their own schedule, so the result is
+    cached under the version of the taxonomy its worker used; one made with
+    a taxonomy this process has replaced is never served.
+    """
+    if config.STORE_ANALYZED_RESUMES and resume_id not in resume_store:
+        _store_resume(resume_id, filename, features)
+    version = ats_scorer.config_version_for(features.taxonomy_version)
+    result_cache.set(result_cache.key(resume_id, job_description, version), result)
+
+
+def _resume_summary(resume_id: str, filename: str, features: ResumeFeatures) -> dict:
+    """Public view of a stored resume"""
+    return {
+        "success": True,
+        "resume_id": resume_id,
+        "filename": filename,
+        "characters": len(features.text),
+        "sections_found": features.sections_found,
+        "formatting_issues": features.formatting_issues,
+        "skills": features.skills
+    }
+
+
 @app.post("/analyze")
 async def analyze_resume(
-    resume: UploadFile = File(..., description="Resume PDF file"),
-    job_description: str = Form(..., description="Job description text")
+    resume: UploadFile = File(..., description="Resume file: PDF, DOCX or TXT"),
+    job_description: str = Form(..., description="Job description text"),
+    timings: bool = Query(False, description="Include per-stage timings in the response")
 ):
     """
     Analyze resume against job description
     
     Args:
-        resume: PDF file of the resume
+        resume: The resume as a PDF, DOCX or TXT file
         job_description: Text of the job description
+        timings: Add a timings block with per-stage milliseconds
     
     Returns:
         JSON with ATS score and recommendations
@@ -69,40 +600,46 @@ async def analyze_resume(
     try:
         logger.info(f"Received analyze request - Filename: {resume.filename}, Content-Type: {resume.content_type}")
         
-        # Validate file type
-        if not resume.filename.lower().endswith('.pdf'):
-            logger.warning(f"Invalid file type: {resume.filename}")
-            raise HTTPException(
-                status_code=400,
-                detail="Only PDF files are supported. Please upload a PDF resume."
-            )
-        
-        # Validate file size (max 10MB)
-        resume_bytes = await resume.read()
-        file_size_mb = len(resume_bytes) / (1024 * 1024)
-        logger.info(f"File size: {file_size_mb:.2f} MB")
+        await _validate_resume_upload(resume)
+        _validate_job_description(job_description)
         
-        if len(resume_bytes) > 10 * 1024 * 1024:  # 10MB
-            logger.warning(f"File too large: {file_size_mb:.2f} MB")
-            raise HTTPException(
-                status_code=400,
-                detail="File size too large. Maximum size is 10MB."
-            )
+        logger.info(f"Analyzing resume: {resume.filename}")
+        start = time.perf_counter()
+        timer = StageTimer()
         
-        # Validate job description
-        if not job_description or len(job_description.strip()) < 10:
-            logger.warning(f"Job description too short: {len(job_description) if job_description else 0} characters")
-            raise HTTPException(
-                status_code=400,
-                detail="Job description is too short. Please provide a detailed job description."
-            )
+        # Re-uploads and retries of the same resume + job description are
+        # served from the result cache
+        with timer.stage("upload_hash"):
+            resume_id = await run_in_threadpool(content_hash, resume.file)
+        cache_key = result_cache.key(resume_id, job_description)
+        with timer.stage("result_cache"):
+            cached_result = await run_in_threadpool(result_cache.get, cache_key)
+        if cached_result is not None:
+            logger.info(f"Served from cache. Score: {cached_result['overall_score']}")
+            _record_analysis(timer, "cached")
+            cached_result["cached"] = True
+            return JSONResponse(content=_with_timings(cached_result, timer, start, timings))
         
-        logger.info(f"Analyzing resume: {resume.filename}")
+        # The job description is compiled once and cached; workers only
+        # process the resume side
+        with timer.stage("job_profile"):
+            job_profile = await _job_profile(job_description)
         
-        # Analyze resume
-        result = ats_scorer.analyze_resume(resume_bytes, job_description)
+        # A resume seen before is re-scored from its stored features
+        with timer.stage("resume_store"):
+            features = await run_in_threadpool(resume_store.load, resume_id, ats_scorer)
+        if features is not None:
+            outcome = "stored"
+            result = await _score_stored(features, job_profile, timer)
+        else:
+            outcome = "analyzed"
+            result, features = await _run_timed(
+                timer, analyze_with_features_task, await _pool_input(resume), job_profile,
+                filename=resume.filename
+            )
         
         if not result.get("success", False):
+            _record_analysis(timer, "error")
             raise HTTPException(
                 status_code=500,
                 detail=result.get("error", "Error analyzing resume")
@@ -110,7 +647,16 @@ async def analyze_resume(
         
         logger.info(f"Analysis complete. Score: {result['overall_score']}")
         
-        return JSONResponse(content=result)
+        # Only stored resumes can be re-scored by id
+        if outcome == "stored" or config.STORE_ANALYZED_RESUMES:
+            result["resume_id"] = resume_id
+        with timer.stage("remember"):
+            await run_in_threadpool(_remember, resume_id, resume.filename, features,
+                                    job_description, result)
+        result["cached"] = False
+        _record_analysis(timer, outcome)
+        
+        return JSONResponse(content=_with_timings(result, timer, start, timings))
     
     except HTTPException:
         raise
@@ -122,6 +668,451 @@ async def analyze_resume(
         )
 
 
+async def _prepare_batch(resumes: List[UploadFile], job_description: str) -> List:
+    """Validate a batch request and return its items"""
+    _validate_job_description(job_description)
+    
+    try:
+        items = await collect_batch_items(resumes, config.BATCH_MAX_FILES, config.MAX_UPLOAD_SIZE)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not items:
+        raise HTTPException(status_code=400, detail="No resumes found in the upload.")
+    
+    return items
+
+
+@app.post("/resumes")
+async def store_resume(
+    resume: UploadFile = File(..., description="Resume file: PDF, DOCX or TXT")
+):
+    """
+    Parse a resume once and store it for re-scoring
+    
+    Returns:
+        JSON with the resume_id to use with /resumes/{resume_id}/analyze
+    """
+    logger.info(f"Received store request - Filename: {resume.filename}")
+    
+    await _validate_resume_upload(resume)
+    
+    resume_id = await run_in_threadpool(content_hash, resume.file)
+    features = await run_in_threadpool(resume_store.load, resume_id, ats_scorer)
+    if features is None:
+        try:
+            features = await _run_on_pool(
+                extract_features_task, await _pool_input(resume), filename=resume.filename
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        await run_in_threadpool(_store_resume, resume_id, resume.filename, features)
+        logger.info(f"Stored resume {resume_id}")
+    
+    return JSONResponse(content=_resume_summary(resume_id, resume.filename, features))
+
+
+@app.post("/resumes/search")
+async def search_resumes(
+    job_description: str = Form(..., description="Job description text"),
+    top_k: int = Form(50, ge=1, le=1000, description="Number of candidates to return"),
+    x_recruiter_token: Optional[str] = Header(None)
+):
+    """
+    Find the stored resumes that best match a job description
+    
+    Lists candidates, so it needs the recruiter or admin token.
+    
+    Returns:
+        JSON with the top_k resumes ranked by overall score, scored as
+        /resumes/{resume_id}/analyze would score them
+    """
+    _require_recruiter(x_recruiter_token)
+    _validate_job_description(job_description)
+    
+    job_profile = await _job_profile(job_description)
+    results = await run_in_threadpool(resume_index.search, job_profile, top_k)
+    
+    logger.info(f"Resume search returned {len(results)} of {len(resume_index)} indexed resumes")
+    
+    return JSONResponse(content={
+        "success": True,
+        "indexed": len(resume_index),
+        "results": results
+    })
+
+
+@app.get("/resumes/{resume_id}")
+async def get_resume(resume_id: str):
+    """Summary of a stored resume"""
+    features = await run_in_threadpool(resume_store.load, resume_id, ats_scorer)
+    if features is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    filename = await run_in_threadpool(resume_store.filename, resume_id)
+    return JSONResponse(content=_resume_summary(resume_id, filename, features))
+
+
+@app.post("/resumes/{resume_id}/analyze")
+async def analyze_stored_resume(
+    resume_id: str,
+    job_description: str = Form(..., description="Job description text"),
+    timings: bool = Query(False, description="Include per-stage timings in the response")
+):
+    """
+    Re-score a stored resume against a job description without re-parsing it
+    
+    Returns:
+        JSON in the same shape as /analyze
+    """
+    _validate_job_description(job_description)
+    start = time.perf_counter()
+    timer = StageTimer()
+    
+    with timer.stage("resume_store"):
+        features = await run_in_threadpool(resume_store.load, resume_id, ats_scorer)
+    if features is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    
+    with timer.stage("job_profile"):
+        job_profile = await _job_profile(job_description)
+    result = await _score_stored(features, job_profile, timer)
+    result["resume_id"] = resume_id
+    _record_analysis(timer, "stored")
+    
+    logger.info(f"Re-scored resume {resume_id}. Score: {result['overall_score']}")
+    
+    return JSONResponse(content=_with_timings(result, timer, start, timings))
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(
+    resumes: List[UploadFile] = File(..., description="Resume files or zip archives of them"),
+    job_description: str = Form(..., description="Job description text")
+):
+    """
+    Analyze many resumes against one job description
+    
+    Args:
+        resumes: PDF, DOCX or TXT files and/or zip archives containing them
+        job_description: Text of the job description
+    
+    Returns:
+        JSON with one result per resume, ranked by overall score
+    """
+    logger.info(f"Received batch analyze request - {len(resumes)} uploads")
+    
+    items = await _prepare_batch(resumes, job_description)
+    job_profile = await _job_profile(job_description)
+    results = [result async for result in iter_batch_results(analysis_pool, items, job_profile)]
+    ranked = rank_results(results)
+    
+    logger.info(f"Batch analysis complete - {len(ranked)} resumes")
+    
+    return JSONResponse(content={
+        "success": True,
+        "count": len(ranked),
+        "analyzed": sum(1 for result in ranked if result.get("success")),
+        "results": ranked
+    })
+
+
+@app.post("/analyze/batch/stream")
+async def analyze_batch_stream(
+    resumes: List[UploadFile] = File(..., description="Resume files or zip archives of them"),
+    job_description: str = Form(..., description="Job description text")
+):
+    """
+    Analyze many resumes, streaming each result as soon as it is ready
+    
+    Returns:
+        NDJSON, one /analyze result per line with filename and index, in
+        completion order. Failed resumes are reported inline.
+    """
+    logger.info(f"Received streaming batch request - {len(resumes)} uploads")
+    
+    items = await _prepare_batch(resumes, job_description)
+    job_profile = await _job_profile(job_description)
+    
+    async def ndjson_lines():
+        count = 0
+        async for result in iter_batch_results(analysis_pool, items, job_profile):
+            count += 1
+            yield json.dumps(result) + "\n"
+        logger.info(f"Streaming batch complete - {count} resumes")
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(
+    resumes: List[UploadFile] = File(..., description="Resume files or zip archives of them"),
+    job_description: str = Form(..., description="Job description text")
+):
+    """
+    Queue many resumes for analysis in the background
+    
+    Args:
+        resumes: PDF, DOCX or TXT files and/or zip archives containing them
+        job_description: Text of the job description
+    
+    Returns:
+        JSON with the job_id to poll at /jobs/{job_id}
+    """
+    logger.info(f"Received job - {len(resumes)} uploads")
+    
+    if await run_in_threadpool(job_queue.pending) >= config.JOB_MAX_PENDING:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many jobs are waiting. Please try again later.",
+            headers={"Retry-After": "30"}
+        )
+    items = await _prepare_batch(resumes, job_description)
+    
+    # Resumes go into the queue one at a time, so a large upload is never
+    # held in memory; unreadable ones are recorded as failed right away
+    job_id = await run_in_threadpool(job_queue.create, job_description)
+    try:
+        for position, item in enumerate(items):
+            try:
+                resume_bytes, error = await item.load(), None
+            except Exception as e:
+                resume_bytes, error = None, str(e)
+            await run_in_threadpool(job_queue.add_item, job_id, position, item.filename,
+                                    resume_bytes, error)
+        await run_in_threadpool(job_queue.open, job_id)
+    except Exception:
+        await run_in_threadpool(job_queue.delete, job_id)
+        raise
+    if job_runner is not None:
+        job_runner.notify()
+    
+    logger.info(f"Queued job {job_id} - {len(items)} resumes")
+    
+    return JSONResponse(status_code=202, content={
+        "success": True,
+        "job_id": job_id,
+        "status": "queued",
+        "total": len(items),
+        "status_url": f"/jobs/{job_id}"
+    })
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Status and progress of a job
+    
+    Returns:
+        JSON with status (queued, running, completed or cancelled), per-status
+        resume counts and, once the job is completed or cancelled, the
+        results ranked as /analyze/batch ranks them
+    """
+    job = await run_in_threadpool(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JSONResponse(content={"success": True, **job})
+
+
+@app.post("/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """
+    Cancel a job's resumes that have not started yet
+    
+    Resumes already being scored finish and keep their results. Cancelling
+    a finished job leaves it as it is.
+    """
+    status = await run_in_threadpool(job_queue.cancel, job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    logger.info(f"Job {job_id} is {status}")
+    return JSONResponse(content={"success": True, "job_id": job_id, "status": status})
+
+
+class SessionEdit(BaseModel):
+    """Replace lines start..end-1 of the resume text with lines"""
+    start: int
+    end: int
+    lines: List[str] = []
+
+
+class SessionUpdate(BaseModel):
+    """Line edits made since the session's revision, applied in order"""
+    revision: int
+    edits: List[SessionEdit]
+
+
+def _get_session(session_id: str) -> LiveSession:
+    """Look up a live session, keeping it alive for another TTL"""
+    session = live_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    live_sessions.set(session_id, session)
+    return session
+
+
+def _session_result(session_id: str, session: LiveSession, timer: StageTimer,
+                    start: float, timings: bool) -> JSONResponse:
+    """A session's current score with its id, revision and line count"""
+    result = session.result(timer)
+    result.update(session_id=session_id, revision=session.revision, lines=len(session.lines))
+    return JSONResponse(content=_with_timings(result, timer, start, timings))
+
+
+@app.post("/sessions")
+async def create_session(
+    job_description: str = Form(..., description="Job description text"),
+    resume_text: str = Form("", description="Resume text to start from"),
+    timings: bool = Query(False, description="Include per-stage timings in the response")
+):
+    """
+    Start scoring a resume live while it is edited
+    
+    The server keeps the compiled job description and the resume's word,
+    skill and formatting counts per line; PATCH /sessions/{session_id}
+    then re-scores each edit in time proportional to the edit.
+    
+    Returns:
+        JSON in the same shape as /analyze, plus session_id, revision and
+        the resume's line count
+    """
+    _validate_job_description(job_description)
+    start = time.perf_counter()
+    timer = StageTimer()
+    
+    # The first analysis reads the whole text, so it stays off the event loop
+    try:
+        with timer.stage("live_load"):
+            session = await run_in_threadpool(
+                LiveSession, ats_scorer, job_description, resume_text,
+                config.LIVE_SESSION_MAX_CHARS
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    session_id = uuid.uuid4().hex
+    live_sessions.set(session_id, session)
+    
+    logger.info(f"Started live session {session_id} - {session.characters} characters")
+    
+    return _session_result(session_id, session, timer, start, timings)
+
+
+@app.get("/sessions/{session_id}")
+async def get_session(
+    session_id: str,
+    timings: bool = Query(False, description="Include per-stage timings in the response")
+):
+    """Current score, revision and line count of a live session"""
+    session = _get_session(session_id)
+    async with session.lock:
+        return _session_result(session_id, session, StageTimer(), time.perf_counter(), timings)
+
+
+@app.patch("/sessions/{session_id}")
+async def update_session(
+    session_id: str,
+    update: SessionUpdate,
+    timings: bool = Query(False, description="Include per-stage timings in the response")
+):
+    """
+    Apply line edits to a live session's resume and re-score it
+    
+    Line numbers count from 0 and each edit sees the text as the previous
+    one left it; replacement lines may contain line breaks. Edits are
+    applied all or none. An update based on an older revision is rejected
+    with 409, so the client should GET the session and resend its whole
+    text as one edit.
+    
+    Returns:
+        JSON in the same shape as POST /sessions
+    """
+    start = time.perf_counter()
+    timer = StageTimer()
+    session = _get_session(session_id)
+    edits = [(edit.start, edit.end, edit.lines) for edit in update.edits]
+    inserted = sum(len(line) for edit in update.edits for line in edit.lines)
+    
+    # The session's lock keeps its updates in order, including those
+    # handed to a thread
+    async with session.lock:
+        if update.revision != session.revision:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Edits are based on revision {update.revision} but the session is at "
+                       f"revision {session.revision}"
+            )
+        
+        # Edits touch only the lines they change, so small ones run on the
+        # event loop; pasting a large block would hold it up
+        try:
+            with timer.stage("live_edit"):
+                if inserted > config.LIVE_EDIT_INLINE_CHARS:
+                    await run_in_threadpool(session.apply, edits)
+                else:
+                    session.apply(edits)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return _session_result(session_id, session, timer, start, timings)
+
+
+@app.delete("/sessions/{session_id}")
+async def delete_session(session_id: str):
+    """End a live session and free its memory"""
+    if not live_sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    return JSONResponse(content={"success": True, "session_id": session_id})
+
+
+def _require_admin(token: Optional[str]) -> None:
+    """Reject admin requests without the configured token"""
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled. Set ATS_ADMIN_TOKEN.")
+    if not hmac.compare_digest(token or "", config.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+def _require_recruiter(token: Optional[str]) -> None:
+    """Reject candidate searches without the recruiter or admin token"""
+    tokens = [expected for expected in (config.RECRUITER_TOKEN, config.ADMIN_TOKEN) if expected]
+    if not tokens:
+        raise HTTPException(status_code=403,
+                            detail="Resume search is disabled. Set ATS_RECRUITER_TOKEN.")
+    # Both are compared, so the time taken does not tell which one matched
+    matches = [hmac.compare_digest(token or "", expected) for expected in tokens]
+    if not any(matches):
+        raise HTTPException(status_code=401, detail="Invalid recruiter token")
+
+
+@app.post("/admin/taxonomy/reload")
+async def reload_taxonomy(
+    taxonomy: Optional[UploadFile] = File(None, description="New taxonomy JSON (optional)"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Reload the skill taxonomy without restarting
+    
+    With a file, it is validated and atomically replaces the taxonomy file;
+    without one, the current file is re-read. Workers pick the change up on
+    their next file check (ATS_TAXONOMY_CHECK_INTERVAL).
+    
+    Returns:
+        JSON with the loaded taxonomy's version and size
+    """
+    _require_admin(x_admin_token)
+    
+    try:
+        if taxonomy is not None:
+            content = await taxonomy.read()
+            await run_in_threadpool(install_taxonomy_file, ats_scorer.taxonomy_path, content)
+        loaded = await run_in_threadpool(ats_scorer.reload_taxonomy)
+    except TaxonomyError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    _sync_taxonomy()
+    
+    return JSONResponse(content={"success": True, "taxonomy": loaded.stats()})
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
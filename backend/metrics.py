@@ -0,0 +1,183 @@
+"""
+Hot-path instrumentation exposed in the Prometheus text format
+
+StageTimer records how long each stage of one analysis took, wherever the
+analysis runs; pool workers send it back with the result as a plain dict.
+The web process folds those into histograms and counters that /metrics
+renders. Recording is a bisect and a few additions under a lock, cheap
+enough to leave on in production, and needs no client library.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Seconds, from sub-millisecond stages up to the analysis timeout
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class StageTimer:
+    """Per-stage durations and sizes of one analysis"""
+
+    __slots__ = ('stages', 'values')
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.values: Dict[str, Any] = {}
+
+    def stage(self, name: str) -> "_Stage":
+        """Context manager adding the time spent inside it to a stage"""
+        return _Stage(self, name)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a stage"""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def set(self, name: str, value: Any) -> None:
+        """Record a value such as pdf_pages, text_chars or pdf_backend"""
+        self.values[name] = value
+
+    def merge(self, timings: Optional[Dict]) -> None:
+        """Fold in another timer's to_dict(), e.g. one sent back by a worker"""
+        if not timings:
+            return
+        for name, milliseconds in timings.get('stages_ms', {}).items():
+            self.add(name, milliseconds / 1000)
+        self.values.update({name: value for name, value in timings.items() if name != 'stages_ms'})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, stage times in milliseconds"""
+        timings: Dict[str, Any] = {
+            'stages_ms': {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()}
+        }
+        timings.update(self.values)
+        return timings
+
+
+class _Stage:
+    """Times one `with` block into a StageTimer"""
+
+    __slots__ = ('timer', 'name', 'start')
+
+    def __init__(self, timer: StageTimer, name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.timer.add(self.name, time.perf_counter() - self.start)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """{name="value",...} or '' when there are no labels"""
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}"
+                for labels, value in values]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    type = 'histogram'
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][position] += 1
+            series[1] += value
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = [(labels, list(counts), total)
+                      for labels, (counts, total) in self._series.items()]
+        lines = []
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                bucket_labels = _format_labels(self.labelnames, labels, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {total:g}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics rendered together by /metrics"""
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Tuple[str, str, str, Callable]] = []
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collect(self, name: str, help: str, type: str,
+                fn: Callable[[], Iterable[Tuple[Dict[str, str], float]]]) -> None:
+        """Add a metric read at render time, e.g. from a cache's stats()"""
+        self._collectors.append((name, help, type, fn))
+
+    def render(self) -> str:
+        """Everything in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        for name, help, type, fn in self._collectors:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {type}")
+            for labels, value in fn():
+                lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {value:g}")
+        return '\n'.join(lines) + '\n'
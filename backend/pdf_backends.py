@@ -0,0 +1,103 @@
+"""
+Pluggable PDF text extraction backends
+
+Each backend wraps one PDF library and yields text page by page. Libraries
+are imported on first use, so a backend whose library is missing is simply
+reported as unavailable.
+"""
+
+import importlib.util
+from typing import BinaryIO, Dict, Iterator, List, Sequence, Type
+
+
+class PDFBackend:
+    """Base class for PDF text extractors"""
+
+    name = ''
+    module = ''
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the library this backend needs is installed"""
+        return importlib.util.find_spec(cls.module) is not None
+
+    @classmethod
+    def preload(cls) -> None:
+        """Import the library now rather than on the first extraction"""
+        importlib.import_module(cls.module)
+
+    def iter_pages(self, stream: BinaryIO) -> Iterator[str]:
+        """Yield the text of each page in order"""
+        raise NotImplementedError
+
+
+BACKENDS: Dict[str, Type[PDFBackend]] = {}
+
+
+def register_backend(backend_class: Type[PDFBackend]) -> Type[PDFBackend]:
+    """Class decorator adding a backend to the registry under its name"""
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+def get_backends(names: Sequence[str]) -> List[PDFBackend]:
+    """Instantiate the named backends that are installed, in order"""
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown PDF backend(s): {', '.join(unknown)}")
+    return [BACKENDS[name]() for name in names if BACKENDS[name].available()]
+
+
+@register_backend
+class PyMuPDFBackend(PDFBackend):
+    """MuPDF via PyMuPDF: the fastest extractor, optional dependency"""
+
+    name = 'pymupdf'
+    module = 'pymupdf'
+
+    def iter_pages(self, stream: BinaryIO) -> Iterator[str]:
+        import pymupdf
+        with pymupdf.open(stream=stream.read(), filetype='pdf') as document:
+            for page in document:
+                yield page.get_text()
+
+
+@register_backend
+class PypdfBackend(PDFBackend):
+    """pypdf, the maintained successor of PyPDF2"""
+
+    name = 'pypdf'
+    module = 'pypdf'
+
+    def iter_pages(self, stream: BinaryIO) -> Iterator[str]:
+        from pypdf import PdfReader
+        for page in PdfReader(stream).pages:
+            yield page.extract_text() or ''
+
+
+@register_backend
+class PyPDF2Backend(PDFBackend):
+    """PyPDF2, the original extractor"""
+
+    name = 'pypdf2'
+    module = 'PyPDF2'
+
+    def iter_pages(self, stream: BinaryIO) -> Iterator[str]:
+        from PyPDF2 import PdfReader
+        for page in PdfReader(stream).pages:
+            yield page.extract_text() or ''
+
+
+@register_backend
+class PdfminerBackend(PDFBackend):
+    """pdfminer.six: slow but keeps reading order well on complex layouts"""
+
+    name = 'pdfminer'
+    module = 'pdfminer'
+
+    def iter_pages(self, stream: BinaryIO) -> Iterator[str]:
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+        for page_layout in extract_pages(stream):
+            yield ''.join(element.get_text() for element in page_layout
+                          if isinstance(element, LTTextContainer))
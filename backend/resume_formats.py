@@ -0,0 +1,160 @@
+"""
+Resume file formats: detection by content and direct text extraction
+
+Uploads are identified by their magic bytes, not their filename: PDFs go to
+the PDF backends, while DOCX and plain text have their text read directly,
+skipping PDF parsing. DOCX text comes straight from word/document.xml with
+a single regex pass; documents the pass cannot read (e.g. an unusual XML
+namespace prefix) fall back to a full XML parse.
+"""
+
+import codecs
+import html
+import re
+import zipfile
+from typing import BinaryIO, Optional
+from xml.etree import ElementTree
+
+PDF, DOCX, TXT = 'pdf', 'docx', 'txt'
+SUPPORTED_FORMATS = (PDF, DOCX, TXT)
+
+ZIP_MAGIC = b'PK\x03\x04'
+DOCX_BODY = 'word/document.xml'
+
+# Bytes read to identify a file; PDF headers may follow some junk
+SNIFF_SIZE = 4096
+
+# Largest document.xml inflated; guards against zip bombs
+MAX_DOCX_XML_SIZE = 64 * 1024 * 1024
+
+# Runs of text, tabs, breaks and paragraph ends in WordprocessingML. A bare
+# <w:tab/> is a tab character; tab stops (<w:tab w:val=...>) are not.
+_DOCX_TOKEN = re.compile(
+    r'<w:t(?:\s[^>]*)?>([^<]*)</w:t>|(<w:tab/>)|(<w:(?:br|cr)\b[^>]*/>|</w:p>)'
+)
+_W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+_UNSUPPORTED = {
+    b'\xd0\xcf\x11\xe0': "Legacy Word (.doc) files are not supported. Please save the resume as DOCX or PDF.",
+    b'{\\rtf': "RTF files are not supported. Please save the resume as DOCX or PDF.",
+}
+
+
+class UnsupportedFormatError(ValueError):
+    """Raised for uploads that are not a PDF, DOCX or text resume"""
+
+
+def is_docx(archive: zipfile.ZipFile) -> bool:
+    """Whether a zip archive is a Word document rather than a folder of files"""
+    names = set(archive.namelist())
+    return DOCX_BODY in names and '[Content_Types].xml' in names
+
+
+def _looks_like_text(head: bytes) -> bool:
+    """Whether the first bytes of a file read as text in a common encoding"""
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return True
+    if not head or b'\x00' in head:
+        return False
+    try:
+        head.decode('utf-8')
+        return True
+    except UnicodeDecodeError as e:
+        # A character cut off at the end of the sample is fine
+        if e.start >= len(head) - 3 and e.reason == 'unexpected end of data':
+            return True
+    # Single-byte encodings: allow only the usual whitespace controls
+    controls = sum(1 for byte in head if byte < 32 and byte not in b'\t\n\r\f')
+    return controls <= len(head) // 100
+
+
+def detect_format(stream: BinaryIO) -> str:
+    """Identify a resume file by its content; the stream position is kept
+
+    Raises UnsupportedFormatError for anything but PDF, DOCX and text.
+    """
+    start = stream.tell()
+    head = stream.read(SNIFF_SIZE)
+    try:
+        if b'%PDF-' in head[:1024]:
+            return PDF
+        if head.startswith(ZIP_MAGIC):
+            stream.seek(start)
+            try:
+                with zipfile.ZipFile(stream) as archive:
+                    if is_docx(archive):
+                        return DOCX
+            except zipfile.BadZipFile:
+                pass
+            raise UnsupportedFormatError(
+                "Zip files are not supported here. Please upload a PDF, DOCX or TXT resume."
+            )
+        for magic, message in _UNSUPPORTED.items():
+            if head.startswith(magic):
+                raise UnsupportedFormatError(message)
+        if _looks_like_text(head):
+            return TXT
+        raise UnsupportedFormatError("Unsupported file type. Please upload a PDF, DOCX or TXT resume.")
+    finally:
+        stream.seek(start)
+
+
+def docx_text(stream: BinaryIO, max_xml_size: int = MAX_DOCX_XML_SIZE) -> str:
+    """Text of a DOCX body, one line per paragraph"""
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            info = archive.getinfo(DOCX_BODY)
+            if info.file_size > max_xml_size:
+                raise ValueError(f"Document body is larger than {max_xml_size // (1024 * 1024)}MB")
+            xml = archive.read(info).decode('utf-8')
+    except (KeyError, zipfile.BadZipFile) as e:
+        raise ValueError(f"Not a valid DOCX file: {e}")
+
+    parts = []
+    for match in _DOCX_TOKEN.finditer(xml):
+        text, tab, newline = match.groups()
+        if text is not None:
+            parts.append(html.unescape(text) if '&' in text else text)
+        elif tab:
+            parts.append('\t')
+        else:
+            parts.append('\n')
+    if parts:
+        return ''.join(parts)
+    return _docx_text_from_tree(xml)
+
+
+def _docx_text_from_tree(xml: str) -> str:
+    """Slow path: walk the parsed XML, whatever the namespace prefix"""
+    try:
+        root = ElementTree.fromstring(xml)
+    except ElementTree.ParseError as e:
+        raise ValueError(f"Not a valid DOCX file: {e}")
+    parts = []
+    for element in root.iter():
+        if element.tag == f'{_W_NAMESPACE}t':
+            parts.append(element.text or '')
+        elif element.tag == f'{_W_NAMESPACE}tab' and not element.attrib:
+            parts.append('\t')
+        elif element.tag in (f'{_W_NAMESPACE}br', f'{_W_NAMESPACE}cr'):
+            parts.append('\n')
+        elif element.tag == f'{_W_NAMESPACE}p':
+            # Paragraph ends are written before the next paragraph's text
+            if parts:
+                parts.append('\n')
+    return ''.join(parts)
+
+
+def decode_text(data: bytes, max_chars: Optional[int] = None) -> str:
+    """Decode a text resume: UTF-8 or UTF-16 with a BOM, else UTF-8 or Windows-1252"""
+    if data.startswith(codecs.BOM_UTF8):
+        text = data[len(codecs.BOM_UTF8):].decode('utf-8', errors='replace')
+    elif data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        text = data.decode('utf-16', errors='replace')
+    else:
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = data.decode('cp1252', errors='replace')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text[:max_chars] if max_chars else text
@@ -0,0 +1,159 @@
+"""
+Inverted index for matching a job description against many stored resumes
+
+Keywords (from extract_keywords) and skills map to postings lists of
+resume numbers. A query only reads the postings of the job's own terms, so
+its cost follows how many resumes share those terms, not the size of the
+whole pool. Removed resumes are masked out of queries until they make up
+half the index, when the postings are rewritten without them.
+
+numpy is imported by the first search, not at startup, so indexing stored
+resumes in the background does not slow the web process's cold start.
+"""
+
+import threading
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable, List, Optional
+
+from ats import JobProfile, ResumeFeatures
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class ResumeIndex:
+    """Keyword and skill postings over a resume corpus"""
+
+    def __init__(self, structure_scorer: Callable[[Dict[str, bool]], float]):
+        # Usually ATSScorer.calculate_structure_score
+        self.structure_scorer = structure_scorer
+        # Indexed by resume number; a removed resume keeps its number, with
+        # its id set to None and its live flag cleared
+        self._ids: List[Optional[str]] = []
+        self._filenames: List[Optional[str]] = []
+        self._numbers: Dict[str, int] = {}
+        self._live = bytearray()
+        self._structure = array('d')
+        self._keywords: Dict[str, array] = {}
+        self._skills: Dict[Hashable, array] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._numbers
+
+    def add(self, resume_id: str, features: ResumeFeatures,
+            filename: Optional[str] = None) -> None:
+        """Index a resume; resumes already indexed are left as they are"""
+        structure_score = self.structure_scorer(features.sections_found)
+        with self._lock:
+            if resume_id in self._numbers:
+                return
+            number = len(self._ids)
+            self._ids.append(resume_id)
+            self._filenames.append(filename)
+            self._numbers[resume_id] = number
+            self._live.append(1)
+            self._structure.append(structure_score)
+            for keyword in set(features.keywords):
+                self._keywords.setdefault(keyword, array('I')).append(number)
+            for category, skills in features.skills.items():
+                for skill in skills:
+                    self._skills.setdefault((category, skill), array('I')).append(number)
+
+    def remove(self, resume_ids: Iterable[str]) -> int:
+        """Drop resumes from the index; returns how many were indexed"""
+        removed = 0
+        with self._lock:
+            for resume_id in resume_ids:
+                number = self._numbers.pop(resume_id, None)
+                if number is not None:
+                    self._ids[number] = None
+                    self._filenames[number] = None
+                    self._live[number] = 0
+                    removed += 1
+            if len(self._numbers) * 2 < len(self._ids):
+                self._compact()
+        return removed
+
+    def _compact(self) -> None:
+        """Renumber the indexed resumes, dropping removed ones from postings
+
+        Call with the lock held.
+        """
+        renumber = array('l', [-1]) * len(self._ids)
+        kept = [number for number, live in enumerate(self._live) if live]
+        for new_number, number in enumerate(kept):
+            renumber[number] = new_number
+        self._ids = [self._ids[number] for number in kept]
+        self._filenames = [self._filenames[number] for number in kept]
+        self._numbers = {resume_id: number for number, resume_id in enumerate(self._ids)}
+        self._live = bytearray([1]) * len(kept)
+        self._structure = array('d', (self._structure[number] for number in kept))
+        for postings in (self._keywords, self._skills):
+            for term in list(postings):
+                numbers = array('I', (renumber[number] for number in postings[term]
+                                      if renumber[number] >= 0))
+                if numbers:
+                    postings[term] = numbers
+                else:
+                    del postings[term]
+
+    def _term_counts(self, postings: Dict[Hashable, array], terms) -> "np.ndarray":
+        """How many of the given terms each resume contains"""
+        import numpy as np
+        lists = [np.frombuffer(postings[term], dtype=np.uint32)
+                 for term in terms if term in postings]
+        if not lists:
+            return np.zeros(len(self._ids), dtype=np.int64)
+        return np.bincount(np.concatenate(lists), minlength=len(self._ids))
+
+    def search(self, job_profile: JobProfile, top_k: int = 50) -> List[Dict]:
+        """Return the top_k resumes by overall score for a job profile
+
+        Scores match ATSScorer.score_features: the keyword match over the
+        job's keyword set blended 0.7/0.3 with the structure score. Only
+        resumes sharing at least one keyword with the job are candidates.
+        """
+        import numpy as np
+
+        job_skills = [(category, skill) for category, skills in job_profile.skills.items()
+                      for skill in skills]
+        job_keyword_count = len(job_profile.keyword_set)
+
+        with self._lock:
+            if not self._numbers or not job_keyword_count:
+                return []
+            keyword_counts = self._term_counts(self._keywords, job_profile.keyword_set)
+            if len(self._numbers) < len(self._ids):
+                keyword_counts *= np.frombuffer(self._live, dtype=np.uint8)
+            candidates = np.flatnonzero(keyword_counts)
+            if not len(candidates):
+                return []
+            keyword_match = keyword_counts[candidates] / job_keyword_count * 100
+            structure = np.frombuffer(self._structure, dtype=np.float64)[candidates]
+            overall = keyword_match * 0.7 + structure * 0.3
+
+            if len(candidates) > top_k:
+                best = np.argpartition(-overall, top_k - 1)[:top_k]
+            else:
+                best = np.arange(len(candidates))
+            best = best[np.argsort(-overall[best], kind='stable')]
+
+            skill_counts = self._term_counts(self._skills, job_skills)
+            results = []
+            for position in best:
+                number = int(candidates[position])
+                skill_match = (skill_counts[number] / len(job_skills) * 100) if job_skills else 0
+                results.append({
+                    "resume_id": self._ids[number],
+                    "filename": self._filenames[number],
+                    "overall_score": round(float(overall[position]), 1),
+                    "keyword_match_score": round(float(keyword_match[position]), 1),
+                    "structure_score": round(float(structure[position]), 1),
+                    "matched_keywords_count": int(keyword_counts[number]),
+                    "skill_match_percentage": round(float(skill_match), 1),
+                })
+            return results
@@ -0,0 +1,160 @@
+"""
+Persistent store of extracted resume text and features
+
+Resumes are keyed by the SHA-256 of their file content, so a resume parsed
+once can be re-scored against any job description without touching the
+PDF again. A store may be capped by age and by count; purge() drops the
+resumes past either limit.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ats import ATSScorer, ResumeFeatures
+
+
+class ResumeStore:
+    """SQLite-backed map of resume id -> filename, text and features
+
+    Resumes older than retention seconds (0 = kept forever) and, beyond
+    the max_resumes newest (0 = no limit), the oldest are removed by
+    purge().
+    """
+
+    def __init__(self, path: str, max_resumes: int = 0, retention: float = 0):
+        self.path = path
+        self.max_resumes = max_resumes
+        self.retention = retention
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS resumes ('
+                'id TEXT PRIMARY KEY, filename TEXT, version TEXT NOT NULL, '
+                'features TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS resumes_created_at ON resumes (created_at)'
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def __contains__(self, resume_id: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT 1 FROM resumes WHERE id = ?', (resume_id,)
+            ).fetchone()
+        return row is not None
+
+    def put(self, resume_id: str, features: ResumeFeatures, version: str,
+            filename: Optional[str] = None) -> None:
+        """Store or replace a resume's features"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO resumes (id, filename, version, features, created_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (resume_id, filename, version, json.dumps(features.to_dict()), time.time())
+            )
+
+    def load(self, resume_id: str, scorer: ATSScorer) -> Optional[ResumeFeatures]:
+        """Return a resume's features, or None if it is not stored
+
+        Features stored by a different scorer version are recomputed from
+        the stored text and written back.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT filename, version, features FROM resumes WHERE id = ?', (resume_id,)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        filename, version, data = row
+        features = ResumeFeatures.from_dict(json.loads(data))
+        if version != scorer.features_version:
+            features = scorer.extract_resume_features(features.text)
+            self.put(resume_id, features, scorer.features_version_for(features.taxonomy_version),
+                     filename)
+        else:
+            # Rows written before features recorded their taxonomy
+            features.taxonomy_version = scorer.taxonomy.version
+        return features
+
+    def iter_features(self, scorer: ATSScorer,
+                      batch_size: int = 500) -> Iterator[Tuple[str, Optional[str], ResumeFeatures]]:
+        """Yield (resume id, filename, features) for every stored resume
+
+        Rows are read in batches so the whole store is never in memory.
+        Stale features are recomputed from the stored text.
+        """
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    'SELECT rowid, id, filename, version, features FROM resumes '
+                    'WHERE rowid > ? ORDER BY rowid LIMIT ?', (last_rowid, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for last_rowid, resume_id, filename, version, data in rows:
+                features = ResumeFeatures.from_dict(json.loads(data))
+                if version != scorer.features_version:
+                    features = scorer.extract_resume_features(features.text)
+                else:
+                    features.taxonomy_version = scorer.taxonomy.version
+                yield resume_id, filename, features
+
+    def filename(self, resume_id: str) -> Optional[str]:
+        """Original filename of a stored resume"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT filename FROM resumes WHERE id = ?', (resume_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def purge(self) -> List[str]:
+        """Delete resumes past the age and count limits; returns their ids"""
+        if not self.retention and not self.max_resumes:
+            return []
+        with self._lock, self._connection:
+            connection = self._connection
+            resume_ids = []
+            if self.retention:
+                resume_ids += [resume_id for (resume_id,) in connection.execute(
+                    'SELECT id FROM resumes WHERE created_at < ?', (time.time() - self.retention,)
+                )]
+            if self.max_resumes:
+                # OFFSET skips the newest max_resumes rows; LIMIT -1 is all the rest
+                resume_ids += [resume_id for (resume_id,) in connection.execute(
+                    'SELECT id FROM resumes ORDER BY created_at DESC LIMIT -1 OFFSET ?',
+                    (self.max_resumes,)
+                )]
+            resume_ids = list(dict.fromkeys(resume_ids))
+            connection.executemany('DELETE FROM resumes WHERE id = ?',
+                                   [(resume_id,) for resume_id in resume_ids])
+        return resume_ids
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> Dict:
+        """Stored resume count and lookup counters"""
+        lookups = self.hits + self.misses
+        return {
+            'resumes': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,150 @@
+"""
+Optional semantic similarity scoring
+
+Catches matches that exact keyword overlap misses ("k8s" vs "kubernetes",
+"led a team" vs "leadership") by comparing sentence embeddings of the
+resume and the job description. sentence-transformers (and torch) are only
+imported when the first embedding is needed, so the feature costs nothing
+at startup when it is off.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from cache import LRUCache, text_key
+
+_SEGMENT_SPLIT = re.compile(r'(?<=[.!?;])\s+|\n+')
+
+
+def split_segments(text: str, max_segments: int = 256) -> List[str]:
+    """Split text into sentences/lines worth embedding
+
+    Segments need at least three words. Text with more than max_segments
+    of them is sampled evenly from start to end, so every part of a long
+    resume is represented and embedding cost stays bounded.
+    """
+    segments = []
+    for segment in _SEGMENT_SPLIT.split(text):
+        words = segment.split()
+        if len(words) >= 3:
+            segments.append(' '.join(words))
+    if len(segments) > max_segments:
+        segments = [segments[number * len(segments) // max_segments]
+                    for number in range(max_segments)]
+    return segments
+
+
+class EmbeddingStore:
+    """Persistent segment-hash -> embedding vectors for one model"""
+
+    def __init__(self, path: str, model_name: str):
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)'
+            )
+
+    def key(self, segment: str) -> str:
+        """Store key for a segment under this model"""
+        return hashlib.sha256(f"{self.model_name}\0{segment}".encode('utf-8')).hexdigest()
+
+    def get_many(self, segments: List[str]) -> Dict[str, np.ndarray]:
+        """Stored vectors for the segments that have one"""
+        keys = {self.key(segment): segment for segment in segments}
+        found = {}
+        key_list = list(keys)
+        for start in range(0, len(key_list), 500):
+            chunk = key_list[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            with self._lock:
+                rows = self._connection.execute(
+                    f'SELECT key, vector FROM embeddings WHERE key IN ({placeholders})', chunk
+                ).fetchall()
+            for key, vector in rows:
+                found[keys[key]] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Store vectors keyed by their segment"""
+        rows = [(self.key(segment), vector.astype(np.float32).tobytes())
+                for segment, vector in vectors.items()]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)', rows
+            )
+
+
+class SemanticScorer:
+    """Sentence-embedding similarity between a resume and a job description"""
+
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', store_path: Optional[str] = None,
+                 batch_size: int = 32, job_cache_size: int = 256, max_segments: int = 256):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        # Segments embedded per text, see split_segments
+        self.max_segments = max_segments
+        self.store = EmbeddingStore(store_path, model_name) if store_path else None
+        # Job description embeddings, reused for every resume scored against it
+        self.job_cache = LRUCache(maxsize=job_cache_size)
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The sentence-transformers model, loaded on first use (CPU only)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name, device='cpu')
+        return self._model
+
+    def embed(self, segments: List[str]) -> np.ndarray:
+        """Unit-length embeddings for segments, encoding only unseen ones"""
+        if not segments:
+            return np.zeros((0, 0), dtype=np.float32)
+        known = self.store.get_many(segments) if self.store else {}
+        missing = [segment for segment in dict.fromkeys(segments) if segment not in known]
+        if missing:
+            encoded = self.model.encode(missing, batch_size=self.batch_size,
+                                        normalize_embeddings=True, convert_to_numpy=True)
+            fresh = dict(zip(missing, encoded))
+            if self.store:
+                self.store.put_many(fresh)
+            known.update(fresh)
+        return np.vstack([known[segment] for segment in segments]).astype(np.float32)
+
+    def job_embeddings(self, job_description: str) -> np.ndarray:
+        """Embeddings of a job description's segments, cached by text hash"""
+        key = text_key(job_description)
+        embeddings = self.job_cache.get(key)
+        if embeddings is None:
+            embeddings = self.embed(split_segments(job_description, self.max_segments))
+            self.job_cache.set(key, embeddings)
+        return embeddings
+
+    def score(self, resume_text: str, job_description: str) -> Optional[float]:
+        """Similarity from 0 to 100, or None when there is nothing to compare
+
+        Each job segment is matched with its closest resume segment and the
+        cosine similarities are averaged, so the score reflects how much of
+        the job the resume covers. Text made only of short lines, such as a
+        bulleted list of skills, has no segments; None then keeps it from
+        being scored as dissimilar.
+        """
+        job = self.job_embeddings(job_description)
+        if not len(job):
+            return None
+        resume = self.embed(split_segments(resume_text, self.max_segments))
+        if not len(resume):
+            return None
+        best = (job @ resume.T).max(axis=1)
+        return float(np.clip(best, 0, 1).mean() * 100)
@@ -0,0 +1,148 @@
+"""
+Single-pass skill matcher
+Finds every skill of a skill database in one scan of the text
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Text is cut into alternating runs of word and non-word characters. A
+# regex word boundary (\b) can only sit between two runs, so a skill that
+# matches as r'\b' + re.escape(skill) + r'\b' always covers whole runs.
+# Splitting on the non-word runs (kept by the group) is quicker than
+# finding both kinds of run.
+_SEGMENT_SPLIT = re.compile(r'(\W+)')
+_WORD_CHAR = re.compile(r'\w')
+
+
+def split_segments(text: str) -> List[str]:
+    """Split text into alternating word / non-word runs"""
+    segments = _SEGMENT_SPLIT.split(text)
+    # The split leaves an empty run before a leading or after a trailing separator
+    if segments[-1] == '':
+        segments.pop()
+    if segments and segments[0] == '':
+        del segments[0]
+    return segments
+
+
+class SkillMatcher:
+    """Precompiled index over a {category: [skills]} database
+
+    Skills are looked up by the text run they start with, so matching costs
+    one set intersection with the text's runs, plus a position check where a
+    run starts a longer phrase, no matter how many skills the database
+    holds. Aliases (lowercase phrase -> skill) are matched the same way and
+    reported as the skill they stand for.
+    """
+
+    def __init__(self, skill_database: Dict[str, List[str]],
+                 aliases: Optional[Dict[str, str]] = None):
+        self.categories = list(skill_database.keys())
+        # skill -> [(category, position in category)] in database order
+        self._placements: Dict[str, List[Tuple[str, int]]] = {}
+        # skill or alias -> the skill reported when it is found
+        self._canonical: Dict[str, str] = {}
+        # first run of a skill -> distinct run counts of skills starting with it
+        self._run_counts: Dict[str, Tuple[int, ...]] = {}
+
+        run_counts: Dict[str, Set[int]] = {}
+
+        def add_phrase(phrase: str, skill: str) -> None:
+            self._canonical.setdefault(phrase, skill)
+            segments = split_segments(phrase)
+            if segments:
+                run_counts.setdefault(segments[0], set()).add(len(segments))
+
+        for category, skills_list in skill_database.items():
+            for position, skill in enumerate(skills_list):
+                placements = self._placements.setdefault(skill, [])
+                if (category, position) not in placements:
+                    placements.append((category, position))
+                add_phrase(skill, skill)
+        for alias, skill in (aliases or {}).items():
+            if skill in self._placements:
+                add_phrase(alias, skill)
+
+        self._run_counts = {first: tuple(sorted(counts)) for first, counts in run_counts.items()}
+
+        # Single-word skills and aliases match wherever their run occurs, so
+        # a set intersection finds them. Only runs that start longer phrases
+        # (or are not words) need their positions checked.
+        self._word_phrases = frozenset(
+            first for first, counts in self._run_counts.items()
+            if 1 in counts and first in self._canonical and _WORD_CHAR.match(first)
+        )
+        self._positional: Dict[str, Tuple[int, ...]] = {}
+        for first, counts in self._run_counts.items():
+            if first in self._word_phrases:
+                counts = tuple(count for count in counts if count != 1)
+            if counts:
+                self._positional[first] = counts
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of skills present in already-lowercased text"""
+        return self.find_segments(split_segments(text))
+
+    def find_segments(self, segments: List[str]) -> Set[str]:
+        """Return the set of skills present in split_segments() of lowercased text"""
+        found = set()
+        if not segments:
+            return found
+
+        canonical = self._canonical
+        present = set(segments)
+        for phrase in present.intersection(self._word_phrases):
+            found.add(canonical[phrase])
+
+        last = len(segments) - 1
+        # \b holds at the very start/end only next to a word character
+        starts_on_word = _WORD_CHAR.match(segments[0]) is not None
+        ends_on_word = _WORD_CHAR.match(segments[last]) is not None
+
+        for segment in present.intersection(self._positional):
+            counts = self._positional[segment]
+            index = -1
+            while True:
+                try:
+                    index = segments.index(segment, index + 1)
+                except ValueError:
+                    break
+                if index == 0 and not starts_on_word:
+                    continue
+                for count in counts:
+                    end = index + count - 1
+                    if end > last:
+                        break
+                    if end == last and not ends_on_word:
+                        continue
+                    candidate = segment if count == 1 else ''.join(segments[index:end + 1])
+                    skill = canonical.get(candidate)
+                    if skill is not None:
+                        found.add(skill)
+        return found
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """Return {category: [skills]} for skills found in text
+
+        Categories and skills keep database order and empty categories are
+        left out, matching a per-skill regex search over the database.
+        """
+        return self.match_segments(split_segments(text.lower()))
+
+    def match_segments(self, segments: List[str]) -> Dict[str, List[str]]:
+        """match() for text already lowercased and split, e.g. Document.segments"""
+        return self.categorize(self.find_segments(segments))
+
+    def categorize(self, skills: Iterable[str]) -> Dict[str, List[str]]:
+        """Group skills found by find()/find_segments() as match() reports them"""
+        by_category: Dict[str, List[Tuple[int, str]]] = {}
+        for skill in skills:
+            for category, position in self._placements[skill]:
+                by_category.setdefault(category, []).append((position, skill))
+
+        found_skills = {}
+        for category in self.categories:
+            if category in by_category:
+                found_skills[category] = [skill for _, skill in sorted(by_category[category])]
+        return found_skills
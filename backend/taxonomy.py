@@ -0,0 +1,171 @@
+"""
+Skill taxonomy loaded from a data file
+
+The taxonomy (skills.json by default) lists skill categories, each technical
+or soft with a learning priority and resources, plus aliases that normalize
+to a canonical skill ("k8s" -> "kubernetes"). Loading compiles it into one
+SkillMatcher. A SkillTaxonomy never changes after it is built, so replacing
+it with a reloaded one is a single reference swap.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from skill_matcher import SkillMatcher
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills.json')
+
+SKILL_TYPES = ('technical', 'soft')
+PRIORITIES = ('High', 'Medium', 'Low')
+
+# Used for categories that do not list their own resources
+DEFAULT_RESOURCES = ['Online Courses', 'Documentation']
+
+
+class TaxonomyError(ValueError):
+    """Raised when a taxonomy file is malformed"""
+
+
+class SkillTaxonomy:
+    """Skill categories, aliases and their compiled matcher"""
+
+    def __init__(self, data: Dict[str, Any], source: Optional[str] = None):
+        if not isinstance(data, dict):
+            raise TaxonomyError("Taxonomy must be a JSON object")
+        categories = data.get('categories')
+        if not isinstance(categories, list) or not categories:
+            raise TaxonomyError("Taxonomy needs a non-empty 'categories' list")
+
+        self.name = str(data.get('name', ''))
+        self.source = source
+        self.technical_skills: Dict[str, List[str]] = {}
+        self.soft_skills: Dict[str, List[str]] = {}
+        self.priorities: Dict[str, str] = {}
+        self.resources: Dict[str, List[str]] = {}
+
+        for category in categories:
+            if not isinstance(category, dict):
+                raise TaxonomyError("Each category must be a JSON object")
+            name = category.get('name')
+            skill_type = category.get('type', 'technical')
+            skills = category.get('skills')
+            if not name or not isinstance(skills, list):
+                raise TaxonomyError(f"Category {name!r} needs a name and a 'skills' list")
+            if skill_type not in SKILL_TYPES:
+                raise TaxonomyError(f"Category {name!r} has unknown type {skill_type!r}")
+            if name in self.technical_skills or name in self.soft_skills:
+                raise TaxonomyError(f"Category {name!r} is listed twice")
+            database = self.technical_skills if skill_type == 'technical' else self.soft_skills
+            database[name] = [str(skill).lower() for skill in skills]
+            priority = category.get('priority', 'Medium')
+            if priority not in PRIORITIES:
+                raise TaxonomyError(f"Category {name!r} has unknown priority {priority!r}")
+            self.priorities[name] = priority
+            self.resources[name] = list(category.get('resources') or DEFAULT_RESOURCES)
+
+        known_skills = {skill for database in (self.technical_skills, self.soft_skills)
+                        for skills in database.values() for skill in skills}
+        aliases = data.get('aliases') or {}
+        if not isinstance(aliases, dict):
+            raise TaxonomyError("'aliases' must map alias to skill")
+        self.aliases: Dict[str, str] = {}
+        for alias, skill in aliases.items():
+            alias, skill = str(alias).lower(), str(skill).lower()
+            if skill not in known_skills:
+                raise TaxonomyError(f"Alias {alias!r} points to unknown skill {skill!r}")
+            if alias in known_skills:
+                raise TaxonomyError(f"Alias {alias!r} is already a skill")
+            self.aliases[alias] = skill
+
+        self.skill_count = len(known_skills)
+        self.matcher = SkillMatcher({**self.technical_skills, **self.soft_skills}, self.aliases)
+        # Content hash, so any edit to the file invalidates derived data
+        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        self.version = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+        self.loaded_at = time.time()
+
+    @classmethod
+    def load(cls, path: str) -> "SkillTaxonomy":
+        """Read and compile a taxonomy file"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise TaxonomyError(f"Cannot load skill taxonomy {path}: {e}") from e
+        return cls(data, source=path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and identity of the taxonomy"""
+        return {
+            'name': self.name,
+            'version': self.version,
+            'source': self.source,
+            'categories': len(self.technical_skills) + len(self.soft_skills),
+            'skills': self.skill_count,
+            'aliases': len(self.aliases),
+            'loaded_at': self.loaded_at,
+        }
+
+
+# Compiled taxonomies by path with the file signature they were built from.
+# Loaded once per process and shared by every scorer; forked pool workers
+# inherit them without recompiling.
+_loaded: Dict[str, Tuple[Tuple[int, int, int], SkillTaxonomy]] = {}
+_lock = threading.Lock()
+
+
+def _signature(path: str) -> Tuple[int, int, int]:
+    """Changes whenever the file is edited or replaced"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def load_taxonomy(path: str = DEFAULT_TAXONOMY_PATH, force: bool = False) -> SkillTaxonomy:
+    """Return the taxonomy in a file, recompiling only when the file changed
+
+    If a changed file fails to load, the previously loaded taxonomy stays in
+    use and the error is raised only when there is nothing to fall back on.
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        cached = _loaded.get(path)
+        try:
+            signature = _signature(path)
+        except OSError as e:
+            if cached is not None and not force:
+                return cached[1]
+            raise TaxonomyError(f"Cannot load skill taxonomy {path}: {e}") from e
+        if cached is not None and cached[0] == signature and not force:
+            return cached[1]
+        try:
+            taxonomy = SkillTaxonomy.load(path)
+        except TaxonomyError:
+            if cached is not None and not force:
+                # Keep the working taxonomy; retry once the file changes again
+                _loaded[path] = (signature, cached[1])
+                return cached[1]
+            raise
+        _loaded[path] = (signature, taxonomy)
+        return taxonomy
+
+
+def install_taxonomy_file(path: str, content: bytes) -> None:
+    """Validate new taxonomy content and atomically replace the file with it
+
+    Processes watching the file pick it up on their next check.
+    """
+    try:
+        data = json.loads(content)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise TaxonomyError(f"Taxonomy is not valid JSON: {e}") from e
+    SkillTaxonomy(data)
+
+    path = os.path.abspath(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
@@ -0,0 +1,9 @@
+"""
+Test setup: backend modules import each other by plain name, as they do
+when the server runs from backend/
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
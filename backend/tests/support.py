@@ -0,0 +1,136 @@
+"""
+Reference helpers the tests share
+
+Kept apart from the benchmarks, which have helpers much like these, so
+that tuning a benchmark cannot change what the tests check.
+"""
+
+import random
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+from ats import COMMON_SECTIONS, ATSScorer, JobProfile, ResumeFeatures
+from taxonomy import load_taxonomy
+
+_TAXONOMY = load_taxonomy()
+ALL_SKILLS = sorted({skill for database in (_TAXONOMY.technical_skills, _TAXONOMY.soft_skills)
+                     for skills in database.values() for skill in skills})
+
+DOMAIN_WORDS = [
+    'scalable', 'distributed', 'microservices', 'latency', 'throughput', 'pipelines',
+    'architecture', 'observability', 'reliability', 'security', 'compliance', 'analytics',
+    'automation', 'deployment', 'monitoring', 'performance', 'integration', 'migration',
+]
+
+FILLER_WORDS = [
+    'worked', 'with', 'team', 'across', 'company', 'delivered', 'several', 'projects',
+    'using', 'various', 'improved', 'process', 'daily', 'support', 'internal', 'users',
+    'helped', 'build', 'features', 'for', 'clients', 'managed', 'tasks', 'reports',
+]
+
+LINES_PER_PAGE = 55
+WORDS_PER_LINE = 11
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+
+
+@dataclass(frozen=True)
+class ResumeSpec:
+    """Shape of one generated resume"""
+    pages: int = 1
+    keyword_density: float = 0.2
+    skills: int = 15
+
+
+def generate_job_description(rng: random.Random, skills: int = 12, sentences: int = 12) -> str:
+    """A job description naming `skills` known skills"""
+    job_skills = rng.sample(ALL_SKILLS, skills)
+    lines = [f"Senior {rng.choice(['Backend', 'Platform', 'Data'])} Engineer", ""]
+    for number in range(sentences):
+        named = job_skills[number::sentences]
+        words = rng.sample(DOMAIN_WORDS, 4) + rng.sample(FILLER_WORDS, 4)
+        rng.shuffle(words)
+        clause = f" Experience with {', '.join(named)} is required." if named else ""
+        lines.append(f"You will {' '.join(words)}.{clause}")
+    return "\n".join(lines)
+
+
+def _line(rng: random.Random, vocabulary: List[str], density: float) -> str:
+    """One line of words, `density` of them drawn from the job vocabulary"""
+    return ' '.join(rng.choice(vocabulary) if rng.random() < density else rng.choice(FILLER_WORDS)
+                    for _ in range(WORDS_PER_LINE))
+
+
+def generate_resume_text(rng: random.Random, job_description: str,
+                         spec: ResumeSpec = ResumeSpec()) -> str:
+    """Plain text of a resume aimed at a job description"""
+    words = (word.strip('.,').lower() for word in job_description.split())
+    vocabulary = [word for word in words
+                  if len(word) > 3 and word not in ALL_SKILLS] or DOMAIN_WORDS
+    skills = rng.sample(ALL_SKILLS, spec.skills)
+
+    lines = [f"Candidate {rng.randrange(10_000):04d}",
+             f"candidate{rng.randrange(10_000)}@example.com", ""]
+    for section in rng.sample(COMMON_SECTIONS, rng.randint(4, len(COMMON_SECTIONS))):
+        lines.append(section.title())
+        if section == 'skills':
+            lines.extend(', '.join(skills[start:start + 6]) for start in range(0, len(skills), 6))
+        lines.extend(f"- {_line(rng, vocabulary, spec.keyword_density)}"
+                     for _ in range(rng.randint(3, 8)))
+        lines.append("")
+    while len(lines) < spec.pages * LINES_PER_PAGE:
+        lines.append(f"- {_line(rng, vocabulary, spec.keyword_density)}")
+    return "\n".join(lines[:spec.pages * LINES_PER_PAGE])
+
+
+def zipf_terms(rng: random.Random, count: int) -> List[str]:
+    """Draw terms with a long-tailed frequency, like real resume vocabulary"""
+    return [VOCABULARY[min(int(rng.paretovariate(1.1)) - 1, len(VOCABULARY) - 1)]
+            for _ in range(count)]
+
+
+def synthetic_resume(scorer: ATSScorer, rng: random.Random) -> ResumeFeatures:
+    """Resume features with a few hundred keywords and some skills"""
+    all_skills = [(category, skill)
+                  for database in (scorer.technical_skills, scorer.soft_skills)
+                  for category, skills in database.items() for skill in skills]
+    skills = {}
+    for category, skill in rng.sample(all_skills, rng.randint(5, 25)):
+        skills.setdefault(category, []).append(skill)
+    return ResumeFeatures(
+        text='',
+        keywords=list(dict.fromkeys(zipf_terms(rng, rng.randint(150, 500)))),
+        sections_found={section: rng.random() < 0.7 for section in scorer.common_sections},
+        formatting_issues=[],
+        skills=skills,
+    )
+
+
+def synthetic_job(scorer: ATSScorer, rng: random.Random) -> JobProfile:
+    """A job profile with about a hundred keywords"""
+    resume = synthetic_resume(scorer, rng)
+    keywords = list(dict.fromkeys(zipf_terms(rng, 120)))
+    return JobProfile(keywords=keywords, keyword_set=frozenset(keywords), skills=resume.skills)
+
+
+def regex_match(text: str, skill_database: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Per-skill regex search, as extract_skills_from_text used to do"""
+    text_lower = text.lower()
+    found_skills = {}
+    for category, skills_list in skill_database.items():
+        found = [skill for skill in skills_list
+                 if re.search(r'\b' + re.escape(skill) + r'\b', text_lower)]
+        if found:
+            found_skills[category] = found
+    return found_skills
+
+
+def synthetic_database(size: int) -> Dict[str, List[str]]:
+    """A database of `size` made-up skills spread over ten categories"""
+    database: Dict[str, List[str]] = {f'category_{i}': [] for i in range(10)}
+    for i in range(size):
+        skill = f'skill{i}' if i % 3 else f'multi word skill {i}'
+        database[f'category_{i % 10}'].append(skill)
+    database['category_0'].extend(['python', 'docker', 'leadership'])
+    return database
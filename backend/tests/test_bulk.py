@@ -0,0 +1,49 @@
+"""BulkScorer gives the scores score_features gives, cell by cell"""
+
+import random
+
+import pytest
+
+pytest.importorskip('scipy')
+
+from ats import ATSScorer
+from bulk import BulkScorer
+from support import (ResumeSpec, generate_job_description, generate_resume_text,
+                     synthetic_job, synthetic_resume)
+
+
+@pytest.fixture(scope='module')
+def scorer():
+    return ATSScorer(pdf_max_chars=0)
+
+
+def assert_matches_score_features(scorer, resumes, jobs):
+    scores = BulkScorer(scorer).score(resumes, jobs)
+    assert scores.overall.shape == (len(resumes), len(jobs))
+    for row, features in enumerate(resumes):
+        for column, job in enumerate(jobs):
+            result = scorer.score_features(features, job)
+            assert round(scores.overall[row, column], 1) == result['overall_score']
+            assert round(scores.keyword_match[row, column], 1) == result['keyword_match_score']
+            assert round(scores.skill_match[row, column], 1) == \
+                result['skill_gap_analysis']['skill_match_percentage']
+            assert round(scores.structure[row], 1) == result['structure_score']
+
+
+def test_synthetic_features(scorer):
+    rng = random.Random(11)
+    resumes = [synthetic_resume(scorer, rng) for _ in range(80)]
+    jobs = [synthetic_job(scorer, rng) for _ in range(6)]
+    assert_matches_score_features(scorer, resumes, jobs)
+
+
+def test_generated_text(scorer):
+    rng = random.Random(12)
+    descriptions = [generate_job_description(rng) for _ in range(4)]
+    resumes = [scorer.extract_resume_features(generate_resume_text(
+                   rng, rng.choice(descriptions), ResumeSpec(pages=1, keyword_density=density)))
+               for density in (0.0, 0.1, 0.3) for _ in range(5)]
+    jobs = [scorer.get_job_profile(text) for text in descriptions]
+    # A job with no skills, whose skill match is 0 rather than a division by zero
+    jobs.append(scorer.get_job_profile('Friendly people wanted to greet visitors at the front desk'))
+    assert_matches_score_features(scorer, resumes, jobs)
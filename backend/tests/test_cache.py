@@ -0,0 +1,42 @@
+"""The SQLite result cache tier stays bounded and keyed by version"""
+
+import time
+
+from cache import ResultCache, SQLiteCache
+
+
+def test_disk_tier_prunes_expired_and_oldest(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.db'), 'v1', ttl=0.05, maxsize=100)
+    for number in range(50):
+        cache.set(f'old{number}', number)
+    time.sleep(0.1)
+    for number in range(3 * SQLiteCache.PRUNE_INTERVAL + 100):
+        cache.set(f'new{number}', number)
+
+    assert len(cache) < 100 + SQLiteCache.PRUNE_INTERVAL
+    assert cache.get('new0') is None
+    assert cache.get(f'new{3 * SQLiteCache.PRUNE_INTERVAL + 99}') is not None
+    cache.close()
+
+
+
+def test_version_switch_reaches_the_disk_tier(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = ResultCache('v1', db_path=path)
+    cache.set(cache.key('resume', 'job description'), {'overall_score': 1})
+    cache.set_version('v2')
+    key = cache.key('resume', 'job description')
+    cache.set(key, {'overall_score': 2})
+    cache.close()
+
+    reopened = ResultCache('v2', db_path=path)
+    assert len(reopened.disk) == 1
+    assert reopened.get(key) == {'overall_score': 2}
+    reopened.close()
+
+
+def test_key_for_an_older_version_is_not_served(tmp_path):
+    cache = ResultCache('v2', db_path=str(tmp_path / 'cache.db'))
+    cache.set(cache.key('resume', 'job description', 'v1'), {'overall_score': 1})
+    assert cache.get(cache.key('resume', 'job description')) is None
+    cache.close()
@@ -0,0 +1,48 @@
+"""A resume whose job is cancelled while it runs is never queued again"""
+
+import time
+
+import pytest
+
+from job_queue import CANCELLED, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), lease=0.01)
+    yield queue
+    queue.close()
+
+
+def cancelled_while_running(queue):
+    job_id = queue.create('Python developer with Docker experience')
+    queue.add_item(job_id, 0, 'a.txt', b'first resume')
+    queue.add_item(job_id, 1, 'b.txt', b'second resume')
+    queue.open(job_id)
+    item = queue.claim()
+    assert queue.cancel(job_id) == CANCELLED
+    return job_id, item
+
+
+def assert_all_cancelled(queue, job_id):
+    report = queue.get(job_id)
+    assert report['status'] == CANCELLED
+    assert report['progress']['cancelled'] == 2
+    assert report['progress']['queued'] == report['progress']['running'] == 0
+    held = queue._connection.execute(
+        'SELECT COUNT(*) FROM job_items WHERE job_id = ? AND resume IS NOT NULL', (job_id,)
+    ).fetchone()[0]
+    assert held == 0
+
+
+def test_failed_attempt(queue):
+    job_id, item = cancelled_while_running(queue)
+    queue.retry(item, RuntimeError('worker died'))
+    assert_all_cancelled(queue, job_id)
+
+
+def test_expired_lease(queue):
+    job_id, _ = cancelled_while_running(queue)
+    time.sleep(0.05)
+    assert queue.claim() is None
+    assert_all_cancelled(queue, job_id)
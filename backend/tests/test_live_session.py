@@ -0,0 +1,93 @@
+"""A LiveSession scores edited text as a full analysis of that text does"""
+
+import random
+
+import pytest
+
+from ats import ATSScorer
+from live_session import LiveSession
+from support import ResumeSpec, generate_job_description, generate_resume_text
+
+# Text that is easy to count wrong line by line: table markers, special
+# characters, skills with punctuation, short lines, and line breaks inside
+# an inserted line
+_NOISE = ['|', '\t\t', '@@', '##', 'C++', '.NET', 'Node.js', 'experience', 'Education',
+          'x', '', '  ', 'machine\nlearning', 'İstanbul', '™©']
+_WORDS = ['data', 'team', 'python', 'the', 'led', 'built', 'skills']
+
+
+@pytest.fixture(scope='module')
+def scorer():
+    return ATSScorer(pdf_max_chars=0)
+
+
+def random_line(rng: random.Random, skills) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 8)):
+        roll = rng.random()
+        parts.append(rng.choice(skills) if roll < 0.3
+                     else rng.choice(_NOISE) if roll < 0.5 else rng.choice(_WORDS))
+    return rng.choice([' ', ', ', '-', '']).join(parts)
+
+
+def comparable(result):
+    """A result without what may differ when keywords tie
+
+    Live sessions list matched and missing keywords in the order the job
+    description first uses them, so only their counts are compared, along
+    with the recommendations that do not name them.
+    """
+    result = dict(result)
+    del result['top_matched_keywords'], result['top_missing_keywords']
+    result['recommendations'] = [line for line in result['recommendations']
+                                 if not line.startswith('📝')]
+    return result
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_matches_full_analysis_after_random_edits(scorer, seed):
+    rng = random.Random(seed)
+    skills = [skill for categories in (scorer.technical_skills, scorer.soft_skills)
+              for category in categories.values() for skill in category]
+    job_description = generate_job_description(rng)
+    job_profile = scorer.get_job_profile(job_description)
+    session = LiveSession(scorer, job_description,
+                          generate_resume_text(rng, job_description, ResumeSpec(pages=rng.randint(1, 3))))
+
+    for step in range(40):
+        start = rng.randint(0, len(session.lines))
+        end = rng.randint(start, min(len(session.lines), start + 3))
+        lines = [random_line(rng, skills) for _ in range(rng.randint(0, 3))]
+        assert session.apply([(start, end, lines)]) == step + 1
+
+        full = scorer.score_features(scorer.extract_resume_features(session.text), job_profile)
+        assert comparable(session.result()) == comparable(full), step
+        assert session.characters == len(session.text)
+
+
+def test_failed_update_changes_nothing(scorer):
+    job_description = generate_job_description(random.Random(0))
+    session = LiveSession(scorer, job_description, 'Skills\nPython and Docker', max_chars=100)
+    before = session.result()
+
+    with pytest.raises(ValueError):
+        session.apply([(0, 1, ['Experience']), (5, 6, ['out of range'])])
+    with pytest.raises(ValueError):
+        session.apply([(0, 1, ['Experience']), (1, 1, ['x' * 200])])
+
+    assert session.text == 'Skills\nPython and Docker'
+    assert session.revision == 0
+    assert session.result() == before
+
+
+def test_size_is_checked_before_lines_are_analysed(scorer, monkeypatch):
+    import live_session
+
+    session = LiveSession(scorer, generate_job_description(random.Random(0)), 'Skills', max_chars=50)
+
+    def fail(*args):
+        raise AssertionError('line analysed')
+
+    monkeypatch.setattr(live_session, '_Line', fail)
+    with pytest.raises(ValueError, match='longer than 50'):
+        session.apply([(0, 0, ['x' * 100])])
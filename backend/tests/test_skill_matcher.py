@@ -0,0 +1,55 @@
+"""SkillMatcher finds the same skills as a per-skill regex search"""
+
+import random
+from typing import List
+
+import pytest
+
+from ats import ATSScorer
+from skill_matcher import SkillMatcher
+from support import regex_match, synthetic_database
+
+# Punctuation around which word boundaries and multi-character skills
+# ("c++", ".net", "ci/cd") are easy to get wrong
+_NOISE = list("abc xyz.|\t\n-+#/,()@!?é İ_ ✓•*") + ['  ', 'Experience', 'SKILLS']
+
+
+def random_texts(rng: random.Random, skills: List[str], count: int) -> List[str]:
+    """Short texts of skills, their fragments and noise in random order"""
+    alphabet = _NOISE + skills + [skill.upper() for skill in skills[::7]]
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+            for _ in range(count)]
+
+
+@pytest.fixture(scope='module')
+def taxonomy_database():
+    scorer = ATSScorer()
+    return {**scorer.technical_skills, **scorer.soft_skills}
+
+
+def test_matches_regex_on_taxonomy(taxonomy_database):
+    matcher = SkillMatcher(taxonomy_database)
+    skills = [skill for category in taxonomy_database.values() for skill in category]
+    for text in random_texts(random.Random(1), skills, 2000):
+        assert matcher.match(text) == regex_match(text, taxonomy_database), text
+
+
+def test_matches_regex_on_large_database():
+    database = synthetic_database(500)
+    matcher = SkillMatcher(database)
+    rng = random.Random(2)
+    skills = rng.sample([skill for category in database.values() for skill in category], 100)
+    for text in random_texts(rng, skills, 200):
+        assert matcher.match(text) == regex_match(text, database), text
+
+
+@pytest.mark.parametrize('text', ['', ' ', '.', 'c++', '.net', 'node.js', 'c#', 'ci/cd',
+                                  'pythonic', 'Python.', 'machine\nlearning'])
+def test_matches_regex_on_edge_cases(taxonomy_database, text):
+    assert SkillMatcher(taxonomy_database).match(text) == regex_match(text, taxonomy_database)
+
+
+def test_alias_is_reported_as_its_skill():
+    matcher = SkillMatcher({'devops': ['kubernetes', 'docker']}, {'k8s': 'kubernetes'})
+    assert matcher.match('Ran K8s clusters') == {'devops': ['kubernetes']}
+    assert matcher.match('k8s and kubernetes, docker') == {'devops': ['kubernetes', 'docker']}
@@ -0,0 +1,125 @@
+"""
+Bounded worker pool that runs ATS analysis off the event loop
+"""
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class PoolSaturatedError(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+
+class AnalysisTimeoutError(Exception):
+    """Raised when an analysis does not finish within its time budget"""
+
+
+class AnalysisPool:
+    """Runs analysis tasks on an executor with a bounded queue and timeout"""
+
+    MODES = ('process', 'thread', 'inline')
+
+    def __init__(self, mode: str = 'process', max_workers: int = 1,
+                 queue_size: int = 0, timeout: Optional[float] = None,
+                 initializer: Optional[Callable] = None, initargs: Tuple = ()):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown executor mode: {mode}")
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.queue_size = max(0, queue_size)
+        self.timeout = timeout
+        # Runs once in each worker process (process mode only)
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def shares_memory(self) -> bool:
+        """Whether tasks run in this process and can be handed open files"""
+        return self.mode != 'process'
+
+    @property
+    def capacity(self) -> int:
+        """Tasks that may be running or waiting at the same time"""
+        return self.max_workers + self.queue_size
+
+    def start(self) -> None:
+        """Create the executor; call from within the running event loop"""
+        if self.mode == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=self.initializer,
+                                                 initargs=self.initargs)
+        elif self.mode == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='ats-worker')
+        self._slots = asyncio.Semaphore(self.capacity)
+
+    def shutdown(self) -> None:
+        """Stop the executor, dropping tasks that have not started yet"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool settings and free slots"""
+        return {
+            'mode': self.mode,
+            'max_workers': self.max_workers,
+            'queue_size': self.queue_size,
+            'free_slots': self._slots._value if self._slots else self.capacity,
+        }
+
+    async def warm_up(self, fn: Callable, *args: Any) -> None:
+        """Run fn(*args) once per worker ahead of the first request
+
+        In process mode this spawns every worker (running the initializer)
+        so the first requests do not pay for process start and imports.
+        Other modes share this process and only need it run once, off the
+        event loop.
+        """
+        if self.mode != 'process':
+            await asyncio.to_thread(fn, *args)
+            return
+        await asyncio.gather(*(self.run(fn, *args, wait=True)
+                               for _ in range(self.max_workers)))
+
+    @staticmethod
+    def _release(loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore) -> None:
+        """Give a slot back from whichever thread completed the task"""
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(slots.release)
+
+    async def run(self, fn: Callable, *args: Any, wait: bool = False) -> Any:
+        """Run fn(*args) on the pool
+
+        When the pool is saturated this fails fast with PoolSaturatedError,
+        or waits for a free slot if wait is True.
+        """
+        if self._slots is None:
+            raise RuntimeError("AnalysisPool.start() has not been called")
+        if self._slots.locked() and not wait:
+            raise PoolSaturatedError("All analysis workers are busy")
+        await self._slots.acquire()
+
+        if self._executor is None:
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+
+        loop = asyncio.get_running_loop()
+        slots = self._slots
+        future: Future = self._executor.submit(fn, *args)
+        # The slot is held until the task really finishes, so a task that
+        # timed out but is still running keeps counting against capacity.
+        # It goes back to the semaphore it came from, even if the pool has
+        # been restarted since.
+        future.add_done_callback(lambda _: self._release(loop, slots))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise AnalysisTimeoutError(f"Analysis exceeded {self.timeout:g} seconds")
@@ -64,14 +64,15 @@ function handleFileSelect(event) {
 function displayFileInfo(file) {
     const fileSizeMB = (file.size / (1024 * 1024)).toFixed(2);
 
-    // Validate file type
-    if (!file.name.toLowerCase().endsWith('.pdf')) {
+    // Validate file type (the server checks the content as well)
+    const allowedExtensions = ['.pdf', '.docx', '.txt'];
+    if (!allowedExtensions.some(extension => file.name.toLowerCase().endsWith(extension))) {
         fileInfo.innerHTML = `
             <div class="file-error">
                 <svg width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
                     <path fill-rule="evenodd" d="M8 15A7 7 0 108 1a7 7 0 000 14zm0-1A6 6 0 108 2a6 6 0 000 12zm1-6a1 1 0 11-2 0 1 1 0 012 0zM8 4a.905.905 0 00-.9.995l.35 3.507a.552.552 0 001.1 0l.35-3.507A.905.905 0 008 4z"/>
                 </svg>
-                Only PDF files are supported
+                Only PDF, DOCX and TXT files are supported
             </div>
         `;
         resumeFile.value = '';